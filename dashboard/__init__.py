@@ -0,0 +1,26 @@
+"""
+여객 현황 대시보드 공용 모듈
+- constants: 선박/항로/포트 매핑
+- queries: SQL 생성 (T-SQL / SQLite 방언)
+- backend: DB 백엔드 (pyodbc / 로컬 SQLite)
+- admission: 무거운 쿼리 동시 실행 제한 (FIFO 대기열, 지표)
+- keepalive: DB 깨워두기 (연결 미리 열기, 업무 시간 주기 확인)
+- breaker: DB 장애 시 빠른 실패 + 백그라운드 재접속
+- columnar: 결과 집합 → 타입 지정 컬럼 (fetchmany 묶음 변환)
+- pipeline: 조회 파이프라인 (Streamlit 없이 실행 가능)
+- inventory: PSMC 객실 현황 엔진 (항로 객실 색인 × 스케줄별 확정/블록/점유 행렬)
+- segments: TSL 구간 현황 엔진 (출발/도착 스케줄 → 구간별 점유, 출발지 × 도착지)
+- singleflight: 같은 조건 동시 조회 합치기
+- result_cache: 조회 결과 캐시 (만료 후 유예 시간 동안 이전 결과 + 백그라운드 갱신)
+- schedule_cache: 스케줄 단위 조회 캐시 (기간이 겹치는 조회는 새 스케줄만 조회)
+- disk_cache: 디스크 캐시 (SQLite, 조회 결과 2단계 + 기준 정보, 프로세스 간 공유)
+- query_log: 느린 쿼리 로그 (SQL 실행마다 JSONL, 지문/항로/소요 시간/행 수)
+- metrics: 운영 지표 (소요 시간 히스토그램, 캐시/대기열/세션 지표, Prometheus 텍스트)
+- fleet: 선단 현황 (전체 선박/항로 일괄 조회)
+- excel: 엑셀 출력 (객실/승객/생성처별 시트)
+- profiling: 화면 실행 1회 cProfile 측정 (관리자, ?profile=1&key=...)
+- app_config: 화면 공용 DB 설정/백엔드 (Streamlit)
+- grid: 가상 스크롤 테이블 컴포넌트 (객실/승객 현황)
+- result_page: 조회 결과 화면 공용 (화면 이동 링크, 엑셀 버튼)
+- theme: 디자인 시스템 CSS (theme.css → static/ 빌드 결과를 <link>로 적용)
+"""
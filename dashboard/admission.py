@@ -0,0 +1,142 @@
+"""
+무거운 DB 작업 동시 실행 제한 (프로세스 전체, DatabaseBackend.read에서 적용)
+- 쿼리 이름별 비용 등급(queries.COST_CLASSES): heavy만 제한, 나머지(기준 정보 조회 등)는 바로 실행
+- 자리가 없으면 도착 순서대로(FIFO) 대기. 세션은 쿼리를 하나씩 차례로 실행하므로 세션 사이에도 순서대로 돌아감
+- 대기 중에는 스레드별로 등록한 콜백에 순번을 알림 (화면의 대기 순번 표시)
+- stats(): 실행 중/대기 수, 최대 대기열, 대기 시간 p50/p95
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+from dashboard import queries
+
+DEFAULT_TIMEOUT = 120      # 이보다 오래 기다리면 포기 (초)
+POLL_INTERVAL = 0.5        # 대기 중 순번 확인 간격 (초)
+WAIT_SAMPLES = 1000        # 대기 시간 통계에 쓰는 최근 건수
+
+
+class AdmissionTimeoutError(Exception):
+    """DB 작업 대기 시간 초과 (화면에는 경고로 표시)"""
+
+
+class AdmissionController:
+    def __init__(self, max_concurrent, timeout=DEFAULT_TIMEOUT):
+        self.max_concurrent = max_concurrent
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._waiters = deque()
+        self._local = threading.local()
+        self.running = 0
+        self.max_queued = 0
+        self.admitted = 0
+        self.bypassed = 0
+        self.timeouts = 0
+        self._waits = deque(maxlen=WAIT_SAMPLES)
+
+    def admit(self, name):
+        """쿼리 이름의 비용 등급에 맞는 실행 구간 (with 문)"""
+        if queries.COST_CLASSES.get(name, 'light') != 'heavy':
+            with self._lock:
+                self.bypassed += 1
+            return nullcontext()
+        return self._slot()
+
+    @contextmanager
+    def _slot(self):
+        self._acquire()
+        try:
+            yield
+        finally:
+            self._release()
+
+    @contextmanager
+    def feedback(self, callback):
+        """이 스레드가 기다리는 동안 callback(순번, 대기 초) 호출 (자리를 받으면 순번 0)"""
+        self._local.callback = callback
+        try:
+            yield
+        finally:
+            self._local.callback = None
+
+    def _acquire(self):
+        started = time.perf_counter()
+        with self._lock:
+            if self.running < self.max_concurrent and not self._waiters:
+                self.running += 1
+                self._admitted(0.0)
+                return
+            event = threading.Event()
+            self._waiters.append(event)
+            self.max_queued = max(self.max_queued, len(self._waiters))
+
+        callback = getattr(self._local, 'callback', None)
+        last_position = None
+        timed_out = False
+        try:
+            while not event.wait(POLL_INTERVAL):
+                waited = time.perf_counter() - started
+                with self._lock:
+                    position = self._waiters.index(event) + 1 if event in self._waiters else 0
+                    if position and waited > self.timeout:
+                        self._waiters.remove(event)
+                        self.timeouts += 1
+                        timed_out = True
+                        break
+                if position and callback is not None and position != last_position:
+                    callback(position, waited)
+                    last_position = position
+        except BaseException:
+            # 콜백에서 스크립트 중지 등 → 대기열에서 빠지거나, 이미 받은 자리는 돌려줌
+            with self._lock:
+                if event in self._waiters:
+                    self._waiters.remove(event)
+                    raise
+            self._release()
+            raise
+
+        if timed_out:
+            raise AdmissionTimeoutError(
+                f"DB 작업이 많아 {self.timeout}초 안에 조회를 시작하지 못했습니다. 잠시 후 다시 조회하세요.")
+        with self._lock:
+            self._admitted(time.perf_counter() - started)
+        if callback is not None and last_position is not None:
+            try:
+                callback(0, time.perf_counter() - started)
+            except BaseException:
+                self._release()
+                raise
+
+    def _admitted(self, waited):
+        self.admitted += 1
+        self._waits.append(waited)
+
+    def _release(self):
+        with self._lock:
+            if self._waiters:
+                # 자리를 다음 대기자에게 바로 넘김 (running 수는 그대로)
+                self._waiters.popleft().set()
+            else:
+                self.running -= 1
+
+    def stats(self):
+        """대기열/대기 시간 지표 (대기 시간은 최근 WAIT_SAMPLES건, ms)"""
+        with self._lock:
+            waits = sorted(self._waits)
+            stats = {
+                'max_concurrent': self.max_concurrent,
+                'running': self.running,
+                'queued': len(self._waiters),
+                'max_queued': self.max_queued,
+                'admitted': self.admitted,
+                'bypassed': self.bypassed,
+                'timeouts': self.timeouts,
+            }
+
+        def percentile(p):
+            return round(waits[min(len(waits) - 1, int(len(waits) * p))] * 1000, 1) if waits else 0.0
+
+        stats.update(wait_ms_p50=percentile(0.5), wait_ms_p95=percentile(0.95), wait_ms_max=percentile(1.0))
+        return stats
@@ -0,0 +1,215 @@
+"""
+Streamlit 화면 공용 설정 (메인 화면과 pages/가 함께 사용)
+- DB 설정 로딩 (.streamlit/secrets.toml [database])
+- DB 백엔드: 프로세스당 하나 (드라이버 탐색/연결 풀을 모든 화면이 공유)
+- 같은 조건 동시 조회 합치기(single-flight): 프로세스당 하나
+- 무거운 DB 작업 대기 순번 표시 (queue_feedback)
+- 조회 결과 캐시 (stale-while-revalidate): 프로세스당 하나
+- 스케줄 단위 캐시: 프로세스당 하나 (기간이 겹치는 조회는 새 스케줄만 조회)
+- 디스크 캐시: 조회 결과 2단계 + 기준 정보 (같은 호스트의 프로세스끼리 공유, 재시작 후에도 유지)
+- 응답 기록(NEOHELIOS_DB_CAPTURE) 중에는 결과/스케줄/기준 정보 캐시를 끔 (캐시가 답한 쿼리는 기록에 남지 않아 재생할 수 없으므로)
+- DB 깨워두기(keepalive): 프로세스당 하나, 첫 화면 표시 때 시작 + 상태 표시 (db_status_badge)
+- 느린 쿼리 로그: 프로세스당 하나 (SQL 실행마다 JSONL, NEOHELIOS_QUERY_LOG=0이면 끔)
+- 운영 지표: 프로세스당 하나 (운영 지표 화면, NEOHELIOS_METRICS_PORT를 주면 /metrics HTTP도)
+"""
+
+import os
+import sqlite3
+from contextlib import contextmanager
+
+import streamlit as st
+
+from dashboard.backend import DatabaseUnavailableError, capture_dir, make_backend
+from dashboard.disk_cache import DiskCache
+from dashboard.keepalive import KeepAlive
+from dashboard.metrics import Metrics, collect_gauges, render_prometheus, serve
+from dashboard.query_log import QueryLog
+from dashboard.result_cache import ResultCache, DEFAULT_TTL, DEFAULT_GRACE
+from dashboard.schedule_cache import ScheduleCache
+from dashboard.singleflight import SingleFlight
+
+EMPTY_DB_CONFIG = {
+    'server': '',
+    'base_database': '',
+    'cruise_database': '',
+    'username': '',
+    'password': '',
+}
+
+# [database]의 선택 항목 (있는 것만 make_backend에 넘김, 같은 뜻의 환경변수가 있으면 환경변수 우선)
+OPTIONAL_DB_KEYS = (
+    'max_heavy_queries',   # NEOHELIOS_DB_MAX_HEAVY
+    'connect_timeout',     # NEOHELIOS_DB_CONNECT_TIMEOUT
+    'query_timeout',       # NEOHELIOS_DB_QUERY_TIMEOUT
+    'capture_dir',         # NEOHELIOS_DB_CAPTURE
+    'replay_dir',          # NEOHELIOS_REPLAY_DIR
+)
+
+
+def load_db_config():
+    """secrets.toml의 DB 설정 (파일/항목이 없으면 None)"""
+    try:
+        if not st.secrets.load_if_toml_exists():
+            return None
+        database = st.secrets["database"]
+        return {
+            'server': database["server"],
+            'base_database': database["base_database"],
+            'cruise_database': database["cruise_database"],
+            'username': database["username"],
+            'password': database["password"],
+            # 선택: backend = "local" 이면 local_path의 SQLite 대역 사용
+            'backend': database.get("backend", "odbc"),
+            'local_path': database.get("local_path", ""),
+            **{key: database[key] for key in OPTIONAL_DB_KEYS if key in database},
+        }
+    except Exception:
+        return None
+
+
+def capturing():
+    """DB 응답을 기록하는 중인지 (모든 쿼리가 DB까지 가야 기록이 재생 가능)"""
+    return capture_dir(load_db_config() or EMPTY_DB_CONFIG) is not None
+
+
+# DB 백엔드 (운영: pyodbc / 로컬 대역: SQLite)
+@st.cache_resource
+def get_backend():
+    backend = make_backend(load_db_config() or EMPTY_DB_CONFIG)
+    if not capturing():
+        backend.dimension_cache = get_disk_cache()
+        backend.schedule_cache = get_schedule_cache()
+    backend.metrics = get_metrics()
+    backend.query_log = get_query_log()
+    return backend
+
+
+# 디스크 캐시 (NEOHELIOS_DISK_CACHE=0이면 없음, 파일을 열 수 없어도 없이 동작)
+@st.cache_resource
+def get_disk_cache():
+    try:
+        return DiskCache.from_env()
+    except (OSError, sqlite3.Error):
+        return None
+
+
+# 느린 쿼리 로그 (파일을 열 수 없으면 없이 동작)
+@st.cache_resource
+def get_query_log():
+    try:
+        return QueryLog.from_env()
+    except OSError:
+        return None
+
+
+# 같은 조건의 동시 조회는 한 번만 실행 (모든 세션 공유)
+@st.cache_resource
+def get_query_flight():
+    return SingleFlight()
+
+
+# 조회 결과 캐시 (NEOHELIOS_RESULT_TTL=0이거나 응답 기록 중이면 저장 안 함)
+@st.cache_resource
+def get_result_cache():
+    return ResultCache(
+        ttl=0 if capturing() else int(os.environ.get('NEOHELIOS_RESULT_TTL') or DEFAULT_TTL),
+        grace=int(os.environ.get('NEOHELIOS_RESULT_GRACE') or DEFAULT_GRACE),
+        disk=get_disk_cache(),
+    )
+
+
+# 스케줄 단위 조회 캐시 (결과 캐시와 같은 ttl, NEOHELIOS_RESULT_TTL=0이면 저장 안 함)
+@st.cache_resource
+def get_schedule_cache():
+    return ScheduleCache(ttl=int(os.environ.get('NEOHELIOS_RESULT_TTL') or DEFAULT_TTL))
+
+
+@contextmanager
+def queue_feedback():
+    """with 안에서 무거운 쿼리가 대기열에 있으면 순번 표시 (자리를 받으면 지움)"""
+    admission = get_backend().admission
+    if admission is None:
+        yield
+        return
+    placeholder = st.empty()
+
+    def show(position, waited):
+        if position:
+            placeholder.info(f"⏳ 조회가 많아 대기 중입니다: {position}번째 (대기 {waited:.0f}초)")
+        else:
+            placeholder.empty()
+
+    try:
+        with admission.feedback(show):
+            yield
+    finally:
+        placeholder.empty()
+
+
+# DB 깨워두기 (백그라운드 스레드, 모든 세션 공유)
+@st.cache_resource
+def get_keepalive():
+    return KeepAlive.from_env(get_backend()).start()
+
+
+DB_STATUS_LABELS = {
+    'warm': ("#2E7D32", "● DB 준비됨"),
+    'waking': ("#B7791F", "● DB 깨우는 중 (첫 조회가 느릴 수 있습니다)"),
+    'cold': ("#EA3336", "● DB 연결 확인 실패 (다시 시도 중)"),
+    'idle': ("#88949C", "● DB 대기 상태 (첫 조회가 느릴 수 있습니다)"),
+    'down': ("#EA3336", "● DB 연결 안 됨 (자동 재접속 시도 중)"),
+}
+
+
+def db_status_badge():
+    """DB 준비 상태 한 줄 표시 (장애 감지가 우선, keepalive 비활성이면 장애일 때만 표시)"""
+    try:
+        status = get_keepalive().status()
+        breaker = get_backend().breaker
+    except DatabaseUnavailableError:
+        return  # 백엔드를 만들 수 없음 (화면의 연결 확인에서 안내)
+    if breaker is not None and breaker.state != 'closed':
+        status['state'] = 'down'
+    if status['state'] not in DB_STATUS_LABELS:
+        return
+    color, label = DB_STATUS_LABELS[status['state']]
+    if status['state'] == 'warm' and status['checked_at']:
+        label += f" · {status['checked_at']} 확인"
+    st.markdown(
+        f'<div style="text-align: right; font-size: 12px; color: {color}; margin: -20px 0 8px 0;">{label}</div>',
+        unsafe_allow_html=True,
+    )
+
+
+# 운영 지표 (조회/DB 쿼리/엑셀 소요 시간, 모든 세션 공유)
+@st.cache_resource
+def get_metrics():
+    return Metrics()
+
+
+def metric_sources():
+    """collect_gauges에 넘길 프로세스 공용 객체들"""
+    return {
+        'backend': get_backend(),
+        'result_cache': get_result_cache(),
+        'schedule_cache': get_schedule_cache(),
+        'flight': get_query_flight(),
+        'keepalive': get_keepalive(),
+    }
+
+
+def render_metrics():
+    return render_prometheus(get_metrics(), collect_gauges(**metric_sources()))
+
+
+# /metrics HTTP (NEOHELIOS_METRICS_PORT가 없거나 0이면 끔, 127.0.0.1에서만 받음)
+@st.cache_resource
+def start_metrics_endpoint():
+    port = int(os.environ.get('NEOHELIOS_METRICS_PORT') or 0)
+    if not port:
+        return None
+    metrics, sources = get_metrics(), metric_sources()
+    try:
+        return serve(port, lambda: render_prometheus(metrics, collect_gauges(**sources)))
+    except OSError:
+        return None  # 포트 사용 중 (같은 호스트의 다른 프로세스가 이미 열었음)
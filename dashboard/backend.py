@@ -0,0 +1,402 @@
+"""
+DB 백엔드
+- DatabaseBackend: base/cruise 조회 인터페이스 (쿼리별 메서드)
+- OdbcBackend: 운영 Azure SQL (pyodbc)
+- SqliteBackend: 로컬 대역 (스키마 복제본, 벤치마크/부하 테스트용)
+- 무거운 쿼리는 admission으로 동시 실행 수 제한, DB 장애 시 breaker로 빠른 실패 (make_backend에서 설정)
+- 기준 정보 쿼리는 dimension_cache(disk_cache.DiskCache)가 있으면 디스크에서 재사용 (app_config에서 설정)
+- schedule_cache(schedule_cache.ScheduleCache)는 pipeline이 스케줄 단위로 조회 결과를 재사용할 때 사용
+- metrics(metrics.Metrics)가 있으면 쿼리별 DB 소요 시간/행 수 기록 (대기열 대기 시간 제외)
+- query_log(query_log.QueryLog)가 있으면 SQL 실행마다 JSONL 기록 (느린 쿼리 분석용)
+"""
+
+import os
+import queue
+import sqlite3
+import time
+
+from dashboard import queries
+from dashboard.admission import AdmissionController
+from dashboard.metrics import ROW_BUCKETS
+
+# 무거운 쿼리(queries.COST_CLASSES) 동시 실행 수 기본값
+# cruise 연결 풀(4개) 중 하나는 가벼운 조회용으로 남김
+DEFAULT_MAX_HEAVY = 3
+
+# 운영 DB 대기 시간 기본값 (초): 로그인은 짧게 (장애 시 오래 붙잡히지 않도록), 쿼리는 긴 기간 조회 기준
+DEFAULT_CONNECT_TIMEOUT = 15
+DEFAULT_QUERY_TIMEOUT = 120
+
+# breaker가 세는 ODBC SQLSTATE: 접속 실패, 통신 링크 끊김 (언제 나든)
+LINK_SQLSTATES = ('08001', '08S01')
+# 시간 초과: 접속(로그인) 중이면 연결 오류, 쿼리 실행 중이면 쿼리 오류 (느린 쿼리로 DB를 장애 처리하지 않도록)
+TIMEOUT_SQLSTATES = ('HYT00', 'HYT01')
+
+
+class DatabaseUnavailableError(Exception):
+    """DB에 연결할 수 없음 (드라이버 없음 등)"""
+
+
+class DatabaseBackend:
+    """base(neohelios_base) / cruise(neohelios_cruise) 조회 인터페이스
+
+    하위 클래스는 dialect와 _read()만 구현하면 됨.
+    모든 조회는 read()를 거치므로 계측/기록은 여기에 붙인다.
+    """
+
+    dialect = queries.DIALECTS['tsql']
+    admission = None  # AdmissionController (None이면 제한 없음)
+    breaker = None    # CircuitBreaker (None이면 장애 감지 없음)
+    dimension_cache = None  # DiskCache (None이면 기준 정보도 매번 조회)
+    schedule_cache = None   # ScheduleCache (None이면 pipeline이 스케줄 전체를 매번 조회)
+    metrics = None          # Metrics (None이면 기록 안 함)
+    query_log = None        # QueryLog (None이면 기록 안 함)
+
+    def read(self, database, name, sql, params=()):
+        """database: 'base' | 'cruise', name: 쿼리 이름 (로그/계측/비용 등급용)"""
+        # 기준 정보는 디스크에 있으면 DB에 가지 않음 (장애 중에도 사용)
+        if self.dimension_cache is not None and name in queries.DIMENSION_QUERIES:
+            return self.dimension_cache.read_through(
+                database, name, sql, params, lambda: self._guarded_read(database, name, sql, params))
+        return self._guarded_read(database, name, sql, params)
+
+    def _guarded_read(self, database, name, sql, params):
+        # 장애 중이면 대기열에 서기 전에 바로 실패
+        if self.breaker is None:
+            return self._admitted_read(database, name, sql, params)
+        return self.breaker.call(lambda: self._admitted_read(database, name, sql, params))
+
+    def _admitted_read(self, database, name, sql, params):
+        if self.admission is None:
+            return self._timed_read(database, name, sql, params)
+        with self.admission.admit(name):
+            return self._timed_read(database, name, sql, params)
+
+    def _timed_read(self, database, name, sql, params):
+        if self.metrics is None and self.query_log is None:
+            return self._read(database, name, sql, params)
+        started = time.perf_counter()
+        try:
+            df = self._read(database, name, sql, params)
+        except Exception as e:
+            if self.metrics is not None:
+                self.metrics.inc('db_query_errors_total', query=name)
+            if self.query_log is not None:
+                self.query_log.write(database, name, sql, params, time.perf_counter() - started, error=e)
+            raise
+        duration = time.perf_counter() - started
+        if self.metrics is not None:
+            self.metrics.observe('db_query_seconds', duration, query=name)
+            self.metrics.observe('db_query_rows', len(df), buckets=ROW_BUCKETS, query=name)
+        if self.query_log is not None:
+            self.query_log.write(database, name, sql, params, duration, df=df)
+        return df
+
+    def _read(self, database, name, sql, params):
+        raise NotImplementedError
+
+    def check(self):
+        """조회 전에 알 수 있는 설정 문제 확인 (없으면 그대로 반환, 있으면 DatabaseUnavailableError)"""
+
+    def is_connection_error(self, error):
+        """접속 실패/시간 초과/끊김 등 DB에 닿지 못한 오류인지 (breaker가 셈, 쿼리 오류는 False)"""
+        return False
+
+    def keep_warm(self, database, connections=1):
+        """연결 확인 + 풀에 connections개까지 미리 열어 둠 (keepalive, 실패하면 예외)"""
+
+    def begin_request(self, filters):
+        """조회 1건 시작 알림 (기록용 백엔드가 검색 조건을 남길 때, 쿼리 로그가 항로를 붙일 때 사용)"""
+        if self.query_log is not None:
+            self.query_log.begin_request(filters)
+
+    def end_request(self):
+        """조회 1건 끝 (이 스레드의 이후 쿼리는 조회 밖)"""
+        if self.query_log is not None:
+            self.query_log.end_request()
+
+    def close(self):
+        pass
+
+    # ---------- neohelios_base ----------
+
+    def fetch_vessels(self):
+        return self.read('base', 'vessels', *queries.vessels_query(self.dialect))
+
+    def fetch_routes(self):
+        return self.read('base', 'routes', *queries.routes_query(self.dialect))
+
+    def fetch_schedules(self, route_id, start_date, end_date, direction=None):
+        return self.read('base', 'schedules', *queries.schedules_query(
+            self.dialect, route_id, start_date, end_date, direction))
+
+    def fetch_fleet_schedules(self, route_ids, start_date, end_date):
+        return self.read('base', 'fleet_schedules', *queries.fleet_schedules_query(
+            self.dialect, route_ids, start_date, end_date))
+
+    # ---------- neohelios_cruise ----------
+
+    def fetch_total_rooms(self, route_ids):
+        return self.read('cruise', 'total_rooms', *queries.total_rooms_query(self.dialect, route_ids))
+
+    def fetch_fleet_total_rooms(self, route_ids):
+        return self.read('cruise', 'fleet_total_rooms', *queries.fleet_total_rooms_query(self.dialect, route_ids))
+
+    def fetch_route_rooms(self, route_ids):
+        return self.read('cruise', 'route_rooms', *queries.route_rooms_query(self.dialect, route_ids))
+
+    def fetch_bookings(self, schedule_ids, is_seat_based, arrival_schedule_ids=None):
+        return self.read('cruise', 'bookings', *queries.bookings_query(
+            self.dialect, schedule_ids, is_seat_based, arrival_schedule_ids))
+
+    def fetch_passenger_counts(self, schedule_ids, is_seat_based, arrival_schedule_ids=None):
+        return self.read('cruise', 'passenger_counts', *queries.passenger_counts_query(
+            self.dialect, schedule_ids, is_seat_based, arrival_schedule_ids))
+
+    def fetch_room_details(self, schedule_ids, is_seat_based, arrival_schedule_ids=None):
+        return self.read('cruise', 'room_details', *queries.room_details_query(
+            self.dialect, schedule_ids, is_seat_based, arrival_schedule_ids))
+
+    def fetch_vacant_rooms(self, schedule_ids, route_ids):
+        return self.read('cruise', 'vacant_rooms', *queries.vacant_rooms_query(
+            self.dialect, schedule_ids, route_ids))
+
+    def fetch_passenger_analysis(self, schedule_ids, arrival_schedule_ids=None):
+        return self.read('cruise', 'passenger_analysis', *queries.passenger_analysis_query(
+            self.dialect, schedule_ids, arrival_schedule_ids))
+
+
+class OdbcBackend(DatabaseBackend):
+    """운영 Azure SQL (pyodbc)
+
+    드라이버는 설치된 목록에서 한 번만 고르고, 연결은 DB별 풀에서 재사용한다.
+    """
+
+    # 여러 드라이버 버전 자동 시도 (앞쪽 우선)
+    drivers_to_try = [
+        "ODBC Driver 18 for SQL Server",
+        "ODBC Driver 17 for SQL Server",
+        "ODBC Driver 13 for SQL Server",
+        "SQL Server Native Client 11.0",
+        "SQL Server",
+    ]
+
+    def __init__(self, config, pool_size=4, connect_timeout=DEFAULT_CONNECT_TIMEOUT,
+                 query_timeout=DEFAULT_QUERY_TIMEOUT):
+        self.config = config
+        self.pool_size = pool_size
+        self.connect_timeout = connect_timeout
+        self.query_timeout = query_timeout
+        self._driver = None
+        self._pools = {'base': queue.LifoQueue(), 'cruise': queue.LifoQueue()}
+
+    @property
+    def driver(self):
+        if self._driver is None:
+            import pyodbc
+            installed = pyodbc.drivers()
+            for d in self.drivers_to_try:
+                if d in installed:
+                    self._driver = d
+                    break
+            else:
+                raise DatabaseUnavailableError("SQL Server ODBC 드라이버를 찾을 수 없습니다.")
+        return self._driver
+
+    def check(self):
+        self.driver
+
+    def connection_string(self, database):
+        db_name = self.config['base_database'] if database == 'base' else self.config['cruise_database']
+        return (
+            f"Driver={{{self.driver}}};"
+            f"Server={self.config['server']};"
+            f"Database={db_name};"
+            f"UID={self.config['username']};"
+            f"PWD={self.config['password']};"
+        )
+
+    def _connect(self, database):
+        import pyodbc
+        # timeout: 로그인 대기 (초), conn.timeout: 쿼리 실행 대기 (초, 0이면 무제한)
+        try:
+            conn = pyodbc.connect(self.connection_string(database), timeout=self.connect_timeout)
+        except pyodbc.Error as e:
+            e.during_connect = True   # is_connection_error: 로그인 시간 초과 구분
+            raise
+        conn.timeout = self.query_timeout
+        return conn
+
+    def is_connection_error(self, error):
+        import pyodbc
+        if not isinstance(error, pyodbc.Error):
+            return False
+        sqlstate = error.args[0] if error.args else None
+        if sqlstate in LINK_SQLSTATES:
+            return True
+        return sqlstate in TIMEOUT_SQLSTATES and getattr(error, 'during_connect', False)
+
+    def _checkout(self, database):
+        try:
+            return self._pools[database].get_nowait()
+        except queue.Empty:
+            return self._connect(database)
+
+    def _checkin(self, database, conn):
+        if self._pools[database].qsize() < self.pool_size:
+            self._pools[database].put(conn)
+        else:
+            conn.close()
+
+    def keep_warm(self, database, connections=1):
+        # 풀의 연결을 모두 꺼내 확인 → 끊긴 연결은 버리고 모자란 만큼 새로 연결
+        pool = self._pools[database]
+        idle = []
+        while True:
+            try:
+                idle.append(pool.get_nowait())
+            except queue.Empty:
+                break
+        alive = []
+        try:
+            for conn in idle:
+                try:
+                    conn.execute("SELECT 1").fetchone()
+                    alive.append(conn)
+                except Exception:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+            while len(alive) < min(connections, self.pool_size):
+                conn = self._connect(database)
+                try:
+                    conn.execute("SELECT 1").fetchone()
+                except Exception:
+                    conn.close()
+                    raise
+                alive.append(conn)
+        finally:
+            for conn in alive:
+                self._checkin(database, conn)
+
+    def _read(self, database, name, sql, params):
+        from dashboard.columnar import read_typed  # pandas는 첫 조회 때 import (첫 화면 표시에는 불필요)
+        conn = self._checkout(database)
+        try:
+            cursor = conn.cursor()
+            try:
+                df = read_typed(cursor, sql, params, queries.SCHEMAS.get(name))
+            finally:
+                cursor.close()
+        except Exception:
+            # 끊긴 연결일 수 있으므로 풀에 돌려놓지 않음
+            try:
+                conn.close()
+            except Exception:
+                pass
+            raise
+        self._checkin(database, conn)
+        return df
+
+    def close(self):
+        for pool in self._pools.values():
+            while not pool.empty():
+                try:
+                    pool.get_nowait().close()
+                except Exception:
+                    pass
+
+
+class SqliteBackend(DatabaseBackend):
+    """로컬 대역: base/cruise 테이블을 하나의 SQLite 파일에 복제
+
+    스키마와 시드 데이터는 dashboard.local_db 참고.
+    """
+
+    dialect = queries.DIALECTS['sqlite']
+
+    def __init__(self, path):
+        if not os.path.exists(path):
+            raise DatabaseUnavailableError(f"로컬 DB 파일이 없습니다: {path}")
+        self.path = path
+
+    def is_connection_error(self, error):
+        # sqlite3는 문법 오류도 OperationalError → 파일 접근 오류만
+        message = str(error)
+        return isinstance(error, sqlite3.OperationalError) and (
+            'unable to open' in message or 'locked' in message or 'disk I/O' in message)
+
+    def keep_warm(self, database, connections=1):
+        conn = sqlite3.connect(self.path)
+        try:
+            conn.execute("SELECT 1").fetchone()
+        finally:
+            conn.close()
+
+    def _read(self, database, name, sql, params):
+        from dashboard.columnar import read_typed
+        conn = sqlite3.connect(self.path)
+        try:
+            return read_typed(conn.cursor(), sql, params, queries.SCHEMAS.get(name))
+        finally:
+            conn.close()
+
+
+def make_backend(config):
+    """설정에 맞는 백엔드 생성
+
+    config['backend']가 'local'이면 config['local_path']의 SQLite 대역 사용.
+    'replay'면 NEOHELIOS_REPLAY_DIR의 기록을 재생 (NEOHELIOS_REPLAY_LATENCY=1이면 지연 재현).
+    NEOHELIOS_DB_CAPTURE=<디렉터리>가 있으면 모든 응답을 기록.
+    무거운 쿼리 동시 실행 수는 NEOHELIOS_DB_MAX_HEAVY (기본 DEFAULT_MAX_HEAVY, 0이면 제한 없음).
+    운영 DB 대기 시간은 NEOHELIOS_DB_CONNECT_TIMEOUT / NEOHELIOS_DB_QUERY_TIMEOUT (초).
+    연결 오류가 NEOHELIOS_DB_BREAKER_FAILURES번 이어지면 NEOHELIOS_DB_BREAKER_RETRY초마다 백그라운드 재접속.
+    환경변수가 없으면 config의 같은 항목(secrets.toml [database]: backend, local_path, replay_dir, capture_dir,
+    max_heavy_queries, connect_timeout, query_timeout), 둘 다 있으면 환경변수가 우선.
+    """
+    from dashboard.replay import RecordingBackend, ReplayBackend
+
+    kind = os.environ.get('NEOHELIOS_DB_BACKEND') or config.get('backend', 'odbc')
+    if kind == 'replay':
+        return with_guards(ReplayBackend(
+            os.environ.get('NEOHELIOS_REPLAY_DIR') or config.get('replay_dir', ''),
+            inject_latency=os.environ.get('NEOHELIOS_REPLAY_LATENCY') == '1',
+        ), config)
+    if kind == 'local':
+        path = os.environ.get('NEOHELIOS_LOCAL_DB') or config.get('local_path') or 'local_data/neohelios_local.db'
+        backend = SqliteBackend(path)
+    else:
+        backend = OdbcBackend(
+            config,
+            connect_timeout=int(os.environ.get('NEOHELIOS_DB_CONNECT_TIMEOUT') or config.get('connect_timeout') or DEFAULT_CONNECT_TIMEOUT),
+            query_timeout=int(os.environ.get('NEOHELIOS_DB_QUERY_TIMEOUT') or config.get('query_timeout') or DEFAULT_QUERY_TIMEOUT),
+        )
+
+    capture_path = capture_dir(config)
+    if capture_path:
+        backend = RecordingBackend(backend, capture_path)
+    return with_guards(backend, config)
+
+
+def capture_dir(config):
+    """응답 기록 디렉터리 (NEOHELIOS_DB_CAPTURE 또는 config['capture_dir'], 기록하지 않으면 None)"""
+    return os.environ.get('NEOHELIOS_DB_CAPTURE') or config.get('capture_dir') or None
+
+
+def with_guards(backend, config):
+    """가장 바깥 백엔드에 동시 실행 제한 + 장애 감지 적용 (기록/재생 백엔드도 한 번만 적용되도록)"""
+    from dashboard.breaker import CircuitBreaker, DEFAULT_FAILURES, DEFAULT_RETRY_INTERVAL
+
+    # 0(제한 없음)도 설정값이므로 없는 경우(None)만 기본값
+    max_heavy = os.environ.get('NEOHELIOS_DB_MAX_HEAVY') or config.get('max_heavy_queries')
+    max_heavy = int(DEFAULT_MAX_HEAVY if max_heavy is None else max_heavy)
+    if max_heavy > 0:
+        backend.admission = AdmissionController(max_heavy)
+    backend.breaker = CircuitBreaker(
+        backend.is_connection_error,
+        probe=lambda: backend.keep_warm('base', 1),
+        failures=int(os.environ.get('NEOHELIOS_DB_BREAKER_FAILURES') or DEFAULT_FAILURES),
+        retry_interval=int(os.environ.get('NEOHELIOS_DB_BREAKER_RETRY') or DEFAULT_RETRY_INTERVAL),
+    )
+    return backend
@@ -0,0 +1,90 @@
+"""
+DB 연결 장애 시 빠른 실패 (circuit breaker)
+- closed: 정상. 연결 오류(접속 실패, 로그인 시간 초과, 끊김)가 연속 failures번이면 open
+- open: 모든 조회를 기다리지 않고 바로 CircuitOpenError → 장애 중에도 화면은 즉시 응답
+- half_open: 백그라운드 스레드가 retry_interval마다 probe()로 재접속 시도하는 중. 성공하면 closed
+- 쿼리 오류(문법, 데이터, 쿼리 시간 초과)는 연결 오류가 아니므로 세지 않음 (백엔드의 is_connection_error로 판단)
+"""
+
+import threading
+import time
+from datetime import datetime
+
+from dashboard.backend import DatabaseUnavailableError
+from dashboard.keepalive import KST
+
+DEFAULT_FAILURES = 3
+DEFAULT_RETRY_INTERVAL = 30  # 초
+
+
+class CircuitOpenError(DatabaseUnavailableError):
+    """DB 장애로 조회를 시도하지 않음 (백그라운드에서 재접속 시도 중)"""
+
+
+class CircuitBreaker:
+    def __init__(self, is_failure, probe, failures=DEFAULT_FAILURES, retry_interval=DEFAULT_RETRY_INTERVAL):
+        self.is_failure = is_failure
+        self.probe = probe
+        self.failures = failures
+        self.retry_interval = retry_interval
+        self.state = 'closed'
+        self.consecutive = 0
+        self.opened_at = None
+        self.last_error = None
+        self.trips = 0
+        self._lock = threading.Lock()
+
+    def call(self, fn):
+        if self.state != 'closed':
+            raise CircuitOpenError(self.message())
+        try:
+            result = fn()
+        except Exception as e:
+            if self.is_failure(e):
+                self._record_failure(e)
+            raise
+        if self.consecutive:
+            with self._lock:
+                self.consecutive = 0
+        return result
+
+    def _record_failure(self, error):
+        with self._lock:
+            self.consecutive += 1
+            self.last_error = str(error)
+            if self.state != 'closed' or self.consecutive < self.failures:
+                return
+            self.state = 'open'
+            self.opened_at = datetime.now(KST)
+            self.trips += 1
+        threading.Thread(target=self._retry, name='neohelios-breaker', daemon=True).start()
+
+    def _retry(self):
+        while True:
+            time.sleep(self.retry_interval)
+            self.state = 'half_open'
+            try:
+                self.probe()
+            except Exception as e:
+                with self._lock:
+                    self.state = 'open'
+                    self.last_error = str(e)
+                continue
+            with self._lock:
+                self.state = 'closed'
+                self.consecutive = 0
+                self.opened_at = None
+            return
+
+    def message(self):
+        since = self.opened_at.strftime('%H:%M') if self.opened_at else '-'
+        return f"DB에 연결할 수 없습니다 ({since}부터, {self.retry_interval}초마다 자동 재접속 시도 중)"
+
+    def stats(self):
+        return {
+            'state': self.state,
+            'consecutive_failures': self.consecutive,
+            'opened_at': self.opened_at.strftime('%H:%M:%S') if self.opened_at else None,
+            'trips': self.trips,
+            'last_error': self.last_error,
+        }
@@ -0,0 +1,67 @@
+"""
+DataFrame 직렬화 (Arrow IPC, 컬럼 단위 압축)
+- DB 응답 기록/재생, 디스크 캐시 등 결과 프레임을 파일로 남길 때 사용
+- 값 종류가 적은 문자열 컬럼(포트/등급/상태/국적 등)은 사전(dictionary) 인코딩 후 zstd
+  → 읽을 때 원래 문자열 컬럼으로 되돌림 (category로 바뀌지 않음)
+- 읽기는 받은 바이트 버퍼를 복사 없이 열고, 숫자 컬럼은 가능하면 그대로 pandas로 넘김
+"""
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.ipc
+
+DICTIONARY_KEY = b'neohelios.dictionary'   # 사전 인코딩한 컬럼 이름 (스키마 메타데이터, 탭 구분)
+DICTIONARY_MAX_RATIO = 0.5                 # 서로 다른 값이 행 수의 이 비율 이하인 문자열 컬럼만 인코딩
+DICTIONARY_MIN_ROWS = 256                  # 이보다 짧은 프레임은 사전이 오히려 더 큼
+
+
+def dictionary_encode(table):
+    """값 종류가 적은 문자열 컬럼 → 사전 인코딩 (인코딩한 컬럼 이름은 메타데이터에 기록)"""
+    if table.num_rows < DICTIONARY_MIN_ROWS:
+        return table
+    columns = []
+    encoded = []
+    for field, column in zip(table.schema, table.columns):
+        if (pa.types.is_string(field.type)
+                and pc.count_distinct(column).as_py() <= len(column) * DICTIONARY_MAX_RATIO):
+            column = column.dictionary_encode()
+            encoded.append(field.name)
+        columns.append(column)
+    if not encoded:
+        return table
+    metadata = dict(table.schema.metadata or {})
+    metadata[DICTIONARY_KEY] = '\t'.join(encoded).encode('utf-8')
+    return pa.Table.from_arrays(columns, names=table.column_names).replace_schema_metadata(metadata)
+
+
+def dictionary_decode(table):
+    """dictionary_encode로 인코딩한 컬럼을 원래 문자열로 (원래 category였던 컬럼은 그대로)"""
+    encoded = (table.schema.metadata or {}).get(DICTIONARY_KEY)
+    if not encoded:
+        return table
+    for name in encoded.decode('utf-8').split('\t'):
+        i = table.schema.get_field_index(name)
+        table = table.set_column(i, name, table.column(i).cast(pa.string()))
+    return table
+
+
+def encode_frame(df, compression='zstd', dictionary=True):
+    """DataFrame → Arrow IPC 바이트 (인덱스는 저장하지 않음)"""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if dictionary:
+        table = dictionary_encode(table)
+    sink = pa.BufferOutputStream()
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def decode_frame(data):
+    """Arrow IPC 바이트 → DataFrame
+
+    split_blocks: 컬럼별 블록으로 받아 null 없는 숫자 컬럼은 복사하지 않음 (pandas 블록 합치기 생략)
+    """
+    with pa.ipc.open_stream(pa.py_buffer(data)) as reader:
+        table = dictionary_decode(reader.read_all())
+    return table.to_pandas(split_blocks=True, self_destruct=True)
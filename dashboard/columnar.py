@@ -0,0 +1,86 @@
+"""
+결과 집합 → 타입 지정 컬럼 (쿼리별 스키마, queries.SCHEMAS)
+- DB-API 커서(pyodbc / sqlite3)에서 fetchmany로 큰 묶음씩 받아 묶음마다 컬럼별 배열로 변환
+- pd.read_sql은 행 튜플 → object 컬럼 → dtype 추론을 거치므로,
+  스키마가 있는 쿼리는 추론 없이 int64 / Int64 / datetime64 / category로 바로 만든다
+- 스키마에 없는 컬럼은 pandas 추론 (기존 동작)
+
+스키마 종류:
+    int       int64 (NULL 없음)
+    nint      Int64 (NULL 가능, LEFT JOIN 결과 등)
+    float     float64
+    str       object 문자열
+    category  범주형 (값 종류가 적은 문자열)
+    datetime  datetime64 (드라이버 datetime 객체 또는 ISO 문자열, 범위 밖 값은 NaT)
+"""
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+BATCH_SIZE = 20000
+
+EMPTY_DTYPES = {
+    'int': 'int64',
+    'nint': 'Int64',
+    'float': 'float64',
+    'str': 'object',
+    'category': 'category',
+    'datetime': 'datetime64[ns]',
+}
+
+
+def convert_column(values, kind):
+    """한 묶음의 컬럼 값(tuple) → 타입 지정 Series"""
+    if kind == 'int':
+        return pd.Series(np.fromiter(values, dtype=np.int64, count=len(values)))
+    if kind == 'nint':
+        return pd.Series(pd.array(values, dtype='Int64'))
+    if kind == 'float':
+        return pd.Series(np.array(values, dtype=np.float64))
+    if kind == 'str':
+        return pd.Series(np.array(values, dtype=object))
+    if kind == 'category':
+        return pd.Series(pd.Categorical(values))
+    if kind == 'datetime':
+        # SQLite는 ISO 문자열, pyodbc는 datetime/date 객체
+        # 범위 밖 값(생년월일 자리표시자 0001-01-01 등)은 NaT (한 행 때문에 조회 전체가 실패하지 않도록)
+        sample = next((v for v in values if v is not None), None)
+        if isinstance(sample, str):
+            return pd.Series(pd.to_datetime(values, format='ISO8601', errors='coerce'))
+        return pd.Series(pd.to_datetime(values, errors='coerce'))
+    return pd.Series(list(values))
+
+
+def _concat(parts, kind):
+    if len(parts) == 1:
+        return parts[0]
+    if kind == 'category':
+        return pd.Series(union_categoricals([p.array for p in parts]))
+    return pd.concat(parts, ignore_index=True)
+
+
+def read_typed(cursor, sql, params=(), schema=None, batch_size=BATCH_SIZE):
+    """sql 실행 → DataFrame (schema: {컬럼: 종류}, 없으면 전부 추론)"""
+    schema = schema or {}
+    cursor.execute(sql, list(params))
+    names = [d[0] for d in cursor.description]
+    kinds = [schema.get(name) for name in names]
+    parts = [[] for _ in names]
+
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        # 묶음 단위로 행 → 열 전치 후 바로 타입 변환 (행 객체는 묶음이 끝나면 버려짐)
+        for i, values in enumerate(zip(*rows)):
+            parts[i].append(convert_column(values, kinds[i]))
+        del rows
+
+    columns = {}
+    for name, kind, column_parts in zip(names, kinds, parts):
+        if column_parts:
+            columns[name] = _concat(column_parts, kind)
+        else:
+            columns[name] = pd.Series([], dtype=EMPTY_DTYPES.get(kind, 'object'))
+    return pd.DataFrame(columns)
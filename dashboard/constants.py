@@ -0,0 +1,105 @@
+"""
+선박/항로/포트 매핑 상수
+- 앱 화면과 조회 파이프라인, 로컬 DB 시드가 함께 사용
+"""
+
+# 선박별 항로 매핑
+vessel_routes = {
+    'PSMC': ['BOC', 'ONC', 'KSC'],           # 크루즈선
+    'PSTL': ['TSL'],                          # 고속선 (대마도)
+    'PSGR': ['EAS', 'SCC', 'FWC', 'SND', 'NFW']  # 여객선
+}
+
+# 항로 코드 → route_id
+route_map = {
+    'BOC': 1, 'ONC': 2, 'KSC': 3, 'TSL': 5,
+    'EAS': 7, 'SCC': 8, 'FWC': 9, 'SND': 10, 'NFW': 11
+}
+
+# 항로별 포트 매핑
+route_ports = {
+    # PSMC 항로
+    'BOC': ['전체', 'PUS', 'OSA'],           # 부산-오사카
+    'ONC': ['전체', 'PUS'],                   # 부산 주말 크루즈 (왕복)
+    'KSC': ['전체', 'PUS'],                   # 한국해협 크루즈 (왕복)
+    # PSTL 항로
+    'TSL': ['전체', 'PUS', 'IZH', 'HTK'],    # 대마도 (부산-이즈하라-히타카츠)
+    # PSGR 항로 (모두 부산 출도착)
+    'EAS': ['전체', 'PUS'],                   # 동해
+    'SCC': ['전체', 'PUS'],                   # 속초
+    'FWC': ['전체', 'PUS'],                   # 불꽃크루즈
+    'SND': ['전체', 'PUS'],                   # 선상디너
+    'NFW': ['전체', 'PUS']                    # 야간불꽃
+}
+
+# TSL port_id 매핑 (proforma_schedules.port_id)
+TSL_PORT_IDS = {
+    'PUS': 1777,   # KRPUS - Busan
+    'IZH': 1633,   # JPIZH - Izuhara
+    'HTK': 3271    # JPHTK - Hitakatsu
+}
+
+# TSL 방향별 기항 순서 (구간 = 이웃한 두 포트, 구간마다 스케줄 하나)
+TSL_PORT_ORDER = {
+    'E': ['PUS', 'IZH', 'HTK'],
+    'W': ['HTK', 'IZH', 'PUS'],
+}
+
+# port_id → 포트 코드 역방향 매핑
+PORT_CODE_MAP = {v: k for k, v in TSL_PORT_IDS.items()}
+# PSMC용 추가 포트
+PORT_CODE_MAP.update({
+    1777: 'PUS',    # 부산
+    1633: 'IZH',    # 이즈하라
+    3271: 'HTK',    # 히타카츠
+    1693: 'OSA',    # 오사카 (JPOSA)
+    1746: 'FUK',    # 후쿠오카
+})
+
+# 출발지/도착지에 따른 direction 결정용 매핑
+route_direction_map = {
+    'BOC': {'first': 'PUS', 'second': 'OSA'},
+    'ONC': {'first': 'PUS', 'second': 'PUS'},
+    'KSC': {'first': 'PUS', 'second': 'PUS'},
+    'TSL': {'first': 'PUS', 'second': 'IZH'},
+    'EAS': {'first': 'PUS', 'second': 'PUS'},  # 부산 출도착
+    'SCC': {'first': 'PUS', 'second': 'PUS'},  # 부산 출도착
+    'FWC': {'first': 'PUS', 'second': 'PUS'},  # 부산 출도착 (불꽃크루즈)
+    'SND': {'first': 'PUS', 'second': 'PUS'},  # 부산 출도착 (선상디너)
+    'NFW': {'first': 'PUS', 'second': 'PUS'},  # 부산 출도착 (야간불꽃)
+}
+
+# 좌석 기반 선박 (1객실 = 1승객)
+seat_based_vessels = ['PSTL', 'PSGR']
+
+# 등급 순서 (선박별로 다름)
+# PSMC (route 1-4): OR, PR, RS, BS, OC, IC, DA
+# PSTL (route 5): PRM, ECM
+# PSGR (route 6-11): FC, BUS, STA
+vessel_grade_order = {
+    'PSMC': ['총계', 'OR', 'PR', 'RS', 'BS', 'OC', 'IC', 'DA'],
+    'PSTL': ['총계', 'PRM', 'ECM'],
+    'PSGR': ['총계', 'FC', 'BUS', 'STA'],
+}
+
+# 등급별 정원 정의 (OR,BS,PR=2명, RS=3명, IC,OC,DA=4명, GR=8명)
+grade_capacity = {
+    'OR': 2, 'BS': 2, 'PR': 2, 'RS': 3,
+    'IC': 4, 'OC': 4, 'DA': 4,
+    'GR': 8,
+    'PRM': 1, 'ECM': 1,  # PSTL 좌석
+    'FC': 1, 'BUS': 1, 'STA': 1  # PSGR 좌석
+}
+
+weekday_ko = {
+    'Monday': '월', 'Tuesday': '화', 'Wednesday': '수',
+    'Thursday': '목', 'Friday': '금', 'Saturday': '토', 'Sunday': '일'
+}
+
+
+def vessel_for_route(route_code):
+    """항로 코드가 속한 선박 코드 (없으면 None)"""
+    for vessel, routes in vessel_routes.items():
+        if route_code in routes:
+            return vessel
+    return None
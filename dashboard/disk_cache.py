@@ -0,0 +1,199 @@
+"""
+디스크 캐시 (SQLite 파일 하나, 같은 호스트의 모든 앱 프로세스가 공유)
+- 조회 결과: ResultCache의 2단계 저장소. 재시작/재배포 뒤에도 바로 이전 결과를 보여줌
+- 기준 정보(전체 객실 수 등, queries.DIMENSION_QUERIES): DatabaseBackend.read에서 dimension_ttl 동안 재사용
+- 키: 조회 조건(flight_key) 또는 (DB, 쿼리 이름, SQL, 파라미터)의 해시
+- 프레임은 Arrow IPC(사전 인코딩+zstd, codec), 나머지 값은 pickle+zlib
+  (레코드 목록 room_details도 pickle: Arrow로 더 작아지지만 dict 목록으로 되돌리는 시간이 더 큼)
+- 쓰기는 트랜잭션 하나 (중간에 죽어도 반쯤 쓴 항목은 남지 않음), WAL이라 읽기는 막히지 않음
+- 읽기는 파일을 메모리 매핑 (PRAGMA mmap_size)
+- 전체 크기가 max_bytes를 넘으면 오래 안 읽은 것부터 삭제
+
+설정 (환경변수):
+    NEOHELIOS_DISK_CACHE=<파일 경로>     기본 local_data/result_cache.db, 0이면 비활성
+    NEOHELIOS_DISK_CACHE_MB=512          최대 크기
+    NEOHELIOS_DIMENSION_TTL=3600         기준 정보 재사용 시간 (초)
+"""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+from datetime import datetime
+
+from dashboard.keepalive import KST
+
+DEFAULT_PATH = 'local_data/result_cache.db'
+DEFAULT_MAX_MB = 512
+DEFAULT_DIMENSION_TTL = 3600
+FORMAT_VERSION = 3          # 저장 형식이 바뀌면 올림 (이전 항목은 키가 달라져 자연히 밀려남)
+BUSY_TIMEOUT_MS = 5000      # 다른 프로세스가 쓰는 중이면 기다리는 시간
+MMAP_BYTES = 256 * 1024 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    payload BLOB NOT NULL
+)
+"""
+
+
+def fingerprint(*parts):
+    """조회 조건 → 저장 키 (repr 기준: 날짜/튜플/문자열로 된 조건은 프로세스가 달라도 같은 값)"""
+    return hashlib.sha256(repr((FORMAT_VERSION,) + parts).encode('utf-8')).hexdigest()
+
+
+def encode_result(result):
+    """결과 dict → 바이트 (DataFrame 값은 Arrow, 나머지는 pickle)"""
+    import pandas as pd
+
+    from dashboard.codec import encode_frame
+
+    frames = {k: encode_frame(v) for k, v in result.items() if isinstance(v, pd.DataFrame)}
+    values = {k: v for k, v in result.items() if k not in frames}
+    return zlib.compress(pickle.dumps((frames, values), protocol=pickle.HIGHEST_PROTOCOL), 1)
+
+
+def decode_result(data):
+    from dashboard.codec import decode_frame
+
+    frames, values = pickle.loads(zlib.decompress(data))
+    values.update({k: decode_frame(v) for k, v in frames.items()})
+    return values
+
+
+class DiskCache:
+    def __init__(self, path=DEFAULT_PATH, max_bytes=DEFAULT_MAX_MB * 1024 * 1024,
+                 dimension_ttl=DEFAULT_DIMENSION_TTL):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.dimension_ttl = dimension_ttl
+        self._local = threading.local()   # sqlite3 연결은 스레드별
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.errors = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._conn() as conn:
+            conn.execute(SCHEMA)
+
+    @classmethod
+    def from_env(cls):
+        """환경변수 설정으로 생성 (비활성이면 None)"""
+        path = os.environ.get('NEOHELIOS_DISK_CACHE') or DEFAULT_PATH
+        if path == '0':
+            return None
+        return cls(
+            path,
+            max_bytes=int(os.environ.get('NEOHELIOS_DISK_CACHE_MB') or DEFAULT_MAX_MB) * 1024 * 1024,
+            dimension_ttl=int(os.environ.get('NEOHELIOS_DIMENSION_TTL') or DEFAULT_DIMENSION_TTL),
+        )
+
+    def _conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_MS / 1000)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute(f'PRAGMA mmap_size={MMAP_BYTES}')
+            self._local.conn = conn
+        return conn
+
+    # ---------- 조회 결과 (ResultCache 2단계) ----------
+
+    def put_result(self, key, result, fetched_at):
+        self._put(fingerprint('result', key), 'result', encode_result(result), fetched_at.timestamp())
+
+    def get_result(self, key, max_age, newer_than=None):
+        """(결과, fetched_at) 또는 None (없거나 max_age초보다 오래됨, newer_than 이전 조회)"""
+        after = newer_than.timestamp() if newer_than is not None else 0
+        row = self._get(fingerprint('result', key), max_age, after)
+        if row is None:
+            return None
+        payload, fetched_at = row
+        return decode_result(payload), datetime.fromtimestamp(fetched_at, KST)
+
+    # ---------- 기준 정보 (DatabaseBackend.read) ----------
+
+    def read_through(self, database, name, sql, params, read):
+        """dimension_ttl 안에 저장된 프레임이 있으면 그대로, 없으면 read() 후 저장"""
+        from dashboard.codec import decode_frame, encode_frame
+
+        key = fingerprint('dimension', database, name, sql, tuple(params))
+        row = self._get(key, self.dimension_ttl)
+        if row is not None:
+            return decode_frame(row[0])
+        df = read()
+        self._put(key, 'dimension', encode_frame(df), time.time())
+        return df
+
+    # ---------- 저장소 ----------
+
+    def _get(self, key, max_age, after=0):
+        try:
+            conn = self._conn()
+            row = conn.execute('SELECT payload, fetched_at FROM entries WHERE key = ? AND fetched_at > ?',
+                               (key, after)).fetchone()
+            if row is None or time.time() - row[1] > max_age:
+                self.misses += 1
+                return None
+            with conn:
+                conn.execute('UPDATE entries SET accessed_at = ? WHERE key = ?', (time.time(), key))
+        except sqlite3.Error:
+            self.errors += 1  # 디스크 캐시 문제로 조회가 실패하지 않도록 (없는 것으로 봄)
+            return None
+        self.hits += 1
+        return row
+
+    def _put(self, key, kind, payload, fetched_at):
+        try:
+            conn = self._conn()
+            with conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO entries (key, kind, fetched_at, accessed_at, size, payload) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    (key, kind, fetched_at, time.time(), len(payload), payload))
+                self._evict(conn)
+        except sqlite3.Error:
+            self.errors += 1
+            return
+        self.writes += 1
+
+    def _evict(self, conn):
+        """전체 크기가 max_bytes 이하가 될 때까지 오래 안 읽은 항목 삭제 (쓰기와 같은 트랜잭션)"""
+        total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in conn.execute('SELECT key, size FROM entries ORDER BY accessed_at').fetchall():
+            conn.execute('DELETE FROM entries WHERE key = ?', (key,))
+            self.evictions += 1
+            total -= size
+            if total <= self.max_bytes:
+                return
+
+    def stats(self):
+        try:
+            rows = self._conn().execute(
+                'SELECT kind, COUNT(*), COALESCE(SUM(size), 0) FROM entries GROUP BY kind').fetchall()
+        except sqlite3.Error:
+            rows = []
+        return {
+            'entries': {kind: count for kind, count, _ in rows},
+            'bytes': sum(size for _, _, size in rows),
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'writes': self.writes,
+            'evictions': self.evictions,
+            'errors': self.errors,
+        }
@@ -0,0 +1,323 @@
+"""
+엑셀 출력 (객실 / 승객 / 생성처별 시트)
+- 조회 결과(run_query 결과 dict) → xlsx bytes
+- Streamlit 없이 실행 가능 (화면은 결과와 생성처 필터별로 한 번만 만들어 재사용)
+"""
+
+import io
+
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+from openpyxl.utils import get_column_letter
+
+from dashboard.constants import route_direction_map
+
+
+def build_workbook(result, route, origin_filter='전체'):
+    """조회 결과 → 엑셀 파일 bytes
+
+    origin_filter: 생성처별 시트에 적용할 생성처 ('전체' / '한국' / '일본', 생성처별 분석 탭 필터와 동일)
+    """
+    final_df = result['final_df']
+    passenger_final_df = result['final_df_passengers']
+    existing_grades = result['existing_grades']
+    
+    # 엑셀 워크북 생성
+    wb = Workbook()
+    
+    # 시트 1: 객실
+    ws = wb.active
+    ws.title = '객실'
+    current_col = 1
+    ws.cell(1, current_col, '날짜')
+    ws.merge_cells(start_row=1, start_column=current_col, end_row=2, end_column=current_col)
+    current_col += 1
+    ws.cell(1, current_col, '출발')
+    ws.merge_cells(start_row=1, start_column=current_col, end_row=2, end_column=current_col)
+    current_col += 1
+    ws.cell(1, current_col, '도착')
+    ws.merge_cells(start_row=1, start_column=current_col, end_row=2, end_column=current_col)
+    current_col += 1
+    for grade in existing_grades:
+        ws.cell(1, current_col, grade)
+        ws.merge_cells(start_row=1, start_column=current_col, end_row=1, end_column=current_col + 2)
+        current_col += 3
+    current_col = 4
+    for grade in existing_grades:
+        ws.cell(2, current_col, '확정')
+        ws.cell(2, current_col + 1, '블록')
+        ws.cell(2, current_col + 2, '공실')
+        current_col += 3
+    for row_idx, row in final_df.iterrows():
+        excel_row = row_idx + 3
+        current_col = 1
+        ws.cell(excel_row, current_col, row['날짜'])
+        current_col += 1
+        ws.cell(excel_row, current_col, row.get('departure_port', '-'))
+        current_col += 1
+        ws.cell(excel_row, current_col, row.get('arrival_port', '-'))
+        current_col += 1
+        for grade in existing_grades:
+            ws.cell(excel_row, current_col, int(row.get(f'{grade}_확정', 0)))
+            ws.cell(excel_row, current_col + 1, int(row.get(f'{grade}_블록', 0)))
+            ws.cell(excel_row, current_col + 2, int(row.get(f'{grade}_공실', 0)))
+            current_col += 3
+    
+    # 시트 1 스타일링
+    header_fill = PatternFill(start_color='0a0a0a', end_color='0a0a0a', fill_type='solid')
+    header_font = Font(color='FFFFFF', size=12, bold=True)
+    subheader_fill = PatternFill(start_color='f5f5f5', end_color='f5f5f5', fill_type='solid')
+    subheader_font = Font(color='6b6b6b', size=11, bold=True)
+    yellow_fill = PatternFill(start_color='fffef5', end_color='fffef5', fill_type='solid')
+    thin_border = Border(
+        left=Side(style='thin', color='e0e0e0'),
+        right=Side(style='thin', color='e0e0e0'),
+        top=Side(style='thin', color='e0e0e0'),
+        bottom=Side(style='thin', color='e0e0e0')
+    )
+    for col in range(1, ws.max_column + 1):
+        ws.cell(1, col).fill = header_fill
+        ws.cell(1, col).font = header_font
+        ws.cell(1, col).alignment = Alignment(horizontal='center', vertical='center')
+        ws.cell(1, col).border = thin_border
+        ws.cell(2, col).fill = subheader_fill
+        ws.cell(2, col).font = subheader_font
+        ws.cell(2, col).alignment = Alignment(horizontal='center', vertical='center')
+        ws.cell(2, col).border = thin_border
+    for row_idx in range(3, ws.max_row + 1):
+        current_col = 1
+        ws.cell(row_idx, current_col).alignment = Alignment(horizontal='left', vertical='center')
+        ws.cell(row_idx, current_col).border = thin_border
+        current_col += 1
+        for grade in existing_grades:
+            ws.cell(row_idx, current_col).alignment = Alignment(horizontal='center', vertical='center')
+            ws.cell(row_idx, current_col).border = thin_border
+            ws.cell(row_idx, current_col).font = Font(size=11, bold=True)
+            ws.cell(row_idx, current_col + 1).alignment = Alignment(horizontal='center', vertical='center')
+            ws.cell(row_idx, current_col + 1).border = thin_border
+            ws.cell(row_idx, current_col + 1).font = Font(color='6b6b6b', size=11)
+            ws.cell(row_idx, current_col + 2).alignment = Alignment(horizontal='center', vertical='center')
+            ws.cell(row_idx, current_col + 2).border = thin_border
+            ws.cell(row_idx, current_col + 2).fill = yellow_fill
+            ws.cell(row_idx, current_col + 2).font = Font(color='1565c0', size=11, bold=True)
+            current_col += 3
+    ws.column_dimensions['A'].width = 18
+    for col_idx in range(2, ws.max_column + 1):
+        ws.column_dimensions[get_column_letter(col_idx)].width = 10
+    ws.row_dimensions[1].height = 25
+    ws.row_dimensions[2].height = 20
+    for row_idx in range(3, ws.max_row + 1):
+        ws.row_dimensions[row_idx].height = 20
+    
+    # 시트 2: 승객
+    ws2 = wb.create_sheet(title='승객')
+    current_col = 1
+    ws2.cell(1, current_col, '날짜')
+    ws2.merge_cells(start_row=1, start_column=current_col, end_row=2, end_column=current_col)
+    current_col += 1
+    ws2.cell(1, current_col, '출발')
+    ws2.merge_cells(start_row=1, start_column=current_col, end_row=2, end_column=current_col)
+    current_col += 1
+    ws2.cell(1, current_col, '도착')
+    ws2.merge_cells(start_row=1, start_column=current_col, end_row=2, end_column=current_col)
+    current_col += 1
+    for grade in existing_grades:
+        ws2.cell(1, current_col, grade)
+        ws2.merge_cells(start_row=1, start_column=current_col, end_row=1, end_column=current_col + 2)
+        current_col += 3
+    current_col = 4
+    for grade in existing_grades:
+        ws2.cell(2, current_col, '확정')
+        ws2.cell(2, current_col + 1, '블록')
+        ws2.cell(2, current_col + 2, '잔여')
+        current_col += 3
+    for row_idx, row in passenger_final_df.iterrows():
+        excel_row = row_idx + 3
+        current_col = 1
+        ws2.cell(excel_row, current_col, row['날짜'])
+        current_col += 1
+        ws2.cell(excel_row, current_col, row.get('departure_port', '-'))
+        current_col += 1
+        ws2.cell(excel_row, current_col, row.get('arrival_port', '-'))
+        current_col += 1
+        for grade in existing_grades:
+            ws2.cell(excel_row, current_col, int(row.get(f'{grade}_확정', 0)))
+            ws2.cell(excel_row, current_col + 1, int(row.get(f'{grade}_블록', 0)))
+            ws2.cell(excel_row, current_col + 2, int(row.get(f'{grade}_잔여', 0)))
+            current_col += 3
+    for col in range(1, ws2.max_column + 1):
+        ws2.cell(1, col).fill = header_fill
+        ws2.cell(1, col).font = header_font
+        ws2.cell(1, col).alignment = Alignment(horizontal='center', vertical='center')
+        ws2.cell(1, col).border = thin_border
+        ws2.cell(2, col).fill = subheader_fill
+        ws2.cell(2, col).font = subheader_font
+        ws2.cell(2, col).alignment = Alignment(horizontal='center', vertical='center')
+        ws2.cell(2, col).border = thin_border
+    for row_idx in range(3, ws2.max_row + 1):
+        current_col = 1
+        ws2.cell(row_idx, current_col).alignment = Alignment(horizontal='left', vertical='center')
+        ws2.cell(row_idx, current_col).border = thin_border
+        current_col += 1
+        for grade in existing_grades:
+            ws2.cell(row_idx, current_col).alignment = Alignment(horizontal='center', vertical='center')
+            ws2.cell(row_idx, current_col).border = thin_border
+            ws2.cell(row_idx, current_col).font = Font(size=11, bold=True)
+            ws2.cell(row_idx, current_col + 1).alignment = Alignment(horizontal='center', vertical='center')
+            ws2.cell(row_idx, current_col + 1).border = thin_border
+            ws2.cell(row_idx, current_col + 1).font = Font(color='6b6b6b', size=11)
+            ws2.cell(row_idx, current_col + 2).alignment = Alignment(horizontal='center', vertical='center')
+            ws2.cell(row_idx, current_col + 2).border = thin_border
+            ws2.cell(row_idx, current_col + 2).fill = yellow_fill
+            ws2.cell(row_idx, current_col + 2).font = Font(color='1565c0', size=11, bold=True)
+            current_col += 3
+    ws2.column_dimensions['A'].width = 18
+    for col_idx in range(2, ws2.max_column + 1):
+        ws2.column_dimensions[get_column_letter(col_idx)].width = 10
+    ws2.row_dimensions[1].height = 25
+    ws2.row_dimensions[2].height = 20
+    for row_idx in range(3, ws2.max_row + 1):
+        ws2.row_dimensions[row_idx].height = 20
+    
+    # 시트 3: 생성처별 (국적 기준)
+    # 생성처 필터 값 가져오기 (탭 필터와 동일하게 적용)
+    excel_origin_filter = origin_filter
+    sheet_title = '생성처별' if excel_origin_filter == '전체' else f'생성처별_{excel_origin_filter}'
+    ws3 = wb.create_sheet(title=sheet_title)
+    df_passenger_analysis = result.get('passenger_analysis', pd.DataFrame())
+    df_schedules_excel = result.get('schedules', pd.DataFrame())
+    
+    if not df_passenger_analysis.empty:
+        # 국적 분류 함수
+        def get_nationality_group_excel(nationality):
+            if pd.isna(nationality) or not nationality:
+                return '기타 국적'
+            nat_upper = str(nationality).upper()
+            if nat_upper == 'KR':
+                return '한국 국적'
+            elif nat_upper == 'JP':
+                return '일본 국적'
+            else:
+                return '기타 국적'
+        
+        df_origin_excel = df_passenger_analysis.copy()
+        
+        # 생성처 필터 적용 (ticket_number 기반: K=한국, J=일본)
+        if 'ticket_number' in df_origin_excel.columns and excel_origin_filter != '전체':
+            if excel_origin_filter == '한국':
+                df_origin_excel = df_origin_excel[df_origin_excel['ticket_number'].str.startswith('K', na=False)].copy()
+            elif excel_origin_filter == '일본':
+                df_origin_excel = df_origin_excel[df_origin_excel['ticket_number'].str.startswith('J', na=False)].copy()
+        df_origin_excel['nationality_group'] = df_origin_excel['nationality'].apply(get_nationality_group_excel)
+        
+        # 도착 포트 계산 - direction 기반으로 통일
+        route_ports_info = route_direction_map.get(route, {'first': '-', 'second': '-'})
+        first_port_excel = route_ports_info.get('first', '-')
+        second_port_excel = route_ports_info.get('second', '-')
+        
+        if not df_schedules_excel.empty and 'direction' in df_schedules_excel.columns:
+            schedule_direction_map_excel = df_schedules_excel.set_index('schedule_id')['direction'].to_dict()
+            df_origin_excel['direction'] = df_origin_excel['schedule_id'].map(schedule_direction_map_excel)
+            
+            df_origin_excel['arrival_port'] = df_origin_excel['direction'].apply(
+                lambda d: second_port_excel if d == 'E' else (first_port_excel if d == 'W' else '-')
+            )
+        else:
+            df_origin_excel['arrival_port'] = '-'
+        
+        # 스케줄+도착포트별 국적 집계
+        if 'arrival_port' in df_origin_excel.columns:
+            origin_summary_excel = df_origin_excel.groupby(['schedule_id', 'arrival_port', 'nationality_group']).size().unstack(fill_value=0).reset_index()
+        else:
+            origin_summary_excel = df_origin_excel.groupby(['schedule_id', 'nationality_group']).size().unstack(fill_value=0).reset_index()
+            origin_summary_excel['arrival_port'] = '-'
+        
+        for col in ['한국 국적', '일본 국적', '기타 국적']:
+            if col not in origin_summary_excel.columns:
+                origin_summary_excel[col] = 0
+        
+        # 스케줄 정보 병합
+        if not df_schedules_excel.empty:
+            schedule_cols_excel = ['schedule_id', 'date', 'time_display', 'departure_port']
+            available_cols_excel = [c for c in schedule_cols_excel if c in df_schedules_excel.columns]
+            schedule_info_excel = df_schedules_excel[available_cols_excel].drop_duplicates()
+            origin_summary_excel = origin_summary_excel.merge(schedule_info_excel, on='schedule_id', how='left')
+            
+            if 'date' in origin_summary_excel.columns:
+                origin_summary_excel['date_display'] = pd.to_datetime(origin_summary_excel['date']).dt.strftime('%m-%d')
+                weekday_map = {0: '월', 1: '화', 2: '수', 3: '목', 4: '금', 5: '토', 6: '일'}
+                origin_summary_excel['weekday'] = pd.to_datetime(origin_summary_excel['date']).dt.dayofweek.map(weekday_map)
+            
+            origin_summary_excel['총계'] = origin_summary_excel['한국 국적'] + origin_summary_excel['일본 국적'] + origin_summary_excel['기타 국적']
+            
+            if 'date' in origin_summary_excel.columns and 'time_display' in origin_summary_excel.columns:
+                origin_summary_excel = origin_summary_excel.sort_values(['date', 'time_display', 'arrival_port'])
+        
+        # 헤더
+        ws3.cell(1, 1, '날짜')
+        ws3.cell(1, 2, '출발')
+        ws3.cell(1, 3, '도착')
+        ws3.cell(1, 4, '한국 국적')
+        ws3.cell(1, 5, '일본 국적')
+        ws3.cell(1, 6, '기타 국적')
+        ws3.cell(1, 7, '총계')
+        
+        for col in range(1, 8):
+            ws3.cell(1, col).fill = header_fill
+            ws3.cell(1, col).font = header_font
+            ws3.cell(1, col).alignment = Alignment(horizontal='center', vertical='center')
+            ws3.cell(1, col).border = thin_border
+        
+        # 데이터
+        for row_idx, row in origin_summary_excel.iterrows():
+            excel_row = row_idx + 2
+            time_str = row.get('time_display', '') or ''
+            date_str = f"{row.get('date_display', '')} {time_str} ({row.get('weekday', '')})"
+            dep_port = row.get('departure_port', '-') or '-'
+            arr_port = row.get('arrival_port', '-') or '-'
+            
+            ws3.cell(excel_row, 1, date_str)
+            ws3.cell(excel_row, 2, dep_port)
+            ws3.cell(excel_row, 3, arr_port)
+            ws3.cell(excel_row, 4, int(row.get('한국 국적', 0)))
+            ws3.cell(excel_row, 5, int(row.get('일본 국적', 0)))
+            ws3.cell(excel_row, 6, int(row.get('기타 국적', 0)))
+            ws3.cell(excel_row, 7, int(row.get('총계', 0)))
+            
+            for col in range(1, 8):
+                ws3.cell(excel_row, col).alignment = Alignment(horizontal='center', vertical='center')
+                ws3.cell(excel_row, col).border = thin_border
+            
+            # 한국: 파란색, 일본: 빨간색
+            ws3.cell(excel_row, 4).font = Font(color='436CFC', bold=True)
+            ws3.cell(excel_row, 5).font = Font(color='EA3336', bold=True)
+            ws3.cell(excel_row, 7).font = Font(bold=True)
+        
+        # 합계 row 추가
+        total_row = len(origin_summary_excel) + 2
+        ws3.cell(total_row, 1, '합계')
+        ws3.merge_cells(start_row=total_row, start_column=1, end_row=total_row, end_column=3)
+        ws3.cell(total_row, 4, int(origin_summary_excel['한국 국적'].sum()))
+        ws3.cell(total_row, 5, int(origin_summary_excel['일본 국적'].sum()))
+        ws3.cell(total_row, 6, int(origin_summary_excel['기타 국적'].sum()))
+        ws3.cell(total_row, 7, int(origin_summary_excel['총계'].sum()))
+        
+        for col in range(1, 8):
+            ws3.cell(total_row, col).fill = header_fill
+            ws3.cell(total_row, col).font = Font(color='FFFFFF', bold=True)
+            ws3.cell(total_row, col).alignment = Alignment(horizontal='center', vertical='center')
+            ws3.cell(total_row, col).border = thin_border
+        
+        ws3.column_dimensions['A'].width = 22
+        ws3.column_dimensions['B'].width = 10
+        ws3.column_dimensions['C'].width = 10
+        ws3.column_dimensions['D'].width = 10
+        ws3.column_dimensions['E'].width = 10
+        ws3.column_dimensions['F'].width = 10
+        ws3.column_dimensions['G'].width = 10
+        ws3.row_dimensions[1].height = 25
+    
+    output = io.BytesIO()
+    wb.save(output)
+    return output.getvalue()
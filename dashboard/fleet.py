@@ -0,0 +1,127 @@
+"""
+선단 현황 (전체 선박/항로를 한 번에 조회)
+- 항로별 조회(조회 버튼 9번) 대신 route_map 전체를 IN 절로 묶어 쿼리 6개로 처리
+  스케줄 1 + 전체 객실 수 1 + 예약/승객 각 2 (객실 기반/좌석 기반 규칙이 달라 두 묶음)
+- 결과: 편(스케줄)별 행 + 선박/항로별 KPI 요약
+- 화면에서는 run_fleet_cached: 조회 결과 캐시 + 같은 기간 동시 조회 합치기 (위젯 재실행마다 쿼리 6개를 다시 보내지 않음)
+"""
+
+import pandas as pd
+
+from dashboard.constants import (
+    vessel_routes, route_map, seat_based_vessels, grade_capacity,
+    PORT_CODE_MAP, weekday_ko, vessel_for_route,
+)
+from dashboard.pipeline import NoScheduleError
+
+# route_id → 항로 코드
+ROUTE_CODES = {route_id: code for code, route_id in route_map.items()}
+
+COUNT_COLUMNS = [
+    'total_rooms', 'confirmed_rooms', 'blocked_rooms', 'vacant_rooms',
+    'total_capacity', 'confirmed_passengers', 'blocked_passengers',
+]
+
+
+def run_fleet_overview(backend, start_date, end_date):
+    """기간 내 전체 선박/항로 편별 예약 현황"""
+    route_ids = list(route_map.values())
+
+    df_schedules = backend.fetch_fleet_schedules(route_ids, start_date, end_date)
+    if df_schedules.empty:
+        raise NoScheduleError("해당 기간에 운항 스케줄이 없습니다.")
+    df_schedules['route'] = df_schedules['route_id'].map(ROUTE_CODES)
+    df_schedules['vessel'] = df_schedules['route'].map(vessel_for_route)
+    df_schedules['is_seat_based'] = df_schedules['vessel'].isin(seat_based_vessels)
+
+    df_total_rooms = backend.fetch_fleet_total_rooms(route_ids)
+
+    # 예약/승객 집계는 schedule_id, grade 단위라 항로가 섞여도 그대로 합칠 수 있음
+    bookings, passengers = [], []
+    for is_seat_based, group in df_schedules.groupby('is_seat_based'):
+        schedule_ids = group['schedule_id'].tolist()
+        bookings.append(backend.fetch_bookings(schedule_ids, bool(is_seat_based)))
+        passengers.append(backend.fetch_passenger_counts(schedule_ids, bool(is_seat_based)))
+
+    return build_fleet(
+        df_schedules, df_total_rooms,
+        pd.concat(bookings, ignore_index=True), pd.concat(passengers, ignore_index=True),
+        start_date, end_date,
+    )
+
+
+def fleet_key(start_date, end_date):
+    """결과 캐시/동시 조회 합치기용 키 (조회 화면의 QueryFilters.flight_key와 겹치지 않도록 'fleet'로 시작)"""
+    return ('fleet', str(start_date), str(end_date))
+
+
+def run_fleet_cached(cache, flight, backend, start_date, end_date):
+    """결과 캐시(ResultCache) → 없으면 같은 기간의 동시 조회를 합쳐(SingleFlight) 조회 후 저장 → 세션용 결과
+
+    ttl이 지난 결과(stale=True)면 그대로 돌려주고 백그라운드에서 다시 조회해 캐시를 교체.
+    """
+    key = fleet_key(start_date, end_date)
+
+    def fetch():
+        return flight.do(key, lambda: run_fleet_overview(backend, start_date, end_date))[0]
+
+    result = cache.get(key, fetch)
+    if result is None:
+        result = cache.store(key, fetch())
+    return result
+
+
+def build_fleet(df_schedules, df_total_rooms, df_bookings, df_passengers, start_date, end_date):
+    """편 x 등급 격자 → 편별 합계 → 항로/선박별 요약 (공실 계산은 조회 화면과 동일)"""
+    grid = df_schedules[['schedule_id', 'route_id']].merge(df_total_rooms, on='route_id')
+    grid = grid.merge(df_bookings, on=['schedule_id', 'grade'], how='left')
+    grid = grid.merge(df_passengers, on=['schedule_id', 'grade'], how='left')
+    for col in ['confirmed_rooms', 'blocked_rooms', 'confirmed_passengers', 'blocked_passengers']:
+        grid[col] = grid[col].fillna(0).astype(int)
+    grid['vacant_rooms'] = (grid['total_rooms'] - grid['confirmed_rooms'] - grid['blocked_rooms']).clip(lower=0)
+    grid['total_capacity'] = grid['total_rooms'] * grid['grade'].map(grade_capacity).fillna(2).astype(int)
+
+    per_schedule = grid.groupby('schedule_id')[COUNT_COLUMNS].sum().reset_index()
+    sailings = df_schedules.merge(per_schedule, on='schedule_id', how='left')
+    sailings[COUNT_COLUMNS] = sailings[COUNT_COLUMNS].fillna(0).astype(int)
+
+    etd = pd.to_datetime(sailings['etd'])
+    sailings['date'] = etd.dt.date
+    sailings['weekday'] = etd.dt.day_name().map(weekday_ko)
+    sailings['time_display'] = etd.dt.strftime('%H:%M')
+    sailings['departure_port'] = sailings['departure_port_id'].map(PORT_CODE_MAP).fillna('-')
+    sailings['occupancy'] = _occupancy(sailings)
+
+    # 선박 → 항로 순서는 검색 조건 선택지(vessel_routes)와 동일하게
+    route_order = [route for routes in vessel_routes.values() for route in routes]
+    sailings['route'] = pd.Categorical(sailings['route'], categories=route_order, ordered=True)
+    sailings = sailings.sort_values(['route', 'etd']).reset_index(drop=True)
+    sailings['route'] = sailings['route'].astype(str)
+
+    routes = _summarize(sailings, ['vessel', 'route'])
+    vessels = _summarize(sailings, ['vessel'])
+
+    return {
+        'sailings': sailings,
+        'routes': routes,
+        'vessels': vessels,
+        'start_date': str(start_date),
+        'end_date': str(end_date),
+        'schedule_count': len(sailings),
+    }
+
+
+def _occupancy(df):
+    """(확정 + 블록) / 전체 객실·좌석"""
+    used = df['confirmed_rooms'] + df['blocked_rooms']
+    return (used / df['total_rooms'].where(df['total_rooms'] > 0)).fillna(0.0)
+
+
+def _summarize(sailings, keys):
+    summary = sailings.groupby(keys, sort=False).agg(
+        sailings=('schedule_id', 'count'),
+        **{col: (col, 'sum') for col in COUNT_COLUMNS},
+    ).reset_index()
+    summary['occupancy'] = _occupancy(summary)
+    summary['is_seat_based'] = summary['vessel'].isin(seat_based_vessels)
+    return summary
@@ -0,0 +1,101 @@
+"""
+가상 스크롤 테이블 컴포넌트 (객실/승객 현황)
+- 와이드 프레임을 컬럼형 배열로 보내고, 브라우저는 화면에 보이는 행만 그림
+- 날짜 열/헤더 고정, 등급별 확정/블록/공실(잔여) 묶음 헤더
+- 객실 탭: 셀 클릭 시 객실 목록 모달
+- 좌석 기반(PSTL/PSGR): 좌석 목록을 미리 보내지 않고 셀을 누르면 컴포넌트 값으로 요청
+  → 다음 실행에서 서버가 스케줄·등급·상태로 자른 한 페이지(압축한 좌석 번호)를 인자로 보냄, '더 보기'는 커서로 다음 페이지
+
+프런트엔드는 빌드 없는 정적 파일 (frontend/index.html, grid.js, grid.css).
+"""
+
+import os
+from collections import defaultdict
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+_FRONTEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'frontend')
+_grid = components.declare_component('grid', path=_FRONTEND_DIR)
+
+ROOM_LABELS = ['확정', '블록', '공실']
+PASSENGER_LABELS = ['확정', '블록', '잔여']
+
+
+def columnar(final_df, existing_grades, labels):
+    """와이드 프레임 → 컬럼형 dict
+
+    values[등급 순번 * len(labels) + 항목 순번] = 행 순서대로의 정수 배열
+    """
+    n = len(final_df)
+
+    def column(name, default):
+        if name in final_df.columns:
+            return final_df[name].fillna(default).tolist()
+        return [default] * n
+
+    values = []
+    for grade in existing_grades:
+        for label in labels:
+            col = f'{grade}_{label}'
+            values.append(final_df[col].fillna(0).astype(int).tolist() if col in final_df.columns else [0] * n)
+
+    return {
+        'dates': column('날짜', ''),
+        'schedule_ids': [int(x) for x in column('schedule_id', 0)],
+        'departure': column('departure_port', '-'),
+        'arrival': column('arrival_port', '-'),
+        'grades': list(existing_grades),
+        'labels': list(labels),
+        'values': values,
+    }
+
+
+def room_index(room_details):
+    """모달용 객실 목록: 'schedule_id|grade|status' → [room_no, ...] (조회 순서 유지)"""
+    index = defaultdict(list)
+    for room in room_details:
+        index[f"{int(room['schedule_id'])}|{room['grade']}|{room['status']}"].append(str(room['room_no']))
+    return index
+
+
+def room_grid(final_df, existing_grades, room_details, is_seat_based, key=None, seat_pages=None):
+    """객실/좌석 현황 테이블 (확정/블록/공실 셀 클릭 → 객실/좌석 모달)
+
+    좌석 기반은 seat_pages(schedule_id, grade, status, cursor) → 한 페이지 dict (inventory.RoomInventory.page 형식).
+    요청 id를 붙여 돌려주고, 브라우저는 기다리던 요청의 페이지만 모달에 붙임.
+    """
+    page = None
+    if is_seat_based:
+        details = {}
+        # 컴포넌트 값 = 좌석 목록 요청 {id, schedule_id, grade, status, cursor}
+        request = st.session_state.get(key) if key else None
+        if request and seat_pages is not None:
+            try:
+                page = seat_pages(int(request['schedule_id']), request['grade'], request['status'],
+                                  int(request.get('cursor') or 0))
+            except KeyError:
+                page = None   # 이전 조회 결과의 스케줄 요청
+            if page is not None:
+                page = {**page, 'id': request['id']}
+    else:
+        details = room_index(room_details)
+    return _grid(
+        kind='room',
+        data=columnar(final_df, existing_grades, ROOM_LABELS),
+        details=details,
+        seat_based=bool(is_seat_based),
+        page=page,
+        key=key,
+        default=None,
+    )
+
+
+def passenger_grid(final_df_passengers, existing_grades, key=None):
+    """승객 현황 테이블 (확정/블록/잔여)"""
+    return _grid(
+        kind='passenger',
+        data=columnar(final_df_passengers, existing_grades, PASSENGER_LABELS),
+        key=key,
+        default=None,
+    )
@@ -0,0 +1,276 @@
+// 가상 스크롤 테이블 (객실/승객 현황)
+// Streamlit 컴포넌트 프로토콜: componentReady 전송 → render(args) 수신 → setFrameHeight
+// args.data는 컬럼형: dates, schedule_ids, departure, arrival, grades, labels, values[등급*3+항목][행]
+// 좌석 기반: 셀 클릭 → setComponentValue(요청) → 다음 render의 args.page(같은 id)를 모달에 붙임
+(function () {
+    'use strict';
+
+    const ROW_HEIGHT = 41;        // 데이터 행 높이(px), grid.css와 일치
+    const HEADER_HEIGHT = 84;     // 헤더 2행
+    const MAX_BODY_HEIGHT = 600;  // 이보다 많은 행은 내부 스크롤
+    const MODAL_HEIGHT = 640;     // 모달이 열려 있는 동안 필요한 최소 높이
+    const OVERSCAN = 8;           // 화면 위아래로 미리 그려둘 행 수
+    const COLUMN_WIDTH = {date: 130, port: 56, value: 60};
+    const STATUS_KEYS = ['confirmed', 'blocked', 'vacant'];
+    const STATUS_KO = {confirmed: '확정', blocked: '블록', vacant: '공실'};
+
+    const root = document.getElementById('grid-root');
+    const overlay = document.getElementById('js-modal-overlay');
+    let state = null;
+    let lastRange = null;
+    let frameHeight = 0;
+    let dataJson = null;
+    let requestSeq = 0;
+
+    function send(type, payload) {
+        window.parent.postMessage(Object.assign({isStreamlitMessage: true, type: type}, payload || {}), '*');
+    }
+
+    function setFrameHeight(height) {
+        send('streamlit:setFrameHeight', {height: height});
+    }
+
+    function esc(value) {
+        return String(value == null ? '' : value)
+            .replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;').replace(/"/g, '&quot;');
+    }
+
+    function columnCount() {
+        return 3 + state.data.grades.length * state.data.labels.length;
+    }
+
+    function colgroup() {
+        const d = state.data;
+        let html = `<colgroup><col style="width:${COLUMN_WIDTH.date}px">`;
+        html += `<col style="width:${COLUMN_WIDTH.port}px"><col style="width:${COLUMN_WIDTH.port}px">`;
+        for (let i = 0; i < d.grades.length * d.labels.length; i++) {
+            html += `<col style="width:${COLUMN_WIDTH.value}px">`;
+        }
+        return html + '</colgroup>';
+    }
+
+    function header() {
+        const d = state.data;
+        const lastGrade = d.grades.length - 1;
+        let html = '<thead><tr><th rowspan="2" class="date-head">날짜</th><th rowspan="2">출발</th><th rowspan="2">도착</th>';
+        d.grades.forEach(function (grade) {
+            html += `<th colspan="${d.labels.length}" class="${grade === '총계' ? 'total' : ''}">${esc(grade)}</th>`;
+        });
+        html += '</tr><tr class="sub">';
+        d.grades.forEach(function (grade, g) {
+            d.labels.forEach(function (label, k) {
+                let cls = '';
+                if (k === d.labels.length - 1) {
+                    cls = 'sub-last' + (g === lastGrade ? ' grade-end' : '');
+                }
+                html += `<th class="${cls}">${esc(label)}</th>`;
+            });
+        });
+        return html + '</tr></thead>';
+    }
+
+    function rowHtml(i) {
+        const d = state.data;
+        const lastGrade = d.grades.length - 1;
+        const scheduleId = d.schedule_ids[i];
+        let html = `<tr class="${i % 2 === 0 ? 'row-even' : 'row-odd'}">`;
+        html += `<td class="date-cell">${esc(d.dates[i])}</td><td>${esc(d.departure[i])}</td><td>${esc(d.arrival[i])}</td>`;
+
+        d.grades.forEach(function (grade, g) {
+            // 총계는 클릭 불가, schedule_id가 없으면 불가
+            const clickableGrade = state.kind === 'room' && grade !== '총계' && scheduleId > 0;
+            for (let k = 0; k < d.labels.length; k++) {
+                const value = d.values[g * d.labels.length + k][i];
+                const cls = ['v' + k];
+                if (k === 2) {
+                    if (value === 0) cls.push('sold-out');
+                    if (g === lastGrade) cls.push('grade-end');
+                }
+                let attrs = '';
+                if (clickableGrade) {
+                    cls.push('clickable');
+                    attrs = ` data-row="${i}" data-grade="${g}" data-status="${k}" title="클릭하여 상세보기"`;
+                }
+                html += `<td class="${cls.join(' ')}"${attrs}>${value}</td>`;
+            }
+        });
+        return html + '</tr>';
+    }
+
+    function spacer(height) {
+        return height > 0 ? `<tr class="spacer"><td colspan="${columnCount()}" style="height:${height}px"></td></tr>` : '';
+    }
+
+    // 스크롤 위치에 해당하는 행 범위만 다시 그림
+    function drawRows() {
+        const n = state.data.dates.length;
+        const visible = Math.ceil(Math.max(root.clientHeight - HEADER_HEIGHT, ROW_HEIGHT) / ROW_HEIGHT);
+        const start = Math.max(0, Math.floor(root.scrollTop / ROW_HEIGHT) - OVERSCAN);
+        const end = Math.min(n, start + visible + OVERSCAN * 2);
+        if (lastRange && lastRange[0] === start && lastRange[1] === end) return;
+        lastRange = [start, end];
+
+        let html = spacer(start * ROW_HEIGHT);
+        for (let i = start; i < end; i++) html += rowHtml(i);
+        html += spacer((n - end) * ROW_HEIGHT);
+        state.tbody.innerHTML = html;
+    }
+
+    function render(args) {
+        // 좌석 페이지만 바뀐 재실행이면 테이블(스크롤 위치)은 그대로
+        const json = JSON.stringify(args.data);
+        if (state && json === dataJson) {
+            receivePage(args.page);
+            return;
+        }
+        dataJson = json;
+        state = {
+            kind: args.kind,
+            data: args.data,
+            details: args.details || {},
+            seatBased: !!args.seat_based,
+            pending: null,
+        };
+        const n = state.data.dates.length;
+        const height = HEADER_HEIGHT + Math.min(n * ROW_HEIGHT, MAX_BODY_HEIGHT) + 2;
+        root.style.height = height + 'px';
+        root.innerHTML = '<table class="grid-table">' + colgroup() + header() + '<tbody></tbody></table>';
+        state.tbody = root.querySelector('tbody');
+        lastRange = null;
+        root.scrollTop = 0;
+        drawRows();
+
+        frameHeight = height + 4;
+        if (!overlay.classList.contains('show')) setFrameHeight(frameHeight);
+    }
+
+    // ---------- 객실 모달 ----------
+
+    function showModal() {
+        overlay.classList.add('show');
+        // 행이 적어 프레임이 낮으면 모달이 잘리므로 열려 있는 동안만 늘림
+        if (frameHeight < MODAL_HEIGHT) setFrameHeight(MODAL_HEIGHT);
+    }
+
+    function openRoomModal(scheduleId, dateStr, grade, status) {
+        document.getElementById('js-modal-title').textContent = dateStr + ' | ' + grade + ' | ' + (STATUS_KO[status] || status);
+        if (state.seatBased) {
+            openSeatModal(scheduleId, grade, status);
+            return;
+        }
+        const rooms = state.details[scheduleId + '|' + grade + '|' + status] || [];
+
+        let html;
+        if (rooms.length > 0) {
+            html = '<table><tr><th>순번</th><th>객실등급</th><th>객실번호</th></tr>';
+            rooms.forEach(function (roomNo, idx) {
+                html += `<tr><td>${idx + 1}</td><td>${esc(grade)}</td><td>${esc(roomNo)}</td></tr>`;
+            });
+            html += '</table>';
+        } else {
+            html = '<p class="empty">해당 조건의 객실이 없습니다.</p>';
+        }
+        document.getElementById('js-modal-body').innerHTML = html;
+        showModal();
+    }
+
+    // ---------- 좌석 모달 (PSTL/PSGR, 서버에서 한 페이지씩) ----------
+
+    function requestSeats(cursor) {
+        const p = state.pending;
+        p.id = Date.now() + '-' + (++requestSeq);
+        p.loading = true;
+        send('streamlit:setComponentValue', {
+            value: {id: p.id, schedule_id: p.scheduleId, grade: p.grade, status: p.status, cursor: cursor},
+            dataType: 'json',
+        });
+        drawSeats();
+    }
+
+    function openSeatModal(scheduleId, grade, status) {
+        state.pending = {scheduleId: scheduleId, grade: grade, status: status, groups: [], count: 0,
+                         total: null, cursor: null, note: null, error: null};
+        requestSeats(0);
+        showModal();
+    }
+
+    function receivePage(page) {
+        const p = state && state.pending;
+        if (!p || !page || page.id !== p.id) return;   // 기다리던 요청의 페이지만
+        p.loading = false;
+        if (page.error) {
+            p.error = page.error;
+        } else {
+            p.groups = p.groups.concat(page.seats);
+            p.count += page.count;
+            p.total = page.total;
+            p.cursor = page.cursor;
+            p.note = page.note;
+        }
+        drawSeats();
+    }
+
+    // 좌석 번호는 [앞부분, 끝자리 구간, 좌석 수] 묶음 (ECM-12 | A-D | 4)
+    function drawSeats() {
+        const p = state.pending;
+        let html = '';
+        if (p.total !== null) {
+            html += `<p class="seat-summary">${p.total}석 중 ${p.count}석 표시</p>`;
+        }
+        if (p.note) html += `<p class="seat-note">${esc(p.note)}</p>`;
+        if (p.groups.length > 0) {
+            html += '<table><tr><th>순번</th><th>좌석등급</th><th>좌석번호</th><th>좌석 수</th></tr>';
+            p.groups.forEach(function (group, idx) {
+                const seats = group[0] + (group[0] && group[1] ? ' ' : '') + group[1].replace(/-/g, '~').replace(/,/g, ', ');
+                html += `<tr><td>${idx + 1}</td><td>${esc(p.grade)}</td><td>${esc(seats)}</td><td>${group[2]}</td></tr>`;
+            });
+            html += '</table>';
+        } else if (p.total === 0) {
+            html += '<p class="empty">해당 조건의 좌석이 없습니다.</p>';
+        }
+        if (p.error) {
+            html += `<p class="empty">${esc(p.error)}</p>`;
+        } else if (p.loading) {
+            html += '<p class="empty">불러오는 중...</p>';
+        } else if (p.cursor !== null) {
+            html += `<button class="seat-more" data-cursor="${p.cursor}">더 보기</button>`;
+        }
+        document.getElementById('js-modal-body').innerHTML = html;
+    }
+
+    function closeRoomModal() {
+        overlay.classList.remove('show');
+        if (state) state.pending = null;
+        setFrameHeight(frameHeight);
+    }
+
+    root.addEventListener('scroll', function () {
+        window.requestAnimationFrame(drawRows);
+    });
+
+    root.addEventListener('click', function (event) {
+        const cell = event.target.closest('td.clickable');
+        if (!cell || !state) return;
+        const d = state.data;
+        const i = Number(cell.dataset.row);
+        openRoomModal(d.schedule_ids[i], d.dates[i], d.grades[Number(cell.dataset.grade)], STATUS_KEYS[Number(cell.dataset.status)]);
+    });
+
+    overlay.addEventListener('click', function (event) {
+        if (event.target === overlay) {
+            closeRoomModal();
+            return;
+        }
+        const more = event.target.closest('button.seat-more');
+        if (more && state && state.pending && !state.pending.loading) requestSeats(Number(more.dataset.cursor));
+    });
+    document.getElementById('js-modal-close').addEventListener('click', closeRoomModal);
+    document.addEventListener('keydown', function (event) {
+        if (event.key === 'Escape' && overlay.classList.contains('show')) closeRoomModal();
+    });
+
+    window.addEventListener('message', function (event) {
+        if (event.data && event.data.type === 'streamlit:render') render(event.data.args);
+    });
+    send('streamlit:componentReady', {apiVersion: 1});
+})();
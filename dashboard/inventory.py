@@ -0,0 +1,207 @@
+"""
+PSMC 객실 현황 엔진 (객실 기반 선박)
+- 항로의 전체 객실을 한 번 색인 (등급, 객실 번호 순서 = 열 번호)
+- 스케줄(행)별 확정/블록/점유 객실을 NumPy 불리언 행렬로 보관
+- 등급별 확정/블록 객실 수, 공실 목록, 모달용 객실 목록은 행렬 연산으로 계산
+  → 예약 현황(bookings)/공실(vacant_rooms) SQL 없이 객실 상세(room_details) 한 번으로 해결
+- 여러 편 공실 검색(availability): 고른 편들의 공실 행을 AND/합산 → 모든 편 공실 객실, 공실 편 수 순위
+- PSTL/PSGR 좌석 목록(page): 스케줄·등급·상태로 잘라 한 페이지씩 (다음 페이지는 커서 = 열 번호)
+- 1년치 스케줄(수백 행) × 객실 수백 개도 수 ms
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+STATUSES = ('confirmed', 'blocked', 'vacant')
+SEAT_PAGE_SIZE = 100   # 좌석 목록 한 페이지의 좌석 수
+
+# 좌석 번호 = 앞부분 + 끝자리(숫자 또는 알파벳 한 글자): ECM-12A → ('ECM-12', 'A'), 1001 → ('', '1001')
+_SEAT_TAIL = re.compile(r'^(.*?)(\d+|[A-Za-z])$')
+
+
+def _room_keys(grades, room_nos):
+    return pd.Index(grades.astype(str) + '\x1f' + room_nos.astype(str))
+
+
+def encode_seats(seats):
+    """좌석 번호 목록 → [[앞부분, 끝자리 구간, 좌석 수], ...] (목록 순서 유지)
+
+    앞부분이 같고 끝자리가 이어지면 구간으로 묶음:
+    ECM-12A, ECM-12B, ECM-12C, ECM-12D → ['ECM-12', 'A-D', 4], 1001~1024, 1030 → ['', '1001-1024,1030', 25]
+    """
+    groups = []
+    for seat in seats:
+        seat = str(seat)
+        match = _SEAT_TAIL.match(seat)
+        stem, tail = match.groups() if match else (seat, '')
+        value = int(tail) if tail.isdigit() else (ord(tail) if tail else None)
+        if groups and groups[-1][0] == stem:
+            runs = groups[-1][1]
+            last = runs[-1]
+            if value is not None and last[2] is not None and value == last[2] + 1 \
+                    and tail.isdigit() == last[1].isdigit():
+                last[1], last[2] = tail, value
+            else:
+                runs.append([tail, tail, value])
+            groups[-1][2] += 1
+        else:
+            groups.append([stem, [[tail, tail, value]], 1])
+    return [
+        [stem, ','.join(first if first == last else f'{first}-{last}' for first, last, _ in runs), count]
+        for stem, runs, count in groups
+    ]
+
+
+class RoomInventory:
+    def __init__(self, df_rooms, schedule_ids):
+        """df_rooms: 항로 객실 목록 (grade, room_no), schedule_ids: 행 순서 (오름차순으로 정렬)"""
+        rooms = df_rooms[['grade', 'room_no']].drop_duplicates().sort_values(['grade', 'room_no'])
+        self.grades = rooms['grade'].to_numpy(dtype=object)
+        self.room_nos = rooms['room_no'].to_numpy(dtype=object)
+        self._keys = _room_keys(rooms['grade'], rooms['room_no'])
+        # 항로 객실 목록에 없는 객실(삭제된 등급 등)은 뒤에 붙이고 공실 계산에서는 제외
+        self.in_route = np.ones(len(rooms), dtype=bool)
+        self.schedule_ids = np.array(sorted(schedule_ids), dtype=np.int64)
+        shape = (len(self.schedule_ids), len(rooms))
+        self.confirmed = np.zeros(shape, dtype=bool)
+        self.blocked = np.zeros(shape, dtype=bool)
+        self.occupied = np.zeros(shape, dtype=bool)   # 티켓이 있는 객실 (확정/블록 외 상태 포함)
+
+    @classmethod
+    def build(cls, df_rooms, df_room_details, schedule_ids):
+        """항로 객실 목록 + 객실 상세(schedule_id, grade, room_no, status) → 엔진"""
+        inventory = cls(df_rooms, schedule_ids)
+        inventory.add_details(df_room_details)
+        return inventory
+
+    @classmethod
+    def from_records(cls, room_details, schedule_ids):
+        """조회 결과의 room_details 레코드(확정/블록/공실) → 엔진 (DB 조회 없음)
+
+        PSMC 결과는 편마다 모든 객실이 확정/블록/공실 중 하나로 들어 있으므로 레코드의 객실 전체가 항로 객실 색인.
+        """
+        df = pd.DataFrame(room_details, columns=['schedule_id', 'grade', 'room_no', 'status'])
+        inventory = cls(df[['grade', 'room_no']], schedule_ids)
+        inventory.add_details(df[df['status'] != 'vacant'])
+        return inventory
+
+    def add_details(self, df_room_details):
+        if df_room_details.empty:
+            return
+        columns = self._columns(df_room_details['grade'], df_room_details['room_no'])
+        rows = np.searchsorted(self.schedule_ids, df_room_details['schedule_id'].to_numpy(dtype=np.int64))
+        status = df_room_details['status'].astype(object).to_numpy()
+        self.occupied[rows, columns] = True
+        confirmed = status == 'confirmed'
+        self.confirmed[rows[confirmed], columns[confirmed]] = True
+        blocked = status == 'blocked'
+        self.blocked[rows[blocked], columns[blocked]] = True
+
+    def _columns(self, grades, room_nos):
+        """(등급, 객실 번호) → 열 번호 (색인에 없는 객실은 열을 새로 추가)"""
+        keys = _room_keys(grades, room_nos)
+        columns = self._keys.get_indexer(keys)
+        unknown = columns < 0
+        if unknown.any():
+            extra = pd.Index(keys[unknown]).unique()
+            self._keys = self._keys.append(extra)
+            self.grades = np.concatenate([self.grades, np.array([k.split('\x1f')[0] for k in extra], dtype=object)])
+            self.room_nos = np.concatenate([self.room_nos, np.array([k.split('\x1f')[1] for k in extra], dtype=object)])
+            self.in_route = np.concatenate([self.in_route, np.zeros(len(extra), dtype=bool)])
+            pad = ((0, 0), (0, len(extra)))
+            self.confirmed = np.pad(self.confirmed, pad)
+            self.blocked = np.pad(self.blocked, pad)
+            self.occupied = np.pad(self.occupied, pad)
+            columns = self._keys.get_indexer(keys)
+        return columns
+
+    # ---------- 조회 ----------
+
+    def vacant(self):
+        """공실 행렬 (항로 객실 중 티켓이 없는 객실)"""
+        return ~self.occupied & self.in_route
+
+    def mask(self, status):
+        return {'confirmed': self.confirmed, 'blocked': self.blocked, 'vacant': self.vacant()}[status]
+
+    def row(self, schedule_id):
+        i = np.searchsorted(self.schedule_ids, schedule_id)
+        if i >= len(self.schedule_ids) or self.schedule_ids[i] != schedule_id:
+            raise KeyError(schedule_id)
+        return i
+
+    def counts(self):
+        """스케줄·등급별 확정/블록 객실 수 (bookings 쿼리와 같은 형식, 티켓이 있는 등급만)"""
+        codes, grades = pd.factorize(self.grades)
+        onehot = np.zeros((len(codes), len(grades)), dtype=np.int64)
+        onehot[np.arange(len(codes)), codes] = 1
+        confirmed = self.confirmed.astype(np.int64) @ onehot
+        blocked = self.blocked.astype(np.int64) @ onehot
+        rows, cols = np.nonzero(self.occupied.astype(np.int64) @ onehot)
+        return pd.DataFrame({
+            'schedule_id': self.schedule_ids[rows],
+            'grade': np.asarray(grades, dtype=object)[cols],
+            'confirmed_rooms': confirmed[rows, cols],
+            'blocked_rooms': blocked[rows, cols],
+        })
+
+    def vacant_rooms(self):
+        """공실 목록 (vacant_rooms 쿼리와 같은 형식·순서: schedule_id, grade, room_no)"""
+        rows, cols = np.nonzero(self.vacant())
+        return pd.DataFrame({
+            'schedule_id': self.schedule_ids[rows],
+            'grade': pd.Categorical(self.grades[cols]),
+            'room_no': self.room_nos[cols],
+        })
+
+    def rooms(self, schedule_id, grade, status):
+        """모달용 객실 번호 목록 (등급, 객실 번호 순서)"""
+        selected = self.mask(status)[self.row(schedule_id)] & (self.grades == grade)
+        return self.room_nos[selected].tolist()
+
+    def page(self, schedule_id, grade, status, cursor=0, size=SEAT_PAGE_SIZE):
+        """좌석 목록 한 페이지 (스케줄·등급·상태로 자른 열 중 cursor 이상부터 size개)
+
+        cursor는 다음 페이지 첫 열 번호 (마지막 페이지면 None). 좌석 번호는 encode_seats 형식.
+        항로 좌석이 아닌 블록(좌석 미지정, 번호 대신 티켓 ID)은 공실에서 빠지지 않으므로 안내 문구(note)로 표시.
+        """
+        row = self.row(schedule_id)
+        in_grade = self.grades == grade
+        columns = np.flatnonzero(self.mask(status)[row] & in_grade)
+        start = np.searchsorted(columns, cursor)
+        chunk = columns[start:start + size]
+        unassigned = int((self.blocked[row] & in_grade & ~self.in_route).sum())
+        note = None
+        if unassigned and status == 'blocked':
+            note = f"좌석 미지정 블록 {unassigned}건은 좌석 번호 대신 티켓 ID로 표시"
+        elif unassigned and status == 'vacant':
+            note = f"좌석 미지정 블록 {unassigned}건은 좌석을 알 수 없어 목록에 포함 (공실 수보다 {unassigned}석 많음)"
+        return {
+            'seats': encode_seats(self.room_nos[chunk]),
+            'count': len(chunk),
+            'total': len(columns),
+            'cursor': int(chunk[-1]) + 1 if start + size < len(columns) else None,
+            'note': note,
+        }
+
+    def availability(self, schedule_ids, grades=None):
+        """여러 편 공실 검색 → 객실별 공실 편 수(free_sailings) + 편별 공실 여부 컬럼(schedule_id)
+
+        공실 편 수가 많은 순 (같으면 등급, 객실 번호 순). 모든 편 공실은 free_sailings == len(schedule_ids).
+        """
+        free = self.vacant()[[self.row(schedule_id) for schedule_id in schedule_ids]]
+        columns = self.in_route.copy()
+        if grades:
+            columns &= np.isin(self.grades, list(grades))
+        free = free[:, columns]
+        counts = free.sum(axis=0)
+        order = np.argsort(-counts, kind='stable')
+        data = {
+            'grade': self.grades[columns][order],
+            'room_no': self.room_nos[columns][order],
+            'free_sailings': counts[order],
+        }
+        data.update((schedule_id, row[order]) for schedule_id, row in zip(schedule_ids, free))
+        return pd.DataFrame(data)
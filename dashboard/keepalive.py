@@ -0,0 +1,128 @@
+"""
+DB 깨워두기 (Azure SQL serverless 자동 일시 중지 대응)
+- 앱 시작 직후 base/cruise 연결을 미리 열어 풀에 넣어 둠
+- 업무 시간(한국 시간)에는 주기적으로 SELECT 1 → 자동 일시 중지되지 않고, 풀의 끊긴 연결도 미리 정리
+- 실패하면(재개 중 등) 짧은 간격으로 다시 시도
+- status(): 화면 표시용 상태 (warm / waking / cold / idle / off)
+
+설정 (환경변수):
+    NEOHELIOS_KEEPALIVE=0                비활성
+    NEOHELIOS_KEEPALIVE_HOURS=07-21      업무 시간 (시작-끝 시, 한국 시간)
+    NEOHELIOS_KEEPALIVE_INTERVAL=300     업무 시간 중 확인 간격 (초)
+    NEOHELIOS_KEEPALIVE_CONNECTIONS=2    DB별로 열어 둘 연결 수
+"""
+
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+KST = timezone(timedelta(hours=9))
+DATABASES = ('base', 'cruise')
+
+DEFAULT_HOURS = (7, 21)
+DEFAULT_INTERVAL = 300
+DEFAULT_CONNECTIONS = 2
+RETRY_INTERVAL = 15          # 실패 후 다시 시도 간격 (초)
+AUTO_PAUSE_MINUTES = 60      # serverless 자동 일시 중지 최소 지연 → 이보다 오래 확인 안 했으면 잠들었을 수 있음
+
+
+def parse_hours(text):
+    """'07-21' → (7, 21)"""
+    start, end = text.split('-')
+    return int(start), int(end)
+
+
+class KeepAlive:
+    def __init__(self, backend, hours=DEFAULT_HOURS, interval=DEFAULT_INTERVAL,
+                 connections=DEFAULT_CONNECTIONS, enabled=True):
+        self.backend = backend
+        self.hours = hours
+        self.interval = interval
+        self.connections = connections
+        self.enabled = enabled
+        self.state = 'idle' if enabled else 'off'
+        self.last_ok = None          # 마지막 성공 시각 (KST)
+        self.last_latency = None     # 마지막 확인 소요 시간 (초, DB별 최대)
+        self.last_error = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    @classmethod
+    def from_env(cls, backend):
+        return cls(
+            backend,
+            hours=parse_hours(os.environ.get('NEOHELIOS_KEEPALIVE_HOURS') or '%02d-%02d' % DEFAULT_HOURS),
+            interval=int(os.environ.get('NEOHELIOS_KEEPALIVE_INTERVAL') or DEFAULT_INTERVAL),
+            connections=int(os.environ.get('NEOHELIOS_KEEPALIVE_CONNECTIONS') or DEFAULT_CONNECTIONS),
+            enabled=os.environ.get('NEOHELIOS_KEEPALIVE', '1') != '0',
+        )
+
+    def start(self):
+        if self.enabled and self._thread is None:
+            self.state = 'waking'
+            self._thread = threading.Thread(target=self._run, name='neohelios-keepalive', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def in_business_hours(self, now=None):
+        now = now or datetime.now(KST)
+        start, end = self.hours
+        return start <= now.hour < end
+
+    def _run(self):
+        # 앱 시작 직후에는 업무 시간과 관계없이 한 번 열어 둠 (첫 조회가 재개 시간을 기다리지 않도록)
+        ok = self.check()
+        while True:
+            if not self.in_business_hours():
+                wait = self.interval
+            else:
+                wait = self.interval if ok else RETRY_INTERVAL
+            if self._stop.wait(wait):
+                return
+            if self.in_business_hours():
+                ok = self.check()
+
+    def check(self):
+        """DB별 연결 확인 + 풀 채우기 → 성공 여부"""
+        if self.state != 'warm' or self._maybe_paused():
+            self.state = 'waking'
+        started = time.perf_counter()
+        try:
+            latency = 0.0
+            for database in DATABASES:
+                t = time.perf_counter()
+                self.backend.keep_warm(database, self.connections)
+                latency = max(latency, time.perf_counter() - t)
+        except Exception as e:
+            self.state = 'cold'
+            self.last_error = str(e)
+            self.last_latency = time.perf_counter() - started
+            return False
+        self.state = 'warm'
+        self.last_ok = datetime.now(KST)
+        self.last_latency = latency
+        self.last_error = None
+        return True
+
+    def _maybe_paused(self):
+        return self.last_ok is None or datetime.now(KST) - self.last_ok > timedelta(minutes=AUTO_PAUSE_MINUTES)
+
+    def status(self):
+        """{'state', 'checked_at': 'HH:MM' | None, 'latency_ms', 'error'}
+
+        warm: 최근 확인 성공 / waking: 확인(재개) 중 / cold: 확인 실패
+        idle: 업무 시간 밖에서 오래 확인 안 함 (일시 중지됐을 수 있음) / off: 비활성
+        """
+        state = self.state
+        if state == 'warm' and self._maybe_paused():
+            state = 'idle'
+        return {
+            'state': state,
+            'checked_at': self.last_ok.strftime('%H:%M') if self.last_ok else None,
+            'latency_ms': round(self.last_latency * 1000) if self.last_latency is not None else None,
+            'error': self.last_error,
+        }
@@ -0,0 +1,252 @@
+"""
+로컬 대역 DB (SQLite)
+- 운영 base/cruise DB 중 조회에 쓰는 테이블만 같은 컬럼명으로 복제
+- 시드 데이터는 항로별 운항 패턴/객실 구성/예약률을 흉내낸 합성 데이터 (재현 가능)
+"""
+
+import os
+import random
+import sqlite3
+from datetime import date, datetime, timedelta
+
+from dashboard.constants import route_map, TSL_PORT_IDS
+
+
+SCHEMA = """
+-- neohelios_base
+CREATE TABLE vessels (
+    id INTEGER PRIMARY KEY, code TEXT, name TEXT,
+    is_cruise_available INTEGER DEFAULT 1, deleted_at TEXT
+);
+CREATE TABLE routes (
+    id INTEGER PRIMARY KEY, code TEXT, description TEXT, deleted_at TEXT
+);
+CREATE TABLE voyages (
+    id INTEGER PRIMARY KEY, route_id INTEGER, direction TEXT
+);
+CREATE TABLE proforma_schedules (
+    id INTEGER PRIMARY KEY, voyage_id INTEGER, port_id INTEGER
+);
+CREATE TABLE coastal_schedules (
+    id INTEGER PRIMARY KEY, proforma_schedule_id INTEGER, etd TEXT,
+    is_cruise_available INTEGER DEFAULT 1, deleted_at TEXT
+);
+
+-- neohelios_cruise
+CREATE TABLE grades (
+    id INTEGER PRIMARY KEY, route_id INTEGER, code TEXT, deleted_at TEXT
+);
+CREATE TABLE rooms (
+    id INTEGER PRIMARY KEY, grade_id INTEGER, room_number TEXT, deleted_at TEXT
+);
+CREATE TABLE grade_prices (
+    id INTEGER PRIMARY KEY, grade_id INTEGER
+);
+CREATE TABLE grade_price_details (
+    id INTEGER PRIMARY KEY, grade_price_id INTEGER
+);
+CREATE TABLE grade_price_detail_by_age_groups (
+    id INTEGER PRIMARY KEY, grade_price_detail_id INTEGER, age_group TEXT
+);
+CREATE TABLE passengers (
+    id INTEGER PRIMARY KEY, sex TEXT, nationality TEXT, birth_day TEXT, deleted_at TEXT
+);
+CREATE TABLE reservation_passengers (
+    id INTEGER PRIMARY KEY, passenger_id INTEGER, deleted_at TEXT
+);
+CREATE TABLE tickets (
+    id INTEGER PRIMARY KEY,
+    departure_schedule_id INTEGER,
+    arrival_schedule_id INTEGER,
+    on_boarding_room_id INTEGER,
+    grade_price_detail_by_age_group_id INTEGER,
+    reservation_passenger_id INTEGER,
+    ticket_number TEXT,
+    is_temporary INTEGER,
+    is_issued INTEGER,
+    status TEXT,
+    deleted_at TEXT
+);
+
+CREATE INDEX ix_cs_proforma ON coastal_schedules(proforma_schedule_id);
+CREATE INDEX ix_cs_etd ON coastal_schedules(etd);
+CREATE INDEX ix_ps_voyage ON proforma_schedules(voyage_id);
+CREATE INDEX ix_grades_route ON grades(route_id);
+CREATE INDEX ix_rooms_grade ON rooms(grade_id);
+CREATE INDEX ix_tickets_departure ON tickets(departure_schedule_id);
+CREATE INDEX ix_tickets_room ON tickets(on_boarding_room_id, departure_schedule_id);
+"""
+
+# 항로별 등급 구성: (등급, 객실/좌석 수)
+ROUTE_GRADES = {
+    'PSMC': [('OR', 120), ('PR', 20), ('RS', 10), ('BS', 60), ('OC', 80), ('IC', 160), ('DA', 40)],
+    'PSTL': [('PRM', 36), ('ECM', 400)],
+    'PSGR': [('FC', 20), ('BUS', 120), ('STA', 300)],
+}
+
+ROUTE_VESSEL = {
+    'BOC': 'PSMC', 'ONC': 'PSMC', 'KSC': 'PSMC', 'TSL': 'PSTL',
+    'EAS': 'PSGR', 'SCC': 'PSGR', 'FWC': 'PSGR', 'SND': 'PSGR', 'NFW': 'PSGR',
+}
+
+PORT_IDS = {'PUS': 1777, 'OSA': 1693, **TSL_PORT_IDS}
+
+CAPACITY = {'OR': 2, 'BS': 2, 'PR': 2, 'RS': 3, 'IC': 4, 'OC': 4, 'DA': 4, 'GR': 8}
+
+NATIONALITIES = ['KR'] * 12 + ['JP'] * 6 + ['CN', 'US', 'TW', 'VN', None]
+
+
+def _departures(route_code, day):
+    """해당 날짜의 (방향, 출발포트, HH:MM) 목록"""
+    weekday = day.weekday()
+    if route_code == 'BOC':
+        # 부산-오사카: 격일 교대 운항
+        return [('E', 'PUS', '19:00')] if day.toordinal() % 2 == 0 else [('W', 'OSA', '15:30')]
+    if route_code == 'ONC':
+        # 주말 크루즈
+        return [('E', 'PUS', '19:00')] if weekday == 5 else ([('W', 'PUS', '08:00')] if weekday == 6 else [])
+    if route_code == 'KSC':
+        return [('E', 'PUS', '18:00')] if weekday == 2 else []
+    if route_code == 'TSL':
+        # 부산-이즈하라-히타카츠 (하루 4편)
+        return [('E', 'PUS', '08:30'), ('E', 'IZH', '11:00'), ('W', 'HTK', '15:30'), ('W', 'IZH', '17:00')]
+    if route_code in ('FWC', 'NFW'):
+        return [('E', 'PUS', '19:30')] if weekday in (4, 5) else []
+    return [('E', 'PUS', '10:00')]
+
+
+def create_schema(conn):
+    conn.executescript(SCHEMA)
+
+
+def seed(conn, start_date=None, days=120, seed=7, occupancy=(0.3, 0.9)):
+    """합성 데이터 적재 (같은 seed면 같은 데이터)"""
+    rng = random.Random(seed)
+    start_date = start_date or date.today() - timedelta(days=days // 4)
+
+    conn.executemany("INSERT INTO vessels (id, code, name) VALUES (?, ?, ?)",
+                     [(1, 'PSMC', 'PANSTAR MIRACLE'), (2, 'PSTL', 'PANSTAR TSL'), (3, 'PSGR', 'PANSTAR GRACE')])
+    conn.executemany("INSERT INTO routes (id, code, description) VALUES (?, ?, ?)",
+                     [(rid, code, code) for code, rid in route_map.items()])
+
+    # 등급/객실/가격 체인
+    grade_rows, room_rows, price_rows = [], [], []
+    route_rooms = {}  # route_code -> [(room_id, grade, age_group_id)]
+    grade_id = room_id = 0
+    for route_code, route_id in route_map.items():
+        route_rooms[route_code] = []
+        for grade, count in ROUTE_GRADES[ROUTE_VESSEL[route_code]]:
+            grade_id += 1
+            grade_rows.append((grade_id, route_id, grade))
+            price_rows.append(grade_id)
+            for n in range(count):
+                room_id += 1
+                if ROUTE_VESSEL[route_code] == 'PSMC':
+                    room_number = f"{grade[0]}{(n // 40) + 2}{n % 40 + 1:02d}"
+                else:
+                    room_number = f"{grade}-{n // 4 + 1}{'ABCD'[n % 4]}"
+                room_rows.append((room_id, grade_id, room_number))
+                route_rooms[route_code].append((room_id, grade, grade_id))
+    conn.executemany("INSERT INTO grades (id, route_id, code) VALUES (?, ?, ?)", grade_rows)
+    conn.executemany("INSERT INTO rooms (id, grade_id, room_number) VALUES (?, ?, ?)", room_rows)
+    # 등급당 가격 1개 / 상세 1개 / 연령그룹 1개 (id를 grade_id와 맞춤)
+    conn.executemany("INSERT INTO grade_prices (id, grade_id) VALUES (?, ?)", [(g, g) for g in price_rows])
+    conn.executemany("INSERT INTO grade_price_details (id, grade_price_id) VALUES (?, ?)", [(g, g) for g in price_rows])
+    conn.executemany("INSERT INTO grade_price_detail_by_age_groups (id, grade_price_detail_id, age_group) VALUES (?, ?, 'ADULT')",
+                     [(g, g) for g in price_rows])
+
+    # 항차/스케줄
+    voyage_ids = {}
+    voyage_rows = []
+    for route_code, route_id in route_map.items():
+        for direction in ('E', 'W'):
+            voyage_ids[(route_code, direction)] = len(voyage_rows) + 1
+            voyage_rows.append((len(voyage_rows) + 1, route_id, direction))
+    conn.executemany("INSERT INTO voyages (id, route_id, direction) VALUES (?, ?, ?)", voyage_rows)
+
+    proforma_ids = {}
+    proforma_rows = []
+    schedule_rows = []
+    schedules = []  # (schedule_id, route_code, direction, port, day)
+    for offset in range(days):
+        day = start_date + timedelta(days=offset)
+        for route_code in route_map:
+            for direction, port, hhmm in _departures(route_code, day):
+                key = (route_code, direction, port)
+                if key not in proforma_ids:
+                    proforma_ids[key] = len(proforma_rows) + 1
+                    proforma_rows.append((proforma_ids[key], voyage_ids[(route_code, direction)], PORT_IDS[port]))
+                schedule_id = len(schedule_rows) + 1
+                etd = datetime.combine(day, datetime.strptime(hhmm, '%H:%M').time())
+                schedule_rows.append((schedule_id, proforma_ids[key], etd.strftime('%Y-%m-%d %H:%M:%S')))
+                schedules.append((schedule_id, route_code, direction, port, day))
+    conn.executemany("INSERT INTO proforma_schedules (id, voyage_id, port_id) VALUES (?, ?, ?)", proforma_rows)
+    conn.executemany("INSERT INTO coastal_schedules (id, proforma_schedule_id, etd) VALUES (?, ?, ?)", schedule_rows)
+
+    # TSL 도착 스케줄 후보: 같은 날 도착 포트에서 출발하는 스케줄
+    tsl_by_day_port = {(day, port): sid for sid, route_code, _, port, day in schedules if route_code == 'TSL'}
+    tsl_arrivals = {'PUS': ['IZH', 'HTK'], 'IZH': ['HTK'], 'HTK': ['PUS', 'IZH'], 'IZH_W': ['PUS']}
+
+    ticket_rows, rp_rows, passenger_rows = [], [], []
+    ticket_id = passenger_id = 0
+    for schedule_id, route_code, direction, port, day in schedules:
+        is_seat_based = ROUTE_VESSEL[route_code] != 'PSMC'
+        rate = rng.uniform(*occupancy)
+        rooms = route_rooms[route_code]
+        arrival_candidates = [None]
+        if route_code == 'TSL':
+            ports = tsl_arrivals['IZH_W' if (port == 'IZH' and direction == 'W') else port]
+            arrival_candidates = [tsl_by_day_port.get((day, p)) for p in ports]
+        for room_id, grade, age_group_id in rooms:
+            if rng.random() > rate:
+                continue
+            is_blocked = rng.random() < 0.15
+            pax = 1 if is_seat_based else rng.randint(1, CAPACITY.get(grade, 2))
+            for _ in range(pax):
+                ticket_id += 1
+                status = 'REFUND_COMPLETE' if rng.random() < 0.03 else 'RESERVED'
+                reservation_passenger_id = None
+                if not is_blocked:
+                    passenger_id += 1
+                    birth = date(rng.randint(1940, 2020), rng.randint(1, 12), rng.randint(1, 28))
+                    passenger_rows.append((passenger_id, rng.choice('MF'), rng.choice(NATIONALITIES), birth.isoformat()))
+                    rp_rows.append((passenger_id, passenger_id))
+                    reservation_passenger_id = passenger_id
+                # 좌석 기반 블록 티켓은 좌석 미지정
+                on_boarding_room_id = None if (is_seat_based and is_blocked) else room_id
+                ticket_rows.append((
+                    ticket_id, schedule_id, rng.choice(arrival_candidates), on_boarding_room_id, age_group_id,
+                    reservation_passenger_id, f"{rng.choice('KKJ')}{ticket_id:09d}",
+                    1 if is_blocked else 0, 1 if rng.random() < 0.7 else 0, status,
+                ))
+        if len(ticket_rows) > 50000:
+            _flush(conn, ticket_rows, rp_rows, passenger_rows)
+    _flush(conn, ticket_rows, rp_rows, passenger_rows)
+    conn.commit()
+
+
+def _flush(conn, ticket_rows, rp_rows, passenger_rows):
+    conn.executemany("INSERT INTO passengers (id, sex, nationality, birth_day) VALUES (?, ?, ?, ?)", passenger_rows)
+    conn.executemany("INSERT INTO reservation_passengers (id, passenger_id) VALUES (?, ?)", rp_rows)
+    conn.executemany(
+        "INSERT INTO tickets (id, departure_schedule_id, arrival_schedule_id, on_boarding_room_id, "
+        "grade_price_detail_by_age_group_id, reservation_passenger_id, ticket_number, is_temporary, is_issued, status) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", ticket_rows)
+    ticket_rows.clear()
+    rp_rows.clear()
+    passenger_rows.clear()
+
+
+def build_local_db(path, start_date=None, days=120, seed_value=7):
+    """스키마 생성 + 시드. 기존 파일은 덮어씀"""
+    if os.path.exists(path):
+        os.remove(path)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    conn = sqlite3.connect(path)
+    try:
+        create_schema(conn)
+        seed(conn, start_date=start_date, days=days, seed=seed_value)
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+    return path
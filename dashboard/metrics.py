@@ -0,0 +1,241 @@
+"""
+운영 지표 (프로세스당 하나, app_config.get_metrics)
+- 히스토그램: 조회 소요 시간(항로·단계별), DB 쿼리별 소요 시간/행 수, 엑셀 생성 시간
+- 캐시/대기열/장애/DB 깨워두기 상태는 내보낼 때 각 객체의 stats()에서 읽음 (collect_gauges)
+- 세션 수/세션별 session_state 크기는 Streamlit 런타임에서 (내부 API라 실패하면 생략)
+- 내보내기: Prometheus 텍스트(render_prometheus) → 운영 지표 화면, NEOHELIOS_METRICS_PORT를 주면 /metrics HTTP
+"""
+
+import bisect
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PREFIX = 'neohelios_'
+SECONDS_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+ROW_BUCKETS = (10, 100, 1000, 10000, 100000, 1000000)
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)   # 마지막 칸은 +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q):
+        """q 분위가 들어 있는 칸의 상한 (마지막 칸이면 최댓값)"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}   # (이름, ((라벨, 값), ...)) → Histogram
+        self._counters = {}
+
+    def observe(self, name, value, buckets=SECONDS_BUCKETS, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """with 블록 소요 시간(초) 기록 (예외로 끝나면 기록하지 않음)"""
+        started = time.perf_counter()
+        yield
+        self.observe(name, time.perf_counter() - started, **labels)
+
+    def histograms(self):
+        """[(이름, 라벨 dict, Histogram 복사본)] (이름, 라벨 순)"""
+        with self._lock:
+            items = sorted(self._histograms.items())
+            copies = []
+            for (name, labels), histogram in items:
+                copy = Histogram(histogram.buckets)
+                copy.counts, copy.count = list(histogram.counts), histogram.count
+                copy.sum, copy.max = histogram.sum, histogram.max
+                copies.append((name, dict(labels), copy))
+        return copies
+
+    def counters(self):
+        with self._lock:
+            return [(name, dict(labels), value) for (name, labels), value in sorted(self._counters.items())]
+
+
+# ---------- 세션 ----------
+
+def estimate_bytes(value, _depth=0):
+    """session_state 값의 대략적인 메모리 크기 (프레임은 memory_usage, 컨테이너는 재귀, 나머지는 getsizeof)"""
+    if hasattr(value, 'memory_usage') and hasattr(value, 'columns'):
+        return int(value.memory_usage(index=True, deep=False).sum())
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if _depth < 4 and isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_bytes(v, _depth + 1) for v in value.values())
+    if _depth < 4 and isinstance(value, (list, tuple)):
+        # 레코드 목록(객실 상세 등)은 앞쪽 표본으로 추정
+        sample = value[:200]
+        per_item = sum(estimate_bytes(v, _depth + 1) for v in sample) / len(sample) if sample else 0
+        return sys.getsizeof(value) + int(per_item * len(value))
+    return sys.getsizeof(value)
+
+
+def session_stats():
+    """활성 세션 수와 세션별 session_state 추정 크기 [{'session', 'bytes'}] (런타임 밖이면 None)
+
+    캐시에서 받은 결과는 세션끼리 프레임을 공유하므로 합계는 실제보다 클 수 있음.
+    """
+    try:
+        from streamlit.runtime import Runtime
+        sessions = Runtime.instance()._session_mgr.list_active_sessions()
+    except Exception:
+        return None
+    sizes = []
+    for info in sessions:
+        try:   # 다른 세션이 실행 중이면 읽는 도중 바뀔 수 있음 → 이번에는 생략
+            size = sum(estimate_bytes(v) for v in info.session.session_state.filtered_state.values())
+        except Exception:
+            continue
+        sizes.append({'session': info.session.id[:8], 'bytes': size})
+    return sizes
+
+
+def collect_gauges(backend=None, result_cache=None, schedule_cache=None, flight=None, keepalive=None, sessions=True):
+    """각 객체의 stats()/status() → [(이름, 라벨 dict, 값)] (누적 횟수도 그대로 값으로)"""
+    gauges = []
+
+    def add(name, value, **labels):
+        gauges.append((name, labels, value))
+
+    def hit_ratio(cache, hits, misses):
+        if hits + misses:
+            add('cache_hit_ratio', hits / (hits + misses), cache=cache)
+
+    if result_cache is not None:
+        stats = result_cache.stats()
+        for key in ('entries', 'hits', 'stale_hits', 'misses', 'disk_hits', 'refreshes', 'refreshing'):
+            add(f'result_cache_{key}', stats[key])
+        hit_ratio('result', stats['hits'] + stats['stale_hits'], stats['misses'])
+        disk = stats.get('disk')
+        if disk:
+            for key in ('bytes', 'max_bytes', 'hits', 'misses', 'writes', 'evictions', 'errors'):
+                add(f'disk_cache_{key}', disk[key])
+            for kind, count in disk['entries'].items():
+                add('disk_cache_entries', count, kind=kind)
+            hit_ratio('disk', disk['hits'], disk['misses'])
+    if schedule_cache is not None:
+        stats = schedule_cache.stats()
+        for key, value in stats.items():
+            add(f'schedule_cache_{key}', value)
+        hit_ratio('schedule', stats['hits'], stats['misses'])
+    if flight is not None:
+        for key, value in flight.stats().items():
+            add(f'singleflight_{key}', value)
+    if backend is not None and backend.admission is not None:
+        for key, value in backend.admission.stats().items():
+            add(f'admission_{key}', value)
+    if backend is not None and backend.breaker is not None:
+        stats = backend.breaker.stats()
+        add('db_breaker_open', stats['state'] != 'closed')
+        add('db_breaker_trips', stats['trips'])
+    if keepalive is not None:
+        status = keepalive.status()
+        add('db_keepalive_state', 1, state=status['state'])
+        add('db_keepalive_latency_ms', status['latency_ms'])
+    if sessions:
+        sizes = session_stats()
+        if sizes is not None:
+            add('active_sessions', len(sizes))
+            add('session_state_bytes', sum(s['bytes'] for s in sizes))
+            add('session_state_max_bytes', max((s['bytes'] for s in sizes), default=0))
+    return gauges
+
+
+# ---------- 내보내기 ----------
+
+def _labels(labels, extra=None):
+    items = list(labels.items()) + (list(extra.items()) if extra else [])
+    if not items:
+        return ''
+    escaped = (str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, v in items)
+    return '{' + ','.join(f'{k}="{v}"' for (k, _), v in zip(items, escaped)) + '}'
+
+
+def render_prometheus(metrics, gauges=()):
+    """Prometheus 텍스트 형식 (gauges: [(이름, 라벨 dict, 값)])"""
+    lines = []
+    typed = set()
+
+    def declare(name, kind):
+        if name not in typed:
+            typed.add(name)
+            lines.append(f'# TYPE {PREFIX}{name} {kind}')
+
+    for name, labels, histogram in metrics.histograms():
+        declare(name, 'histogram')
+        cumulative = 0
+        for bound, count in zip(histogram.buckets + ('+Inf',), histogram.counts):
+            cumulative += count
+            lines.append(f'{PREFIX}{name}_bucket{_labels(labels, {"le": bound})} {cumulative}')
+        lines.append(f'{PREFIX}{name}_sum{_labels(labels)} {histogram.sum:.6f}')
+        lines.append(f'{PREFIX}{name}_count{_labels(labels)} {histogram.count}')
+    for name, labels, value in metrics.counters():
+        declare(name, 'counter')
+        lines.append(f'{PREFIX}{name}{_labels(labels)} {value}')
+    # 같은 이름의 줄은 한데 모아야 함 (Prometheus 텍스트 형식)
+    for name, labels, value in sorted(gauges, key=lambda gauge: gauge[0]):
+        if value is None:
+            continue
+        declare(name, 'gauge')
+        lines.append(f'{PREFIX}{name}{_labels(labels)} {float(value):g}')
+    return '\n'.join(lines) + '\n'
+
+
+def serve(port, render, host='127.0.0.1'):
+    """/metrics HTTP 엔드포인트 (render() → Prometheus 텍스트, 데몬 스레드)"""
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+            body = render().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='neohelios-metrics', daemon=True).start()
+    return server
+
@@ -0,0 +1,597 @@
+"""
+조회 파이프라인
+- 검색 조건(QueryFilters) → 스케줄/객실/예약/승객 조회 → 화면용 결과 dict
+- Streamlit에 의존하지 않으므로 로컬 대역 DB로 벤치마크/부하 테스트 가능
+- backend.metrics가 있으면 항로·단계별(schedules/total_rooms/cruise/build) 소요 시간 기록
+"""
+
+from contextlib import nullcontext
+from dataclasses import dataclass, replace
+
+import pandas as pd
+
+from dashboard.constants import (
+    route_map, route_direction_map, TSL_PORT_IDS, PORT_CODE_MAP,
+    seat_based_vessels, vessel_grade_order, grade_capacity, weekday_ko,
+)
+from dashboard.inventory import RoomInventory
+
+# 구간 조회(iter_query_chunks) 기본 구간 길이 (일)
+CHUNK_DAYS = 14
+
+
+class NoScheduleError(Exception):
+    """조건에 맞는 스케줄 없음 (화면에는 경고로 표시)"""
+
+
+@dataclass(frozen=True)
+class QueryFilters:
+    vessel: str
+    route: str
+    origin: str
+    destination: str
+    start_date: str
+    end_date: str
+
+    @classmethod
+    def create(cls, vessel, route, origin, destination, start_date, end_date):
+        # 날짜는 'YYYY-MM-DD' 문자열로 통일 (date/str 혼용 방지)
+        return cls(vessel, route, origin, destination, str(start_date), str(end_date))
+
+    @property
+    def is_seat_based(self):
+        return self.vessel in seat_based_vessels
+
+    @property
+    def is_tsl(self):
+        return self.route == 'TSL'
+
+    @property
+    def flight_key(self):
+        """동시 조회 합치기용 키 (결과가 같은 조건은 같은 키: TSL 외 항로는 출발/도착지 대신 조회 방향)"""
+        if self.is_tsl:
+            places = (self.origin, self.destination)
+        else:
+            places = tuple(resolve_directions(self.route, self.origin, self.destination))
+        return (self.vessel, self.route, places, self.start_date, self.end_date)
+
+
+def stage_timer(backend, filters, stage):
+    """조회 단계 소요 시간 기록 (backend.metrics가 없으면 아무것도 안 함)"""
+    if backend.metrics is None:
+        return nullcontext()
+    return backend.metrics.timer('query_stage_seconds', route=filters.route, stage=stage)
+
+
+def resolve_directions(route, origin, destination):
+    """출발지/도착지에 따른 direction 결정 (TSL 제외)"""
+    route_ports_info = route_direction_map.get(route, {'first': 'PUS', 'second': 'OSA'})
+    first_port = route_ports_info['first']
+    second_port = route_ports_info['second']
+
+    if origin == '전체' and destination == '전체':
+        return ['E', 'W']
+    elif origin == first_port and destination == '전체':
+        return ['E']
+    elif origin == second_port and destination == '전체':
+        return ['W']
+    elif origin == '전체' and destination == second_port:
+        return ['E']
+    elif origin == '전체' and destination == first_port:
+        return ['W']
+    elif origin == first_port and destination == second_port:
+        return ['E']
+    elif origin == second_port and destination == first_port:
+        return ['W']
+    return ['E', 'W']
+
+
+def fetch_schedules(backend, filters):
+    """항로/기간별 스케줄 조회 (TSL은 방향 구분 없이 port 정보 포함)"""
+    route_id = route_map.get(filters.route, 1)
+    if filters.is_tsl:
+        return backend.fetch_schedules(route_id, filters.start_date, filters.end_date)
+
+    all_schedules = []
+    for direction in resolve_directions(filters.route, filters.origin, filters.destination):
+        df_temp = backend.fetch_schedules(route_id, filters.start_date, filters.end_date, direction)
+        if not df_temp.empty:
+            all_schedules.append(df_temp)
+    if all_schedules:
+        return pd.concat(all_schedules, ignore_index=True)
+    return pd.DataFrame()
+
+
+def prepare_schedules(df_schedules):
+    """날짜/시간/요일/출발 포트 표시용 컬럼 추가"""
+    etd = pd.to_datetime(df_schedules['etd'])
+    df_schedules['date_display'] = etd.dt.strftime('%m-%d')
+    df_schedules['weekday'] = etd.dt.day_name().map(weekday_ko)
+    # 시간 정보 (HH:MM 형식)
+    df_schedules['time_display'] = etd.dt.strftime('%H:%M')
+    df_schedules['date'] = etd.dt.date
+
+    # 출발 포트 코드 추가
+    if 'departure_port_id' in df_schedules.columns:
+        df_schedules['departure_port'] = df_schedules['departure_port_id'].map(PORT_CODE_MAP).fillna('-')
+    else:
+        df_schedules['departure_port'] = '-'
+    return df_schedules
+
+
+def load_schedules(backend, filters):
+    """스케줄 조회 + TSL 출발/도착지 필터 → (df_schedules, arrival_schedule_ids, leg_schedules)
+
+    leg_schedules: TSL 출발지 필터 전 스케줄 (구간 현황에서 도착 스케줄의 포트/구간 스케줄 찾기용, TSL 외 None)
+    """
+    # 1. 스케줄 조회 (neohelios_base)
+    df_schedules = fetch_schedules(backend, filters)
+    if df_schedules.empty:
+        raise NoScheduleError("해당 기간에 스케줄이 없습니다.")
+    df_schedules = prepare_schedules(df_schedules)
+
+    # TSL 도착지 필터 (arrival_schedule_id의 port)
+    # Azure SQL에서는 Cross-database 쿼리 불가 → Python에서 필터링
+    # 도착 스케줄도 같은 항로 스케줄이므로 방금 조회한 스케줄의 출발 포트로 판단 (포트 매핑 재조회 없음)
+    arrival_schedule_ids = None
+    leg_schedules = df_schedules[['schedule_id', 'etd', 'direction', 'departure_port']] if filters.is_tsl else None
+    if filters.is_tsl and filters.destination != '전체':
+        # arrival_schedule_id가 선택한 도착 port인 티켓만 조회
+        arrival_schedule_ids = df_schedules.loc[
+            df_schedules['departure_port'] == filters.destination, 'schedule_id'].tolist() or None
+
+    # TSL 출발지 필터 (departure_schedule_id의 port)
+    if filters.is_tsl and filters.origin != '전체':
+        origin_port_id = TSL_PORT_IDS.get(filters.origin)
+        if origin_port_id:
+            df_schedules = df_schedules[df_schedules['departure_port_id'] == origin_port_id].copy()
+            if df_schedules.empty:
+                raise NoScheduleError("선택한 출발지에 해당하는 스케줄이 없습니다.")
+
+    return df_schedules, arrival_schedule_ids, leg_schedules
+
+
+def fetch_schedule_frames(backend, filters, df_schedules, arrival_schedule_ids=None):
+    """스케줄 묶음 하나에 대한 cruise 쿼리 → {이름: 프레임} (build_result 인자 순서)"""
+    schedule_ids = df_schedules['schedule_id'].tolist()
+    route_ids = df_schedules['route_id'].unique().tolist()
+    is_seat_based = filters.is_seat_based
+
+    # 3. 객실/좌석별 상세 정보 조회 (모달용)
+    df_room_details = backend.fetch_room_details(schedule_ids, is_seat_based, arrival_schedule_ids)
+    # 3-1. 예약 현황(확정, 블록 객실/좌석 수) + 공실 목록
+    if is_seat_based:
+        # PSTL/PSGR은 좌석이 수백 개라 공실 목록 표시 안함
+        df_bookings = backend.fetch_bookings(schedule_ids, is_seat_based, arrival_schedule_ids)
+        df_vacant_rooms = pd.DataFrame(columns=['schedule_id', 'grade', 'room_no', 'status'])
+    elif arrival_schedule_ids:
+        # 도착지 필터가 있으면 상세 목록이 일부 티켓만 담으므로 공실은 SQL로
+        df_bookings = backend.fetch_bookings(schedule_ids, is_seat_based, arrival_schedule_ids)
+        df_vacant_rooms = backend.fetch_vacant_rooms(schedule_ids, route_ids)
+    else:
+        # PSMC: 항로 객실 색인 × 스케줄별 점유 행렬로 계산 (예약 현황/공실 쿼리 생략)
+        inventory = RoomInventory.build(backend.fetch_route_rooms(route_ids), df_room_details, schedule_ids)
+        df_bookings = inventory.counts()
+        df_vacant_rooms = inventory.vacant_rooms()
+    if not is_seat_based:
+        df_vacant_rooms['status'] = 'vacant'
+    # 3-2. 승객 수 조회 (티켓 수 기반)
+    df_passengers = backend.fetch_passenger_counts(schedule_ids, is_seat_based, arrival_schedule_ids)
+    # 4. 승객 분석 데이터 조회 (확정 승객만)
+    df_passenger_analysis = backend.fetch_passenger_analysis(schedule_ids, arrival_schedule_ids)
+
+    return {
+        'bookings': df_bookings,
+        'passengers': df_passengers,
+        'room_details': df_room_details,
+        'vacant_rooms': df_vacant_rooms,
+        'passenger_analysis': df_passenger_analysis,
+    }
+
+
+def split_by_schedule(frames, schedule_ids):
+    """{이름: 프레임} → {schedule_id: {이름: 해당 스케줄 행}} (행이 없는 스케줄은 빈 프레임)"""
+    pieces = {schedule_id: {} for schedule_id in schedule_ids}
+    for name, df in frames.items():
+        groups = dict(list(df.groupby('schedule_id', sort=False))) if not df.empty else {}
+        for schedule_id in schedule_ids:
+            piece = groups.get(schedule_id)
+            pieces[schedule_id][name] = piece.reset_index(drop=True) if piece is not None else df.iloc[0:0].copy()
+    return pieces
+
+
+def assemble_frames(pieces, schedule_ids):
+    """스케줄별 프레임 → {이름: 프레임} (schedule_id 순서, 범주형 컬럼은 다시 범주형으로)"""
+    ordered = [pieces[schedule_id] for schedule_id in sorted(schedule_ids)]
+    frames = {}
+    for name, first in ordered[0].items():
+        parts = [piece[name] for piece in ordered if not piece[name].empty] or [first]
+        df = pd.concat(parts, ignore_index=True)
+        for column, dtype in first.dtypes.items():
+            if isinstance(dtype, pd.CategoricalDtype) and not isinstance(df[column].dtype, pd.CategoricalDtype):
+                df[column] = df[column].astype('category')
+        frames[name] = df
+    return frames
+
+
+def fetch_frames_cached(backend, filters, df_schedules, arrival_schedule_ids=None):
+    """fetch_schedule_frames + 스케줄 단위 캐시(backend.schedule_cache) → (프레임들, 재사용한 가장 오래된 조회 시각)
+
+    캐시에 없거나 ttl이 지난 스케줄만 조회하고, 캐시에 있던 스케줄과 합쳐서 돌려줌.
+    """
+    cache = backend.schedule_cache
+    if cache is None:
+        return fetch_schedule_frames(backend, filters, df_schedules, arrival_schedule_ids), None
+
+    context = (filters.is_seat_based, tuple(arrival_schedule_ids) if arrival_schedule_ids else None)
+    schedule_ids = df_schedules['schedule_id'].tolist()
+    pieces = cache.get_many(schedule_ids, context)
+    missing = df_schedules[~df_schedules['schedule_id'].isin(list(pieces))]
+    if pieces:
+        oldest = min(piece.fetched_at for piece in pieces.values())
+        pieces = {schedule_id: piece.frames for schedule_id, piece in pieces.items()}
+    else:
+        oldest = None
+    if missing.empty:
+        return assemble_frames(pieces, schedule_ids), oldest
+
+    fetched = fetch_schedule_frames(backend, filters, missing, arrival_schedule_ids)
+    fresh = split_by_schedule(fetched, missing['schedule_id'].tolist())
+    cache.put_many(fresh, context)
+    if not pieces:
+        return fetched, None
+    pieces.update(fresh)
+    return assemble_frames(pieces, schedule_ids), oldest
+
+
+def fetch_result(backend, filters, df_schedules, df_total_rooms, arrival_schedule_ids=None,
+                 multiple_per_day=None, leg_schedules=None):
+    """스케줄 묶음 하나에 대한 cruise 쿼리 + 결과 조립
+
+    스케줄 단위 캐시에서 가져온 스케줄이 있으면 결과의 fetched_at은 그중 가장 오래된 조회 시각.
+    leg_schedules(TSL)는 구간 현황용으로 결과에 그대로 보관.
+    """
+    with stage_timer(backend, filters, 'cruise'):
+        frames, oldest = fetch_frames_cached(backend, filters, df_schedules, arrival_schedule_ids)
+    with stage_timer(backend, filters, 'build'):
+        result = build_result(filters, df_schedules, df_total_rooms, *frames.values(), multiple_per_day)
+    if oldest is not None:
+        result['fetched_at'] = oldest
+    if leg_schedules is not None:
+        result['leg_schedules'] = leg_schedules
+    return result
+
+
+def run_query(backend, filters):
+    """조회 버튼 1회 분량의 전체 파이프라인. 결과는 session_state.query_result 형식"""
+    backend.begin_request(filters)
+    try:
+        with stage_timer(backend, filters, 'schedules'):
+            df_schedules, arrival_schedule_ids, leg_schedules = load_schedules(backend, filters)
+
+        # 2. 전체 객실 수 조회 (선택한 route 기준)
+        with stage_timer(backend, filters, 'total_rooms'):
+            df_total_rooms = backend.fetch_total_rooms(df_schedules['route_id'].unique().tolist())
+        return fetch_result(backend, filters, df_schedules, df_total_rooms, arrival_schedule_ids,
+                            leg_schedules=leg_schedules)
+    finally:
+        backend.end_request()
+
+
+def run_query_shared(flight, backend, filters):
+    """run_query + 같은 조건으로 동시에 들어온 조회 합치기 (flight: SingleFlight) → (결과, 공유 여부)
+
+    결과 dict는 세션마다 고쳐 쓰므로(엑셀 파일 보관 등) 얕은 복사본을 돌려줌. 프레임은 읽기만 함.
+    """
+    result, shared = flight.do(filters.flight_key, lambda: run_query(backend, filters))
+    return dict(result), shared
+
+
+def cached_result(cache, flight, backend, filters):
+    """결과 캐시(ResultCache)에 쓸 만한 결과가 있으면 세션용 복사본, 없으면 None
+
+    ttl이 지난 결과(stale=True)면 백그라운드에서 다시 조회해 캐시를 교체.
+    """
+    return cache.get(filters.flight_key, lambda: run_query_shared(flight, backend, filters)[0])
+
+
+def run_query_cached(cache, flight, backend, filters):
+    """결과 캐시 → 없으면 run_query_shared로 조회 후 저장 → 세션용 결과"""
+    result = cached_result(cache, flight, backend, filters)
+    if result is None:
+        result = cache.store(filters.flight_key, run_query_shared(flight, backend, filters)[0])
+    return result
+
+
+def split_by_date(df_schedules, chunk_days):
+    """출항일 기준 chunk_days일 단위로 스케줄 분할 (빈 구간은 건너뜀)"""
+    dates = pd.to_datetime(df_schedules['etd']).dt.normalize()
+    offsets = (dates - dates.min()).dt.days // chunk_days
+    return [chunk for _, chunk in df_schedules.groupby(offsets.values, sort=True)]
+
+
+def iter_query_chunks(backend, filters, chunk_days=CHUNK_DAYS):
+    """긴 기간 조회를 날짜 구간별로 나눠 실행 → (구간 번호, 구간 수, 구간 결과)를 차례로 반환
+
+    스케줄/전체 객실 수는 한 번만 조회하고, 예약·상세 쿼리와 결과 조립은 구간 단위.
+    구간별 원본 프레임은 다음 구간 전에 버려지므로 조회 중 메모리는 구간 크기에 비례.
+    """
+    backend.begin_request(filters)
+    try:
+        with stage_timer(backend, filters, 'schedules'):
+            df_schedules, arrival_schedule_ids, leg_schedules = load_schedules(backend, filters)
+        with stage_timer(backend, filters, 'total_rooms'):
+            df_total_rooms = backend.fetch_total_rooms(df_schedules['route_id'].unique().tolist())
+        # 날짜 표시 형식(시간 포함 여부)은 전체 기간 기준으로 고정
+        multiple_per_day = bool((df_schedules.groupby('date').size() > 1).any())
+
+        chunks = split_by_date(df_schedules, chunk_days)
+        for index, chunk in enumerate(chunks):
+            chunk_filters = replace(filters, start_date=str(chunk['date'].min()), end_date=str(chunk['date'].max()))
+            yield index, len(chunks), fetch_result(
+                backend, chunk_filters, chunk, df_total_rooms, arrival_schedule_ids, multiple_per_day, leg_schedules)
+    finally:
+        backend.end_request()
+
+
+def merge_results(filters, parts):
+    """구간 결과들 → run_query와 같은 형식의 결과 하나"""
+    final_df = pd.concat([p['final_df'] for p in parts], ignore_index=True)
+    existing_grades = parts[0]['existing_grades']
+    is_seat_based = filters.is_seat_based
+    return {
+        'final_df': final_df,
+        'final_df_passengers': pd.concat([p['final_df_passengers'] for p in parts], ignore_index=True),
+        'existing_grades': existing_grades,
+        'start_date': filters.start_date,
+        'end_date': filters.end_date,
+        'vessel_name': filters.vessel,
+        'route_name': filters.route,
+        'room_details': [record for p in parts for record in p['room_details']],
+        'is_seat_based': is_seat_based,
+        'passenger_analysis': pd.concat([p['passenger_analysis'] for p in parts], ignore_index=True),
+        'schedules': pd.concat([p['schedules'] for p in parts], ignore_index=True),
+        'schedule_count': sum(p['schedule_count'] for p in parts),
+        **({'leg_schedules': parts[0]['leg_schedules']} if 'leg_schedules' in parts[0] else {}),
+        **oldest_fetched_at(parts),
+    }
+
+
+def oldest_fetched_at(parts):
+    """구간 결과 중 스케줄 단위 캐시에서 가져온 가장 오래된 조회 시각 ({'fetched_at': ...} 또는 {})"""
+    times = [p['fetched_at'] for p in parts if p.get('fetched_at') is not None]
+    return {'fetched_at': min(times)} if times else {}
+
+
+def build_result(filters, df_schedules, df_total_rooms, df_bookings, df_passengers,
+                 df_room_details, df_vacant_rooms, df_passenger_analysis, multiple_per_day=None):
+    """조회 결과 병합 → 객실/승객 와이드 테이블 + 모달/분석용 데이터
+
+    multiple_per_day: 날짜에 시간 표시 여부 (None이면 df_schedules로 판단, 구간 조회는 전체 기준으로 지정)
+    """
+    is_seat_based = filters.is_seat_based
+
+    # 출발/도착 포트 계산
+    route_ports_info = route_direction_map.get(filters.route, {'first': '-', 'second': '-'})
+    first_port = route_ports_info.get('first', '-')
+    second_port = route_ports_info.get('second', '-')
+
+    # 모든 스케줄 x 모든 등급 조합 생성
+    all_combinations = []
+    for _, schedule in df_schedules.iterrows():
+        direction = schedule.get('direction', '')
+        dep_port = schedule.get('departure_port', '-')
+        # E방향: 첫번째→두번째, W방향: 두번째→첫번째
+        arr_port = second_port if direction == 'E' else (first_port if direction == 'W' else '-')
+
+        for _, grade_info in df_total_rooms.iterrows():
+            all_combinations.append({
+                'schedule_id': schedule['schedule_id'],
+                'date': schedule['date'],
+                'date_display': schedule['date_display'],
+                'weekday': schedule['weekday'],
+                'time_display': schedule.get('time_display', ''),
+                'direction': direction,
+                'departure_port': dep_port,
+                'arrival_port': arr_port,
+                'grade': grade_info['grade'],
+                'total_rooms': grade_info['total_rooms']
+            })
+
+    df_all = pd.DataFrame(all_combinations)
+
+    # 예약 현황 병합
+    df_result = df_all.merge(df_bookings, on=['schedule_id', 'grade'], how='left')
+    df_result['confirmed_rooms'] = df_result['confirmed_rooms'].fillna(0).astype(int)
+    df_result['blocked_rooms'] = df_result['blocked_rooms'].fillna(0).astype(int)
+    df_result['total_rooms'] = df_result['total_rooms'].astype(int)
+
+    # 공실 계산
+    df_result['vacant_rooms'] = df_result['total_rooms'] - df_result['confirmed_rooms'] - df_result['blocked_rooms']
+    df_result['vacant_rooms'] = df_result['vacant_rooms'].clip(lower=0).astype(int)
+
+    # 5. 스케줄별 총계 계산 (하루에 여러 편 운항 고려)
+    df_totals = df_result.groupby(['schedule_id', 'date', 'date_display', 'weekday', 'time_display', 'direction', 'departure_port', 'arrival_port']).agg({
+        'confirmed_rooms': 'sum',
+        'blocked_rooms': 'sum',
+        'vacant_rooms': 'sum'
+    }).reset_index()
+    df_totals['grade'] = '총계'
+
+    # 6. 총계와 등급별 데이터 합치기
+    df_with_totals = pd.concat([df_totals, df_result], ignore_index=True)
+
+    # 7. 날짜+시간 표시 형식 (하루에 여러 편이면 시간 표시)
+    if multiple_per_day is None:
+        multiple_per_day = (df_schedules.groupby('date').size() > 1).any()
+    has_multiple_schedules = multiple_per_day
+
+    if has_multiple_schedules:
+        df_with_totals['날짜'] = df_with_totals['date_display'] + ' ' + df_with_totals['time_display'] + ' (' + df_with_totals['weekday'] + ')'
+    else:
+        df_with_totals['날짜'] = df_with_totals['date_display'] + ' (' + df_with_totals['weekday'] + ')'
+
+    # 8. 등급 순서 정의 (선박/항로별로 다름)
+    grade_order = vessel_grade_order.get(filters.vessel, vessel_grade_order['PSGR'])
+
+    # DB에 있는 등급만 필터링
+    existing_grades = [g for g in grade_order if g in df_with_totals['grade'].unique()]
+    # grade_order에 없는 등급도 추가 (혹시 새로운 등급이 있을 경우)
+    for g in df_with_totals['grade'].unique():
+        if g not in existing_grades and g != '총계':
+            existing_grades.append(g)
+
+    # 9. 스케줄별로 한 행씩 구성 (하루에 여러 편 운항 고려)
+    schedule_order = df_schedules.sort_values('etd')['schedule_id'].unique()
+    result_rows = []
+    for schedule_id in schedule_order:
+        schedule_data = df_with_totals[df_with_totals['schedule_id'] == schedule_id]
+        if schedule_data.empty:
+            continue
+
+        # 총계의 확정+블록이 0이면 스킵 (예약이 하나도 없는 스케줄)
+        total_data = schedule_data[schedule_data['grade'] == '총계']
+        if not total_data.empty:
+            total_confirmed = int(total_data['confirmed_rooms'].iloc[0])
+            total_blocked = int(total_data['blocked_rooms'].iloc[0])
+            if total_confirmed == 0 and total_blocked == 0:
+                continue  # 예약 없는 스케줄 숨기기
+
+        row = {
+            '날짜': schedule_data['날짜'].iloc[0],
+            'schedule_id': schedule_id,
+            'date_raw': str(schedule_data['date'].iloc[0]),
+            'departure_port': schedule_data['departure_port'].iloc[0] if 'departure_port' in schedule_data.columns else '-',
+            'arrival_port': schedule_data['arrival_port'].iloc[0] if 'arrival_port' in schedule_data.columns else '-'
+        }
+
+        for grade in existing_grades:
+            grade_data = schedule_data[schedule_data['grade'] == grade]
+            if not grade_data.empty:
+                row[f'{grade}_확정'] = int(grade_data['confirmed_rooms'].iloc[0])
+                row[f'{grade}_블록'] = int(grade_data['blocked_rooms'].iloc[0])
+                row[f'{grade}_공실'] = int(grade_data['vacant_rooms'].iloc[0])
+            else:
+                row[f'{grade}_확정'] = 0
+                row[f'{grade}_블록'] = 0
+                row[f'{grade}_공실'] = 0
+
+        result_rows.append(row)
+
+    # 10. DataFrame 생성
+    final_df = pd.DataFrame(result_rows)
+
+    # 11. 컬럼 순서 정리 (schedule_id, date_raw, departure_port, arrival_port 유지)
+    ordered_cols = ['날짜', 'schedule_id', 'date_raw', 'departure_port', 'arrival_port']
+    for grade in existing_grades:
+        ordered_cols.extend([f'{grade}_확정', f'{grade}_블록', f'{grade}_공실'])
+
+    final_df = final_df.reindex(columns=ordered_cols)
+
+    # ========== 승객 수 기반 테이블 생성 ==========
+    # 승객 데이터 병합
+    df_pass_result = df_all[['schedule_id', 'date', 'date_display', 'weekday', 'grade', 'total_rooms']].merge(
+        df_passengers, on=['schedule_id', 'grade'], how='left'
+    )
+    df_pass_result['confirmed_passengers'] = df_pass_result['confirmed_passengers'].fillna(0).astype(int)
+    df_pass_result['blocked_passengers'] = df_pass_result['blocked_passengers'].fillna(0).astype(int)
+
+    # 등급별 총 정원 계산 (정원 × 객실수)
+    df_pass_result['capacity'] = df_pass_result['grade'].map(grade_capacity).fillna(2).astype(int)
+    df_pass_result['total_capacity'] = df_pass_result['total_rooms'] * df_pass_result['capacity']
+
+    # 잔여 계산 (총 정원 - 확정 - 블록)
+    df_pass_result['remaining_passengers'] = (
+        df_pass_result['total_capacity'] -
+        df_pass_result['confirmed_passengers'] -
+        df_pass_result['blocked_passengers']
+    ).clip(lower=0).astype(int)
+
+    # 승객 총계 계산 (스케줄별)
+    df_pass_totals = df_pass_result.groupby(['schedule_id', 'date', 'date_display', 'weekday']).agg({
+        'confirmed_passengers': 'sum',
+        'blocked_passengers': 'sum',
+        'remaining_passengers': 'sum'
+    }).reset_index()
+    df_pass_totals['grade'] = '총계'
+
+    # 승객 총계와 등급별 데이터 합치기
+    df_pass_with_totals = pd.concat([df_pass_totals, df_pass_result[['schedule_id', 'date', 'date_display', 'weekday', 'grade', 'confirmed_passengers', 'blocked_passengers', 'remaining_passengers']]], ignore_index=True)
+
+    # 날짜+시간 표시 (객실 탭과 동일)
+    if has_multiple_schedules:
+        schedule_time_map = df_schedules.set_index('schedule_id')['time_display'].to_dict()
+        df_pass_with_totals['time_display'] = df_pass_with_totals['schedule_id'].map(schedule_time_map).fillna('')
+        df_pass_with_totals['날짜'] = df_pass_with_totals['date_display'] + ' ' + df_pass_with_totals['time_display'] + ' (' + df_pass_with_totals['weekday'] + ')'
+    else:
+        df_pass_with_totals['날짜'] = df_pass_with_totals['date_display'] + ' (' + df_pass_with_totals['weekday'] + ')'
+
+    # 스케줄별 출발/도착 포트 매핑
+    schedule_dep_port_map = df_schedules.set_index('schedule_id')['departure_port'].to_dict() if 'departure_port' in df_schedules.columns else {}
+    schedule_direction_map = df_schedules.set_index('schedule_id')['direction'].to_dict() if 'direction' in df_schedules.columns else {}
+
+    pass_result_rows = []
+    for schedule_id in schedule_order:
+        schedule_data = df_pass_with_totals[df_pass_with_totals['schedule_id'] == schedule_id]
+        if schedule_data.empty:
+            continue
+
+        # 총계의 확정+블록이 0이면 스킵 (예약이 하나도 없는 스케줄)
+        total_data = schedule_data[schedule_data['grade'] == '총계']
+        if not total_data.empty:
+            total_confirmed = int(total_data['confirmed_passengers'].iloc[0])
+            total_blocked = int(total_data['blocked_passengers'].iloc[0])
+            if total_confirmed == 0 and total_blocked == 0:
+                continue  # 예약 없는 스케줄 숨기기
+
+        # 출발/도착 포트 계산
+        dep_port = schedule_dep_port_map.get(schedule_id, '-')
+        direction = schedule_direction_map.get(schedule_id, '')
+        arr_port = second_port if direction == 'E' else (first_port if direction == 'W' else '-')
+
+        row = {
+            '날짜': schedule_data['날짜'].iloc[0],
+            'schedule_id': schedule_id,
+            'date_raw': str(schedule_data['date'].iloc[0]),
+            'departure_port': dep_port,
+            'arrival_port': arr_port
+        }
+
+        for grade in existing_grades:
+            grade_data = schedule_data[schedule_data['grade'] == grade]
+
+            if not grade_data.empty:
+                row[f'{grade}_확정'] = int(grade_data['confirmed_passengers'].iloc[0])
+                row[f'{grade}_블록'] = int(grade_data['blocked_passengers'].iloc[0])
+                row[f'{grade}_잔여'] = int(grade_data['remaining_passengers'].iloc[0])
+            else:
+                row[f'{grade}_확정'] = 0
+                row[f'{grade}_블록'] = 0
+                row[f'{grade}_잔여'] = 0
+
+        pass_result_rows.append(row)
+
+    final_df_passengers = pd.DataFrame(pass_result_rows)
+
+    # 객실 상세 데이터 병합 (확정/블록 + 공실)
+    # schedule_id 타입 통일 (정수형)
+    df_room_details['schedule_id'] = df_room_details['schedule_id'].astype(int)
+    df_vacant_rooms['schedule_id'] = df_vacant_rooms['schedule_id'].astype(int)
+    # 빈 프레임은 제외 (타입 지정된 빈 컬럼이 합친 결과의 dtype을 흐리지 않도록)
+    frames = [df for df in (df_room_details, df_vacant_rooms) if not df.empty]
+    df_all_room_details = pd.concat(frames, ignore_index=True) if frames else df_room_details
+
+    return {
+        'final_df': final_df,
+        'final_df_passengers': final_df_passengers,
+        'existing_grades': existing_grades,
+        'start_date': filters.start_date,
+        'end_date': filters.end_date,
+        'vessel_name': filters.vessel,
+        'route_name': filters.route,
+        'room_details': df_all_room_details.to_dict('records'),  # 모달용 데이터
+        'is_seat_based': is_seat_based,  # PSTL/PSGR 좌석 기반 여부
+        'passenger_analysis': df_passenger_analysis,  # 승객 분석 데이터
+        'schedules': df_schedules,  # 스케줄 데이터 (생성처별 분석용)
+        'schedule_count': len(df_schedules),
+    }
@@ -0,0 +1,126 @@
+"""
+화면 실행 1회 프로파일링 (관리자용, cProfile)
+- 주소에 ?profile=1&key=<프로파일 키>를 붙여 열면 이 세션의 "다음" 스크립트 실행 1회를 측정
+  (키: 환경변수 NEOHELIOS_PROFILE_KEY 또는 secrets.toml [admin] profile_key, 둘 다 없으면 기능 꺼짐)
+- 측정한 실행이 끝나면 화면 아래에 함수별 자체/누적 시간 표 + .prof 파일 받기 (snakeviz/flameprof로 flame graph)
+- 화면마다 맨 위 start_profiling(), 맨 아래 finish_profiling(profiler)
+  st.stop() 등으로 맨 아래까지 가지 못한 실행은 다음 실행의 맨 위에 표시
+- 스크립트 스레드만 측정 (백그라운드 갱신 등 다른 스레드의 작업은 대기 시간으로만 보임)
+"""
+
+import cProfile
+import hmac
+import marshal
+import os
+import pstats
+from datetime import datetime
+
+import streamlit as st
+
+TOP_FUNCTIONS = 40
+
+_RUNNING = '_profile_running'   # (profiler, 화면 이름)
+_ARMED = '_profile_armed'
+
+
+def profile_key():
+    key = os.environ.get('NEOHELIOS_PROFILE_KEY')
+    if key:
+        return key
+    try:
+        if st.secrets.load_if_toml_exists():
+            return st.secrets.get('admin', {}).get('profile_key')
+    except Exception:
+        pass
+    return None
+
+
+def _authorized(given):
+    key = profile_key()
+    return bool(key and given and hmac.compare_digest(str(given), str(key)))
+
+
+def start_profiling(page):
+    """이 실행을 측정해야 하면 cProfile을 켜고 (profiler, page) 반환, 아니면 None"""
+    state = st.session_state
+    unfinished = state.pop(_RUNNING, None)
+    if unfinished is not None:
+        unfinished[0].disable()
+        show_profile(*unfinished, note="지난 실행이 화면 중간에서 끝나 여기에 표시합니다.")
+
+    if st.query_params.get('profile') == '1':
+        authorized = _authorized(st.query_params.get('key'))
+        # 키가 주소창/기록에 남지 않도록 바로 지움 (다음 실행부터는 세션 값으로 판단)
+        st.query_params.pop('profile', None)
+        st.query_params.pop('key', None)
+        if authorized:
+            state[_ARMED] = True
+            st.info("🔬 프로파일링 대기: 이 세션의 다음 실행(조회, 화면 이동 등) 1회를 측정합니다.")
+        return None
+
+    if not state.pop(_ARMED, False):
+        return None
+    profiler = cProfile.Profile()
+    state[_RUNNING] = (profiler, page)
+    profiler.enable()
+    return state[_RUNNING]
+
+
+def finish_profiling(run):
+    """start_profiling 결과를 받아 측정을 끝내고 결과 표시 (None이면 아무것도 안 함)"""
+    if run is None:
+        return
+    run[0].disable()
+    st.session_state.pop(_RUNNING, None)
+    show_profile(*run)
+
+
+def _location(filename, line, function):
+    """site-packages/저장소 경로는 줄여서 표시"""
+    if filename == '~':
+        return function   # 내장 함수
+    for marker in ('site-packages/', os.getcwd() + '/'):
+        if marker in filename:
+            filename = filename.split(marker, 1)[1]
+            break
+    return f"{filename}:{line}({function})"
+
+
+def hot_functions(stats, sort='tottime', limit=TOP_FUNCTIONS):
+    """pstats.Stats → 함수별 호출 수/자체 시간/누적 시간 표 (sort: 'tottime' | 'cumtime')"""
+    # 모든 화면이 import하는 모듈이므로 pandas는 측정 결과를 표시할 때만
+    import pandas as pd
+
+    rows = [{
+        '함수': _location(*func),
+        '호출': nc,
+        '자체(ms)': tt * 1000,
+        '누적(ms)': ct * 1000,
+        '호출당(ms)': ct * 1000 / nc if nc else 0,
+    } for func, (cc, nc, tt, ct, callers) in stats.stats.items()]
+    column = {'tottime': '자체(ms)', 'cumtime': '누적(ms)'}[sort]
+    df = pd.DataFrame(rows, columns=['함수', '호출', '자체(ms)', '누적(ms)', '호출당(ms)'])
+    df = df.sort_values(column, ascending=False).head(limit)
+    return df.round(1).reset_index(drop=True)
+
+
+def show_profile(profiler, page, note=None):
+    stats = pstats.Stats(profiler)
+    st.markdown("---")
+    st.markdown(f"#### 🔬 프로파일: {page} ({stats.total_tt * 1000:.0f}ms, 함수 호출 {stats.total_calls:,}회)")
+    if note:
+        st.caption(note)
+    tottime, cumtime = st.tabs(["자체 시간순", "누적 시간순"])
+    with tottime:
+        st.dataframe(hot_functions(stats, 'tottime'), hide_index=True, use_container_width=True)
+    with cumtime:
+        st.dataframe(hot_functions(stats, 'cumtime'), hide_index=True, use_container_width=True)
+    st.download_button(
+        label=".prof 받기",
+        data=marshal.dumps(stats.stats),
+        file_name=f"profile_{datetime.now():%Y%m%d_%H%M%S}.prof",
+        mime="application/octet-stream",
+        key="profile_download",
+    )
+    st.caption("snakeviz/flameprof 등으로 flame graph를 볼 수 있습니다 (pstats 형식). "
+               "다시 측정하려면 주소에 ?profile=1&key=...를 붙여 여세요.")
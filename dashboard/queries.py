@@ -0,0 +1,537 @@
+"""
+조회용 SQL 생성
+- 운영 DB(Azure SQL, T-SQL)와 로컬 대역(SQLite)이 같은 쿼리 구조를 쓰도록 방언 차이만 분리
+- 각 함수는 (sql, params) 튜플을 반환 (params는 ? 자리표시자 순서)
+- SCHEMAS: 쿼리 이름별 결과 컬럼 타입 (columnar.read_typed가 추론 없이 바로 변환)
+"""
+
+
+class TsqlDialect:
+    """Azure SQL (T-SQL) 방언"""
+    name = 'tsql'
+
+    def to_datetime(self, col):
+        # datetimeoffset은 pyodbc가 읽지 못하므로 현지 시각 datetime2로 변환
+        return f"CAST({col} AS DATETIME2(0))"
+
+    def to_date(self, col):
+        return f"CAST({col} AS DATE)"
+
+    def to_text(self, col):
+        return f"CAST({col} AS VARCHAR(20))"
+
+    def values_table(self, ids, alias, column):
+        values = ','.join(f"({int(i)})" for i in ids)
+        return f"(SELECT * FROM (VALUES {values}) AS t({column})) {alias}"
+
+
+class SqliteDialect(TsqlDialect):
+    """로컬 대역 (SQLite) 방언"""
+    name = 'sqlite'
+
+    def to_datetime(self, col):
+        return f"datetime({col})"
+
+    def to_date(self, col):
+        return f"date({col})"
+
+    def to_text(self, col):
+        return f"CAST({col} AS TEXT)"
+
+    def values_table(self, ids, alias, column):
+        values = ','.join(f"({int(i)})" for i in ids)
+        return f"(SELECT column1 AS {column} FROM (VALUES {values})) {alias}"
+
+
+DIALECTS = {
+    'tsql': TsqlDialect(),
+    'sqlite': SqliteDialect(),
+}
+
+
+def id_list(ids):
+    """정수 ID 목록 → IN 절 문자열"""
+    return ','.join(str(int(i)) for i in ids)
+
+
+def arrival_filter(arrival_schedule_ids):
+    """TSL 도착지 필터 (arrival_schedule_id 기준)"""
+    if not arrival_schedule_ids:
+        return ""
+    return f" AND t.arrival_schedule_id IN ({id_list(arrival_schedule_ids)})"
+
+
+# ============================================================
+# neohelios_base
+# ============================================================
+
+def vessels_query(dialect):
+    return "SELECT id, code, name FROM vessels WHERE deleted_at IS NULL AND is_cruise_available = 1 ORDER BY name", ()
+
+
+def routes_query(dialect):
+    return "SELECT id, code, description FROM routes WHERE deleted_at IS NULL ORDER BY code", ()
+
+
+def schedules_query(dialect, route_id, start_date, end_date, direction=None):
+    """항로(+방향)·기간별 스케줄. direction이 None이면 방향 구분 없이 (TSL)"""
+    direction_filter = "AND voy.direction = ?" if direction else ""
+    sql = f"""
+        SELECT
+            cs.id AS schedule_id,
+            {dialect.to_datetime('cs.etd')} AS etd,
+            voy.route_id,
+            voy.direction,
+            ps.port_id AS departure_port_id
+        FROM coastal_schedules cs
+        LEFT JOIN proforma_schedules ps ON cs.proforma_schedule_id = ps.id
+        LEFT JOIN voyages voy ON ps.voyage_id = voy.id
+        WHERE voy.route_id = {int(route_id)}
+          {direction_filter}
+          AND {dialect.to_date('cs.etd')} BETWEEN ? AND ?
+          AND cs.deleted_at IS NULL
+          AND cs.is_cruise_available = 1
+        ORDER BY cs.etd
+    """
+    params = ((direction,) if direction else ()) + (str(start_date), str(end_date))
+    return sql, params
+
+
+def fleet_schedules_query(dialect, route_ids, start_date, end_date):
+    """여러 항로의 기간별 스케줄을 한 번에 (선단 현황용, 방향 구분 없음)"""
+    sql = f"""
+        SELECT
+            cs.id AS schedule_id,
+            {dialect.to_datetime('cs.etd')} AS etd,
+            voy.route_id,
+            voy.direction,
+            ps.port_id AS departure_port_id
+        FROM coastal_schedules cs
+        LEFT JOIN proforma_schedules ps ON cs.proforma_schedule_id = ps.id
+        LEFT JOIN voyages voy ON ps.voyage_id = voy.id
+        WHERE voy.route_id IN ({id_list(route_ids)})
+          AND {dialect.to_date('cs.etd')} BETWEEN ? AND ?
+          AND cs.deleted_at IS NULL
+          AND cs.is_cruise_available = 1
+        ORDER BY cs.etd
+    """
+    return sql, (str(start_date), str(end_date))
+
+
+# ============================================================
+# neohelios_cruise
+# ============================================================
+
+def total_rooms_query(dialect, route_ids):
+    sql = f"""
+        SELECT
+            g.code AS grade,
+            COUNT(*) AS total_rooms
+        FROM rooms r
+        JOIN grades g ON r.grade_id = g.id
+        WHERE g.route_id IN ({id_list(route_ids)})
+          AND r.deleted_at IS NULL
+          AND g.deleted_at IS NULL
+        GROUP BY g.code
+    """
+    return sql, ()
+
+
+def fleet_total_rooms_query(dialect, route_ids):
+    """항로·등급별 전체 객실/좌석 수 (선단 현황용)"""
+    sql = f"""
+        SELECT
+            g.route_id,
+            g.code AS grade,
+            COUNT(*) AS total_rooms
+        FROM rooms r
+        JOIN grades g ON r.grade_id = g.id
+        WHERE g.route_id IN ({id_list(route_ids)})
+          AND r.deleted_at IS NULL
+          AND g.deleted_at IS NULL
+        GROUP BY g.route_id, g.code
+    """
+    return sql, ()
+
+
+def route_rooms_query(dialect, route_ids):
+    """항로의 전체 객실 목록 (PSMC 객실 현황 엔진 inventory.RoomInventory의 객실 색인)"""
+    sql = f"""
+        SELECT
+            g.route_id,
+            g.code AS grade,
+            r.room_number AS room_no
+        FROM rooms r
+        JOIN grades g ON r.grade_id = g.id
+        WHERE g.route_id IN ({id_list(route_ids)})
+          AND r.deleted_at IS NULL
+          AND g.deleted_at IS NULL
+        ORDER BY g.code, r.room_number
+    """
+    return sql, ()
+
+
+def bookings_query(dialect, schedule_ids, is_seat_based, arrival_schedule_ids=None):
+    """예약 현황 (확정, 블록 객실/좌석 수)
+    PSMC (객실 기반): on_boarding_room_id로 객실 연결
+    PSTL/PSGR (좌석 기반): grade_price_detail_by_age_group_id로 등급 연결
+    확정: is_temporary=0, 블록: is_temporary=1, REFUND 상태는 취소 티켓이므로 제외
+    """
+    ids = id_list(schedule_ids)
+    tsl_arrival_filter = arrival_filter(arrival_schedule_ids)
+    if is_seat_based:
+        # 블록 티켓은 on_boarding_room_id가 NULL이므로 등급 가격 경로 사용
+        sql = f"""
+            SELECT
+                t.departure_schedule_id AS schedule_id,
+                g.code AS grade,
+                COUNT(CASE WHEN t.is_temporary = 0 AND t.status NOT LIKE 'REFUND%' THEN 1 END) AS confirmed_rooms,
+                COUNT(CASE WHEN t.is_temporary = 1 AND t.status NOT LIKE 'REFUND%' THEN 1 END) AS blocked_rooms
+            FROM tickets t
+            LEFT JOIN grade_price_detail_by_age_groups gpdag ON t.grade_price_detail_by_age_group_id = gpdag.id
+            LEFT JOIN grade_price_details gpd ON gpdag.grade_price_detail_id = gpd.id
+            LEFT JOIN grade_prices gp ON gpd.grade_price_id = gp.id
+            LEFT JOIN grades g ON gp.grade_id = g.id
+            WHERE t.departure_schedule_id IN ({ids})
+              AND t.deleted_at IS NULL
+              AND t.status NOT LIKE 'REFUND%'
+              AND g.code IS NOT NULL
+              {tsl_arrival_filter}
+            GROUP BY t.departure_schedule_id, g.code
+        """
+    else:
+        sql = f"""
+        WITH room_status AS (
+            SELECT
+                t.departure_schedule_id,
+                t.on_boarding_room_id,
+                g.code AS grade,
+                MAX(CASE
+                    WHEN t.is_temporary = 0
+                         AND t.status NOT LIKE 'REFUND%'
+                    THEN 1
+                    ELSE 0
+                END) AS has_confirmed,
+                MAX(CASE
+                    WHEN t.is_temporary = 1
+                         AND t.status NOT LIKE 'REFUND%'
+                    THEN 1
+                    ELSE 0
+                END) AS has_blocked
+            FROM tickets t
+            INNER JOIN rooms r ON t.on_boarding_room_id = r.id
+            INNER JOIN grades g ON r.grade_id = g.id
+            WHERE t.departure_schedule_id IN ({ids})
+              AND t.deleted_at IS NULL
+              AND r.deleted_at IS NULL
+              AND g.deleted_at IS NULL
+              AND t.on_boarding_room_id IS NOT NULL
+              AND t.status NOT LIKE 'REFUND%'
+                  {tsl_arrival_filter}
+            GROUP BY t.departure_schedule_id, t.on_boarding_room_id, g.code
+        )
+        SELECT
+            departure_schedule_id AS schedule_id,
+            grade,
+            COUNT(CASE WHEN has_confirmed = 1 THEN 1 END) AS confirmed_rooms,
+            COUNT(CASE WHEN has_confirmed = 0 AND has_blocked = 1 THEN 1 END) AS blocked_rooms
+        FROM room_status
+        WHERE grade IS NOT NULL
+        GROUP BY departure_schedule_id, grade
+    """
+    return sql, ()
+
+
+def passenger_counts_query(dialect, schedule_ids, is_seat_based, arrival_schedule_ids=None):
+    """승객 수 (티켓 수 기반)
+    PSMC: 확정=티켓수, 블록=MIN(블록티켓수, 정원)
+    PSTL/PSGR: 1좌석=1승객이므로 좌석 수와 동일
+    """
+    ids = id_list(schedule_ids)
+    tsl_arrival_filter = arrival_filter(arrival_schedule_ids)
+    if is_seat_based:
+        sql = f"""
+            SELECT
+                t.departure_schedule_id AS schedule_id,
+                g.code AS grade,
+                COUNT(CASE WHEN t.is_temporary = 0 AND t.status NOT LIKE 'REFUND%' THEN 1 END) AS confirmed_passengers,
+                COUNT(CASE WHEN t.is_temporary = 1 AND t.status NOT LIKE 'REFUND%' THEN 1 END) AS blocked_passengers
+            FROM tickets t
+            LEFT JOIN grade_price_detail_by_age_groups gpdag ON t.grade_price_detail_by_age_group_id = gpdag.id
+            LEFT JOIN grade_price_details gpd ON gpdag.grade_price_detail_id = gpd.id
+            LEFT JOIN grade_prices gp ON gpd.grade_price_id = gp.id
+            LEFT JOIN grades g ON gp.grade_id = g.id
+            WHERE t.departure_schedule_id IN ({ids})
+              AND t.deleted_at IS NULL
+              AND t.status NOT LIKE 'REFUND%'
+              AND g.code IS NOT NULL
+              {tsl_arrival_filter}
+            GROUP BY t.departure_schedule_id, g.code
+        """
+    else:
+        # 확정: grade_price_detail_by_age_group_id 경로로 등급 조회 (on_boarding_room_id 조건 없음)
+        # 블록: rooms 기반으로 정원 제한 적용
+        sql = f"""
+            WITH confirmed_count AS (
+                SELECT
+                    t.departure_schedule_id,
+                    g.code AS grade,
+                    COUNT(*) AS confirmed_passengers
+                FROM tickets t
+                LEFT JOIN grade_price_detail_by_age_groups gpdag ON t.grade_price_detail_by_age_group_id = gpdag.id
+                LEFT JOIN grade_price_details gpd ON gpdag.grade_price_detail_id = gpd.id
+                LEFT JOIN grade_prices gp ON gpd.grade_price_id = gp.id
+                LEFT JOIN grades g ON gp.grade_id = g.id
+                WHERE t.departure_schedule_id IN ({ids})
+                  AND t.deleted_at IS NULL
+                  AND t.is_temporary = 0
+                  AND t.status NOT LIKE 'REFUND%'
+                  AND g.code IS NOT NULL
+                  {tsl_arrival_filter}
+                GROUP BY t.departure_schedule_id, g.code
+            ),
+            room_blocked AS (
+                SELECT
+                    t.departure_schedule_id,
+                    t.on_boarding_room_id,
+                    g.code AS grade,
+                    COUNT(*) AS blocked_tickets,
+                    CASE
+                        WHEN g.code IN ('OR', 'BS', 'PR') THEN 2
+                        WHEN g.code = 'RS' THEN 3
+                        WHEN g.code IN ('IC', 'OC', 'DA') THEN 4
+                        WHEN g.code = 'GR' THEN 8
+                        ELSE 2
+                    END AS capacity
+                FROM tickets t
+                INNER JOIN rooms r ON t.on_boarding_room_id = r.id
+                INNER JOIN grades g ON r.grade_id = g.id
+                WHERE t.departure_schedule_id IN ({ids})
+                  AND t.deleted_at IS NULL
+                  AND r.deleted_at IS NULL
+                  AND g.deleted_at IS NULL
+                  AND t.on_boarding_room_id IS NOT NULL
+                  AND t.is_temporary = 1
+                  AND t.status NOT LIKE 'REFUND%'
+                  {tsl_arrival_filter}
+                GROUP BY t.departure_schedule_id, t.on_boarding_room_id, g.code
+            ),
+            blocked_count AS (
+                SELECT
+                    departure_schedule_id,
+                    grade,
+                    SUM(CASE WHEN blocked_tickets <= capacity THEN blocked_tickets ELSE capacity END) AS blocked_passengers
+                FROM room_blocked
+                GROUP BY departure_schedule_id, grade
+            )
+            SELECT
+                COALESCE(c.departure_schedule_id, b.departure_schedule_id) AS schedule_id,
+                COALESCE(c.grade, b.grade) AS grade,
+                COALESCE(c.confirmed_passengers, 0) AS confirmed_passengers,
+                COALESCE(b.blocked_passengers, 0) AS blocked_passengers
+            FROM confirmed_count c
+            FULL OUTER JOIN blocked_count b
+                ON c.departure_schedule_id = b.departure_schedule_id
+                AND c.grade = b.grade
+        """
+    return sql, ()
+
+
+def room_details_query(dialect, schedule_ids, is_seat_based, arrival_schedule_ids=None):
+    """객실/좌석별 상세 정보 (모달용)"""
+    ids = id_list(schedule_ids)
+    tsl_arrival_filter = arrival_filter(arrival_schedule_ids)
+    if is_seat_based:
+        # 확정 좌석은 room_number, 블록 좌석은 티켓ID 일부 사용
+        # 도착 스케줄은 TSL 구간 현황용 (티켓 1장 = 좌석 1석이 지나는 구간)
+        sql = f"""
+            SELECT
+                t.departure_schedule_id AS schedule_id,
+                t.arrival_schedule_id,
+                g.code AS grade,
+                COALESCE(r.room_number, {dialect.to_text('t.id')}) AS room_no,
+                CASE
+                    WHEN t.is_temporary = 0 THEN 'confirmed'
+                    WHEN t.is_temporary = 1 THEN 'blocked'
+                END AS status
+            FROM tickets t
+            LEFT JOIN rooms r ON t.on_boarding_room_id = r.id
+            LEFT JOIN grade_price_detail_by_age_groups gpdag ON t.grade_price_detail_by_age_group_id = gpdag.id
+            LEFT JOIN grade_price_details gpd ON gpdag.grade_price_detail_id = gpd.id
+            LEFT JOIN grade_prices gp ON gpd.grade_price_id = gp.id
+            LEFT JOIN grades g ON gp.grade_id = g.id
+            WHERE t.departure_schedule_id IN ({ids})
+              AND t.deleted_at IS NULL
+              AND t.status NOT LIKE 'REFUND%'
+              AND g.code IS NOT NULL
+              {tsl_arrival_filter}
+            ORDER BY schedule_id, grade, room_no
+        """
+    else:
+        sql = f"""
+            WITH room_status AS (
+                SELECT
+                    t.departure_schedule_id,
+                    t.on_boarding_room_id,
+                    r.room_number,
+                    g.code AS grade,
+                    MAX(CASE
+                        WHEN t.is_temporary = 0
+                             AND t.status NOT LIKE 'REFUND%'
+                        THEN 1
+                        ELSE 0
+                    END) AS has_confirmed,
+                    MAX(CASE
+                        WHEN t.is_temporary = 1
+                             AND t.status NOT LIKE 'REFUND%'
+                        THEN 1
+                        ELSE 0
+                    END) AS has_blocked
+                FROM tickets t
+                INNER JOIN rooms r ON t.on_boarding_room_id = r.id
+                INNER JOIN grades g ON r.grade_id = g.id
+                WHERE t.departure_schedule_id IN ({ids})
+                  AND t.deleted_at IS NULL
+                  AND r.deleted_at IS NULL
+                  AND g.deleted_at IS NULL
+                  AND t.on_boarding_room_id IS NOT NULL
+                  AND t.status NOT LIKE 'REFUND%'
+                  {tsl_arrival_filter}
+                GROUP BY t.departure_schedule_id, t.on_boarding_room_id, r.room_number, g.code
+            )
+            SELECT
+                departure_schedule_id AS schedule_id,
+                grade,
+                room_number AS room_no,
+                CASE
+                    WHEN has_confirmed = 1 THEN 'confirmed'
+                    WHEN has_blocked = 1 THEN 'blocked'
+                END AS status
+            FROM room_status
+            WHERE grade IS NOT NULL
+            ORDER BY schedule_id, grade, room_number
+        """
+    return sql, ()
+
+
+def vacant_rooms_query(dialect, schedule_ids, route_ids):
+    """PSMC 공실 목록 (전체 객실에서 예약된 객실 제외)"""
+    sql = f"""
+        SELECT
+            cs.schedule_id,
+            g.code AS grade,
+            r.room_number AS room_no
+        FROM rooms r
+        INNER JOIN grades g ON r.grade_id = g.id
+        CROSS JOIN {dialect.values_table(schedule_ids, 'cs', 'schedule_id')}
+        WHERE g.route_id IN ({id_list(route_ids)})
+          AND r.deleted_at IS NULL
+          AND g.deleted_at IS NULL
+          AND NOT EXISTS (
+              SELECT 1 FROM tickets t
+              WHERE t.on_boarding_room_id = r.id
+                AND t.departure_schedule_id = cs.schedule_id
+                AND t.deleted_at IS NULL
+                AND t.status NOT LIKE 'REFUND%'
+          )
+        ORDER BY schedule_id, grade, room_number
+    """
+    return sql, ()
+
+
+def passenger_analysis_query(dialect, schedule_ids, arrival_schedule_ids=None):
+    """승객 분석 데이터 (확정 승객만)
+    birth_day는 datetimeoffset 타입이라 date로 변환
+    arrival_schedule_id 포함 (생성처별 분석용)
+    """
+    sql = f"""
+        SELECT
+            t.departure_schedule_id AS schedule_id,
+            t.arrival_schedule_id,
+            p.sex,
+            p.nationality,
+            {dialect.to_date('p.birth_day')} AS birth_day,
+            COALESCE(t.is_issued, 0) AS is_issued,
+            t.ticket_number
+        FROM tickets t
+        INNER JOIN reservation_passengers rp ON t.reservation_passenger_id = rp.id
+        INNER JOIN passengers p ON rp.passenger_id = p.id
+        WHERE t.departure_schedule_id IN ({id_list(schedule_ids)})
+          AND t.is_temporary = 0
+          AND t.deleted_at IS NULL
+          AND t.status NOT LIKE 'REFUND%'
+          AND rp.deleted_at IS NULL
+          AND p.deleted_at IS NULL
+          {arrival_filter(arrival_schedule_ids)}
+    """
+    return sql, ()
+
+
+# ============================================================
+# 결과 스키마 (backend.read의 쿼리 이름 → {컬럼: 종류}, 종류는 dashboard.columnar 참고)
+# ============================================================
+
+_SCHEDULE_SCHEMA = {
+    'schedule_id': 'int',
+    'etd': 'datetime',
+    'route_id': 'nint',
+    'direction': 'str',
+    'departure_port_id': 'nint',
+}
+
+_BOOKING_SCHEMA = {
+    'schedule_id': 'int',
+    'grade': 'str',
+    'confirmed_rooms': 'int',
+    'blocked_rooms': 'int',
+}
+
+_PASSENGER_COUNT_SCHEMA = {
+    'schedule_id': 'int',
+    'grade': 'str',
+    'confirmed_passengers': 'int',
+    'blocked_passengers': 'int',
+}
+
+# 객실/좌석 목록은 행 수가 가장 많으므로 반복 문자열은 범주형으로
+_ROOM_LIST_SCHEMA = {
+    'schedule_id': 'int',
+    'arrival_schedule_id': 'nint',   # 좌석 기반만 (TSL 구간 현황)
+    'grade': 'category',
+    'room_no': 'str',
+    'status': 'category',
+}
+
+SCHEMAS = {
+    'schedules': _SCHEDULE_SCHEMA,
+    'fleet_schedules': _SCHEDULE_SCHEMA,
+    'total_rooms': {'grade': 'str', 'total_rooms': 'int'},
+    'fleet_total_rooms': {'route_id': 'int', 'grade': 'str', 'total_rooms': 'int'},
+    'route_rooms': {'route_id': 'int', 'grade': 'str', 'room_no': 'str'},
+    'bookings': _BOOKING_SCHEMA,
+    'passenger_counts': _PASSENGER_COUNT_SCHEMA,
+    'room_details': _ROOM_LIST_SCHEMA,
+    'vacant_rooms': _ROOM_LIST_SCHEMA,
+    'passenger_analysis': {
+        'schedule_id': 'int',
+        'arrival_schedule_id': 'nint',
+        'sex': 'str',
+        'nationality': 'str',
+        'birth_day': 'datetime',
+        'is_issued': 'int',
+        'ticket_number': 'str',
+    },
+}
+
+# 쿼리 비용 등급 (admission: heavy만 동시 실행 수 제한, 없는 이름은 light)
+# heavy: 예약/객실 상태 CTE와 티켓 전체를 훑는 cruise 쿼리
+COST_CLASSES = {
+    'bookings': 'heavy',
+    'passenger_counts': 'heavy',
+    'room_details': 'heavy',
+    'vacant_rooms': 'heavy',
+    'passenger_analysis': 'heavy',
+}
+
+# 기준 정보 쿼리 (거의 바뀌지 않음 → 디스크 캐시(disk_cache)에 두고 dimension_ttl 동안 재사용)
+DIMENSION_QUERIES = {'vessels', 'routes', 'total_rooms', 'fleet_total_rooms', 'route_rooms'}
@@ -0,0 +1,136 @@
+"""
+느린 쿼리 로그 (SQL 실행마다 JSONL 한 줄, 크기 기준 회전)
+- 항목: 시각, 쿼리 이름, 지문(fingerprint), 파라미터, 조회 1건 ID/항로, 스케줄 수, 소요 시간, 행 수, 바이트, 오류
+- 지문: 공백 정규화 + ID 목록(IN (...), VALUES)을 접은 SQL의 해시 → 스케줄 수만 다른 같은 쿼리는 같은 지문
+- 조회 1건 정보(항로/선박/기간)는 pipeline이 begin_request로 알려줌 (스레드별, 조회 밖 쿼리는 비어 있음)
+- 요약: python -m tools.query_log_report
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from datetime import datetime
+from itertools import count
+from logging.handlers import RotatingFileHandler
+
+DEFAULT_PATH = 'local_data/query_log.jsonl'
+DEFAULT_MAX_MB = 20
+DEFAULT_FILES = 5           # 회전해서 남기는 이전 파일 수 (query_log.jsonl.1 ~ .5)
+MAX_PARAM_CHARS = 200
+SAMPLE_ROWS = 1000
+
+# IN (1,2,3) / VALUES (1),(2),(3) → 목록 접기 (SQL은 queries.id_list/values_table 형식)
+_ID_LIST = re.compile(r'\bIN \((\d+(?:,\d+)*)\)')
+_VALUES_LIST = re.compile(r'\bVALUES ((?:\(\d+\),)*\(\d+\))')
+_SCHEDULE_LIST = re.compile(r'schedule_id IN \((\d+(?:,\d+)*)\)')
+
+
+def fingerprint(sql):
+    """(지문, 접은 SQL)"""
+    normalized = ' '.join(sql.split())
+    folded = _VALUES_LIST.sub('VALUES (...)', _ID_LIST.sub('IN (...)', normalized))
+    return hashlib.sha1(folded.encode('utf-8')).hexdigest()[:12], folded
+
+
+def schedule_count(sql):
+    """SQL에 들어간 스케줄 ID 수 (출발 스케줄 IN 목록 또는 VALUES 목록, 없으면 None)"""
+    match = _SCHEDULE_LIST.search(sql)
+    if match:
+        return match.group(1).count(',') + 1
+    match = _VALUES_LIST.search(' '.join(sql.split()))
+    if match:
+        return match.group(1).count('(')
+    return None
+
+
+def frame_bytes(df):
+    """결과 프레임 메모리 크기 추정 (문자열 크기는 앞쪽 SAMPLE_ROWS행으로 추정, 전체 deep 계산은 10만 행에 ~100ms)"""
+    shallow = df.memory_usage(index=False, deep=False).sum()
+    sample = df.iloc[:SAMPLE_ROWS]
+    if sample.empty:
+        return int(shallow)
+    strings = sample.memory_usage(index=False, deep=True).sum() - sample.memory_usage(index=False, deep=False).sum()
+    return int(shallow + strings * len(df) / len(sample))
+
+
+class QueryLog:
+    def __init__(self, path=DEFAULT_PATH, max_bytes=DEFAULT_MAX_MB * 1024 * 1024, files=DEFAULT_FILES):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        # 회전/스레드 잠금은 logging 핸들러에 맡김 (프로세스 하나가 파일 하나를 쓴다는 전제)
+        handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=files, encoding='utf-8')
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        self._logger = logging.Logger(f'neohelios.query_log.{path}')
+        self._logger.addHandler(handler)
+        self._local = threading.local()
+        self._ids = count(1)
+        self._seen = set()   # SQL 원문은 지문별 첫 항목에만 (파일 크기 절약)
+        self._prefix = f'{os.getpid()}-'
+
+    @classmethod
+    def from_env(cls):
+        """환경변수 설정으로 생성 (NEOHELIOS_QUERY_LOG=0이면 None)"""
+        path = os.environ.get('NEOHELIOS_QUERY_LOG') or DEFAULT_PATH
+        if path == '0':
+            return None
+        return cls(
+            path,
+            max_bytes=int(os.environ.get('NEOHELIOS_QUERY_LOG_MB') or DEFAULT_MAX_MB) * 1024 * 1024,
+            files=int(os.environ.get('NEOHELIOS_QUERY_LOG_FILES') or DEFAULT_FILES),
+        )
+
+    def begin_request(self, filters):
+        """이 스레드의 이후 쿼리를 조회 1건(filters)에 묶음"""
+        self._local.request = {
+            'request': f'{self._prefix}{next(self._ids)}',
+            'route': filters.route,
+            'vessel': filters.vessel,
+            'period': f'{filters.start_date}~{filters.end_date}',
+        }
+
+    def end_request(self):
+        self._local.request = None
+
+    def write(self, database, name, sql, params, duration, df=None, error=None):
+        """SQL 실행 1건 기록 (duration: 초, 실패하면 df 없이 error)"""
+        fp, folded = fingerprint(sql)
+        entry = {
+            'ts': datetime.now().isoformat(timespec='milliseconds'),
+            'name': name,
+            'database': database,
+            'fingerprint': fp,
+            'params': [str(p)[:MAX_PARAM_CHARS] for p in params],
+            **(getattr(self._local, 'request', None) or {'request': None, 'route': None}),
+            'schedules': schedule_count(sql),
+            'duration_ms': round(duration * 1000, 2),
+            'rows': len(df) if df is not None else None,
+            'bytes': frame_bytes(df) if df is not None else None,
+        }
+        if fp not in self._seen:
+            self._seen.add(fp)
+            entry['sql'] = folded
+        if error is not None:
+            entry['error'] = f'{type(error).__name__}: {error}'[:MAX_PARAM_CHARS]
+        self._logger.info(json.dumps(entry, ensure_ascii=False))
+
+
+def read_entries(path):
+    """회전된 이전 파일(.N ... .1)부터 현재 파일까지 순서대로 항목 읽기 (깨진 줄은 건너뜀)"""
+    paths = []
+    n = 1
+    while os.path.exists(f'{path}.{n}'):
+        paths.append(f'{path}.{n}')
+        n += 1
+    paths = paths[::-1]
+    if os.path.exists(path):
+        paths.append(path)
+    for file_path in paths:
+        with open(file_path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
@@ -0,0 +1,151 @@
+"""
+DB 응답 기록/재생
+- RecordingBackend: 실제 백엔드를 감싸서 쿼리 텍스트/파라미터/결과 프레임/소요 시간을 디렉터리에 저장
+- ReplayBackend: 저장된 응답을 그대로 돌려줌 (선택: 기록된 지연 시간 재현)
+
+기록 디렉터리 구조:
+    manifest.jsonl      한 줄에 하나씩 request(검색 조건) / query(쿼리) 항목
+    frames/000001.arrow 결과 프레임 (Arrow IPC, zstd 압축)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import asdict
+from datetime import datetime
+
+from dashboard import queries
+from dashboard.backend import DatabaseBackend
+from dashboard.codec import encode_frame, decode_frame
+
+
+class ReplayMissError(KeyError):
+    """기록에 없는 쿼리를 재생하려 함"""
+
+
+def query_key(database, sql, params):
+    """database + 공백 정규화한 SQL + 파라미터 → 조회 키"""
+    normalized = ' '.join(sql.split())
+    raw = json.dumps([database, normalized, [str(p) for p in params]], ensure_ascii=False)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+class RecordingBackend(DatabaseBackend):
+    """inner 백엔드의 응답을 path 디렉터리에 기록"""
+
+    def __init__(self, inner, path):
+        self.inner = inner
+        self.dialect = inner.dialect
+        self.path = path
+        self._lock = threading.Lock()
+        self._seq = 0
+        os.makedirs(os.path.join(path, 'frames'), exist_ok=True)
+        manifest = os.path.join(path, 'manifest.jsonl')
+        if os.path.exists(manifest):
+            # 이어서 기록 (frame 번호 중복 방지)
+            with open(manifest, encoding='utf-8') as f:
+                self._seq = sum(1 for _ in f)
+
+    def _append(self, entry, frame_bytes=None):
+        with self._lock:
+            self._seq += 1
+            entry['seq'] = self._seq
+            if frame_bytes is not None:
+                entry['frame'] = f"frames/{self._seq:06d}.arrow"
+                with open(os.path.join(self.path, entry['frame']), 'wb') as f:
+                    f.write(frame_bytes)
+            with open(os.path.join(self.path, 'manifest.jsonl'), 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+    def begin_request(self, filters):
+        self._append({
+            'type': 'request',
+            'thread': threading.get_ident(),
+            'filters': asdict(filters),
+            'recorded_at': datetime.now().isoformat(timespec='seconds'),
+        })
+        super().begin_request(filters)
+        self.inner.begin_request(filters)
+
+    def _read(self, database, name, sql, params):
+        started = time.perf_counter()
+        df = self.inner._read(database, name, sql, params)
+        wall_ms = (time.perf_counter() - started) * 1000
+        self._append({
+            'type': 'query',
+            'thread': threading.get_ident(),
+            'dialect': self.dialect.name,
+            'database': database,
+            'name': name,
+            'sql': sql,
+            'params': [str(p) for p in params],
+            'key': query_key(database, sql, params),
+            'rows': len(df),
+            'wall_ms': round(wall_ms, 2),
+            'recorded_at': datetime.now().isoformat(timespec='seconds'),
+        }, encode_frame(df))
+        return df
+
+    def check(self):
+        self.inner.check()
+
+    def is_connection_error(self, error):
+        return self.inner.is_connection_error(error)
+
+    def keep_warm(self, database, connections=1):
+        self.inner.keep_warm(database, connections)
+
+    def close(self):
+        self.inner.close()
+
+
+def load_manifest(path):
+    with open(os.path.join(path, 'manifest.jsonl'), encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class ReplayBackend(DatabaseBackend):
+    """기록된 응답 재생
+
+    같은 키가 여러 번 기록됐으면 기록 순서대로 돌려주고, 다 쓰면 마지막 응답을 반복.
+    inject_latency=True면 기록된 wall_ms만큼 대기 후 반환.
+    """
+
+    def __init__(self, path, inject_latency=False, latency_scale=1.0):
+        self.path = path
+        self.inject_latency = inject_latency
+        self.latency_scale = latency_scale
+        self.entries = load_manifest(path)
+        self._lock = threading.Lock()
+        self._by_key = defaultdict(deque)
+        self._last = {}
+        query_entries = [e for e in self.entries if e.get('type') == 'query']
+        for entry in query_entries:
+            self._by_key[entry['key']].append(entry)
+        if query_entries:
+            self.dialect = queries.DIALECTS[query_entries[0]['dialect']]
+
+    @property
+    def requests(self):
+        """기록된 검색 조건 목록"""
+        return [e['filters'] for e in self.entries if e.get('type') == 'request']
+
+    def _read(self, database, name, sql, params):
+        key = query_key(database, sql, params)
+        with self._lock:
+            pending = self._by_key.get(key)
+            if pending:
+                entry = pending.popleft()
+                self._last[key] = entry
+            elif key in self._last:
+                entry = self._last[key]
+            else:
+                raise ReplayMissError(f"기록에 없는 쿼리: {name} ({key[:12]})")
+        with open(os.path.join(self.path, entry['frame']), 'rb') as f:
+            df = decode_frame(f.read())
+        if self.inject_latency:
+            time.sleep(entry['wall_ms'] / 1000 * self.latency_scale)
+        return df
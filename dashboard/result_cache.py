@@ -0,0 +1,162 @@
+"""
+조회 결과 캐시 (stale-while-revalidate, 프로세스당 하나: app_config.get_result_cache)
+- 키: QueryFilters.flight_key (결과가 같은 조건은 같은 키)
+- ttl 안: 그대로 사용
+- ttl 지나고 grace 안: 이전 결과를 바로 돌려주고(화면에 'HH:MM 기준' 표시) 백그라운드에서 다시 조회해 교체
+- grace도 지남: 없는 것으로 보고 새로 조회 (너무 오래된 결과는 보여주지 않음)
+- 항목 수 제한 (오래 안 쓴 것부터 삭제)
+- disk(DiskCache)가 있으면 2단계: 저장할 때 디스크에도 쓰고, 메모리에 없으면 디스크에서 읽음
+  (재시작 직후나 다른 프로세스가 조회한 결과도 바로 사용, 다른 프로세스가 먼저 갱신했으면 그 결과로 교체)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+from dashboard.keepalive import KST
+
+DEFAULT_TTL = 120          # 초
+DEFAULT_GRACE = 900        # ttl 이후 이전 결과를 보여줄 수 있는 시간 (초)
+DEFAULT_MAX_ENTRIES = 16
+
+# 세션이 결과에 덧붙이는 값 (캐시에는 넣지 않음)
+SESSION_KEYS = ('excel_files', 'room_inventory', 'segment_inventory', 'partial', 'cache_key', 'as_of', 'fetched_at', 'stale', 'refresh_failed')
+
+
+class _Entry:
+    def __init__(self, result, fetched_at=None):
+        self.result = result
+        self.fetched_at = fetched_at or datetime.now(KST)
+        # 디스크에서 읽은 결과는 조회 시각 기준으로 나이 계산
+        self.stored = time.monotonic() - (datetime.now(KST) - self.fetched_at).total_seconds()
+
+
+class ResultCache:
+    def __init__(self, ttl=DEFAULT_TTL, grace=DEFAULT_GRACE, max_entries=DEFAULT_MAX_ENTRIES, disk=None):
+        self.ttl = ttl
+        self.grace = grace
+        self.max_entries = max_entries
+        self.disk = disk
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._refreshing = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.disk_hits = 0
+
+    def store(self, key, result):
+        """결과 저장 (세션별 값은 빼고) → 세션용 복사본
+
+        result에 fetched_at이 있으면 (스케줄 단위 캐시에서 가져온 가장 오래된 조회 시각) 그 시각 기준으로 나이 계산.
+        """
+        entry = _Entry({k: v for k, v in result.items() if k not in SESSION_KEYS}, result.get('fetched_at'))
+        if self.ttl > 0:
+            self._put(key, entry)
+            if self.disk is not None:
+                # 압축/쓰기는 화면 응답과 따로 (디스크 오류는 DiskCache가 삼킴)
+                threading.Thread(target=self.disk.put_result, args=(key, entry.result, entry.fetched_at),
+                                 name='neohelios-disk-write', daemon=True).start()
+        return self._session_copy(key, entry, False)
+
+    def _put(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _load(self, key, newer_than=None):
+        """디스크에서 grace 안의 결과를 읽어 메모리에 올림 (newer_than보다 새 것만) → _Entry 또는 None"""
+        if self.disk is None or self.ttl <= 0:
+            return None
+        found = self.disk.get_result(key, self.ttl + self.grace, newer_than)
+        if found is None:
+            return None
+        entry = _Entry(*found)
+        self._put(key, entry)
+        self.disk_hits += 1
+        return entry
+
+    def get(self, key, refresh=None):
+        """세션용 결과 복사본 (없거나 grace도 지났으면 None)
+
+        ttl이 지난 결과면 stale=True로 돌려주고, refresh()가 있으면 백그라운드에서 실행해 교체.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry.stored > self.ttl:
+            # 메모리에 없거나 ttl이 지남 → 재시작 전/다른 프로세스의 더 새 결과가 디스크에 있으면 사용
+            entry = self._load(key, entry.fetched_at if entry is not None else None) or entry
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            age = time.monotonic() - entry.stored
+            if age > self.ttl + self.grace:
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            stale = age > self.ttl
+            if stale:
+                self.stale_hits += 1
+            else:
+                self.hits += 1
+            start_refresh = stale and refresh is not None and key not in self._refreshing
+            if start_refresh:
+                self._refreshing.add(key)
+        if start_refresh:
+            threading.Thread(target=self._refresh, args=(key, refresh), name='neohelios-refresh', daemon=True).start()
+        return self._session_copy(key, entry, stale)
+
+    def newer(self, key, fetched_at):
+        """fetched_at 이후에 저장된 결과가 있으면 세션용 복사본, 없으면 None"""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry.fetched_at <= fetched_at:
+            return None
+        return self._session_copy(key, entry, False)
+
+    def is_refreshing(self, key):
+        with self._lock:
+            return key in self._refreshing
+
+    def _refresh(self, key, refresh):
+        try:
+            self.store(key, refresh())
+            self.refreshes += 1
+        except Exception:
+            pass  # 갱신 실패: 이전 결과는 grace 동안 그대로 (DB 장애는 breaker/keepalive가 표시)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    @staticmethod
+    def _session_copy(key, entry, stale):
+        result = dict(entry.result)
+        result.update(
+            cache_key=key,
+            fetched_at=entry.fetched_at,
+            as_of=entry.fetched_at.strftime('%H:%M'),
+            stale=stale,
+        )
+        return result
+
+    def stats(self):
+        with self._lock:
+            stats = {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'refreshes': self.refreshes,
+                'refreshing': len(self._refreshing),
+                'disk_hits': self.disk_hits,
+            }
+        if self.disk is not None:
+            stats['disk'] = self.disk.stats()
+        return stats
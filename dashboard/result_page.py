@@ -0,0 +1,154 @@
+"""
+조회 결과 화면 공용 (메인 화면의 객실/좌석 현황 + pages/의 승객 현황·승객 분석·생성처별 분석·공실 검색)
+- 조회는 메인 화면에서 하고 결과는 session_state.query_result로 모든 결과 화면이 공유
+- 결과 화면 사이 이동 링크 (기존 탭 자리), 일부 구간 안내, 엑셀 출력
+- 중지된 긴 기간 조회는 받은 구간(session_state.query_parts)을 다음 실행에서 한 번만 합쳐 결과로 남김
+- 엑셀(openpyxl)은 누를 때 만들고 결과에 보관 → 표만 보는 화면은 openpyxl을 import하지 않음
+- 캐시의 만료된 결과면 'HH:MM 기준' 표시, 백그라운드 갱신이 끝나면 새 결과로 교체
+- 객실/좌석 현황 엔진(공실 검색, 좌석 목록), TSL 구간 현황 엔진은 처음 쓸 때 import해서 만들고 결과에 보관
+  (메인 화면이 시작할 때 import하는 모듈이므로 pandas/NumPy를 여기서 읽지 않음)
+"""
+
+import streamlit as st
+
+from dashboard.app_config import get_backend, get_metrics, get_result_cache
+
+MAIN_PAGE = '독립_대시보드_앱.py'
+
+# (화면 스크립트, 링크 이름) - 첫 화면 이름은 선박에 따라 객실/좌석
+RESULT_PAGES = [
+    (MAIN_PAGE, None),
+    ('pages/2_승객_현황.py', "승객"),
+    ('pages/3_승객_분석.py', "📊 승객 분석"),
+    ('pages/4_생성처별_분석.py', "📍 생성처별 분석"),
+    ('pages/5_공실_검색.py', "🔎 공실 검색"),
+    ('pages/6_구간_현황.py', "🧭 구간 현황"),
+]
+
+EXCEL_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# 백그라운드 갱신 완료 확인 간격 (초)
+REFRESH_POLL = 2
+
+
+def keep_partial_result():
+    """중지된 긴 기간 조회가 있으면 그때까지 받은 구간만 합쳐 query_result로"""
+    query_parts = st.session_state.pop('query_parts', None)
+    if query_parts is None:
+        return
+    from dashboard.pipeline import merge_results
+    result = merge_results(query_parts['filters'], query_parts['parts'])
+    result['partial'] = query_parts['partial']
+    st.session_state.query_result = result
+
+
+def require_result():
+    """조회 결과 (아직 조회 전이면 안내 후 화면 중단)"""
+    keep_partial_result()
+    result = st.session_state.get('query_result')
+    if result is None:
+        st.info("조회 결과가 없습니다. 조회 화면에서 먼저 조회하세요.")
+        st.page_link(MAIN_PAGE, label="조회 화면으로", icon="🔍")
+        st.stop()
+    return result
+
+
+def result_header(result):
+    """일부 구간 안내 + 결과 화면 링크 + 엑셀 버튼"""
+    # 조회 중지로 일부 구간만 받은 경우
+    if result.get('partial'):
+        st.info(f"⏸ 조회를 중지하여 일부 구간({result['partial']})만 표시합니다. 전체를 보려면 다시 조회하세요.")
+
+    # 캐시의 만료된 결과 (유예 시간 안)
+    if result.get('stale'):
+        if result.get('refresh_failed'):
+            note = "최신 결과를 받지 못했습니다. 다시 조회하세요."
+        else:
+            note = "최신 결과로 갱신 중..."
+            _refresh_watch()
+        st.markdown(
+            f'<div style="display: inline-block; background: #FFFBEB; color: #B7791F; border: 1px solid #F6E05E; '
+            f'border-radius: 12px; padding: 2px 12px; font-size: 12px; font-weight: 500; margin-bottom: 8px;">'
+            f'🕒 {result["as_of"]} 기준 · {note}</div>',
+            unsafe_allow_html=True,
+        )
+
+    first_name = "좌석" if result.get('is_seat_based') else "객실"
+    cols = st.columns([1, 1, 1.4, 1.6, 1.4, 1.4, 1.6, 1.2])
+    for col, (page, label) in zip(cols, RESULT_PAGES):
+        col.page_link(page, label=label or first_name)
+    with cols[-1]:
+        excel_button(result)
+
+
+def result_inventory(result):
+    """결과의 객실/좌석 현황 엔진 (세션 결과에 보관)
+
+    PSMC 결과의 상세는 공실까지 담고 있어 DB 조회 없음.
+    PSTL/PSGR 결과의 상세는 확정/블록뿐이라 항로 좌석 목록(차원 데이터, 디스크 캐시)을 한 번 읽어 공실 계산.
+    """
+    inventory = result.get('room_inventory')
+    if inventory is None:
+        import pandas as pd
+        from dashboard.inventory import RoomInventory
+
+        df_schedules = result['schedules']
+        schedule_ids = df_schedules['schedule_id'].tolist()
+        if result.get('is_seat_based'):
+            df_rooms = get_backend().fetch_route_rooms(df_schedules['route_id'].unique().tolist())
+            df_details = pd.DataFrame(result.get('room_details', []),
+                                      columns=['schedule_id', 'grade', 'room_no', 'status'])
+            inventory = RoomInventory.build(df_rooms, df_details, schedule_ids)
+        else:
+            inventory = RoomInventory.from_records(result.get('room_details', []), schedule_ids)
+        result['room_inventory'] = inventory
+    return inventory
+
+
+def result_segments(result):
+    """TSL 결과의 구간 현황 엔진 (세션 결과에 보관, DB 조회 없음)"""
+    segments = result.get('segment_inventory')
+    if segments is None:
+        from dashboard.segments import SegmentInventory
+        segments = result['segment_inventory'] = SegmentInventory(
+            result['leg_schedules'], result.get('room_details', []))
+    return segments
+
+
+def excel_button(result):
+    """엑셀 출력: 처음 누를 때 만들어 결과에 보관 (생성처별 시트는 생성처별 분석 화면의 필터 기준)"""
+    origin_filter = st.session_state.get('origin_filter_tab4', '전체')
+    files = result.setdefault('excel_files', {})
+    if origin_filter not in files:
+        if not st.button("엑셀 출력", key="excel_build"):
+            return
+        from dashboard.excel import build_workbook
+        with st.spinner("엑셀 생성 중..."), get_metrics().timer('export_seconds', kind='excel'):
+            files[origin_filter] = build_workbook(result, result['route_name'], origin_filter)
+    st.download_button(
+        label="엑셀 받기",
+        data=files[origin_filter],
+        file_name=f"크루즈현황_{result['start_date']}_{result['end_date']}.xlsx",
+        mime=EXCEL_MIME,
+        key="excel_download_top"
+    )
+
+
+@st.fragment(run_every=REFRESH_POLL)
+def _refresh_watch():
+    """백그라운드 갱신이 끝나면 세션 결과를 새 결과로 바꾸고 화면 전체 재실행
+
+    1.37 fragment는 첫 호출 인자를 계속 쓰므로 인자 없이 session_state의 결과를 읽음.
+    """
+    result = st.session_state.get('query_result')
+    if not result or not result.get('stale') or result.get('refresh_failed'):
+        return
+    cache = get_result_cache()
+    if cache.is_refreshing(result['cache_key']):
+        return
+    fresh = cache.newer(result['cache_key'], result['fetched_at'])
+    if fresh is None:
+        result['refresh_failed'] = True
+    else:
+        st.session_state.query_result = fresh
+    st.rerun()
@@ -0,0 +1,67 @@
+"""
+스케줄 단위 조회 캐시 (프로세스당 하나, app_config에서 backend.schedule_cache로 설정)
+- 스케줄 하나의 cruise 쿼리 결과(예약/승객 수/객실 상세/공실/승객 분석)를 묶어서 보관
+- 키: (schedule_id, 조회 조건 문맥) — 좌석 기반 여부, TSL 도착지 필터
+- 기간이 겹치는 조회(10/1~10/31 다음 10/15~11/15)는 겹친 스케줄을 다시 조회하지 않고
+  새 스케줄만 조회 → 비용이 새로 늘어난 날짜 수에 비례
+- ttl이 지난 스케줄은 다시 조회 (결과 캐시와 같은 기준), 항목 수 제한 (오래 안 쓴 것부터 삭제)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+from dashboard.keepalive import KST
+from dashboard.result_cache import DEFAULT_TTL
+
+DEFAULT_MAX_SCHEDULES = 500   # 스케줄당 승객 분석 행이 수백 개 → 약 50MB
+
+
+class _Piece:
+    def __init__(self, frames):
+        self.frames = frames
+        self.fetched_at = datetime.now(KST)
+        self.stored = time.monotonic()
+
+
+class ScheduleCache:
+    def __init__(self, ttl=DEFAULT_TTL, max_schedules=DEFAULT_MAX_SCHEDULES):
+        self.ttl = ttl
+        self.max_schedules = max_schedules
+        self._lock = threading.Lock()
+        self._pieces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, schedule_ids, context):
+        """ttl 안에 저장된 스케줄만 {schedule_id: _Piece}"""
+        found = {}
+        now = time.monotonic()
+        with self._lock:
+            for schedule_id in schedule_ids:
+                key = (schedule_id, context)
+                piece = self._pieces.get(key)
+                if piece is None or now - piece.stored > self.ttl:
+                    continue
+                self._pieces.move_to_end(key)
+                found[schedule_id] = piece
+            self.hits += len(found)
+            self.misses += len(schedule_ids) - len(found)
+        return found
+
+    def put_many(self, pieces, context):
+        """{schedule_id: {프레임 이름: 프레임}} 저장"""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            for schedule_id, frames in pieces.items():
+                key = (schedule_id, context)
+                self._pieces[key] = _Piece(frames)
+                self._pieces.move_to_end(key)
+            while len(self._pieces) > self.max_schedules:
+                self._pieces.popitem(last=False)
+
+    def stats(self):
+        with self._lock:
+            return {'schedules': len(self._pieces), 'hits': self.hits, 'misses': self.misses}
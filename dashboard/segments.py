@@ -0,0 +1,84 @@
+"""
+TSL 구간 현황 엔진 (부산-이즈하라-히타카츠, 좌석 기반)
+- 한 항차는 구간마다 스케줄이 따로 있음: 동행 PUS→IZH, IZH→HTK / 서행 HTK→IZH, IZH→PUS
+- 티켓 1장 = 출발 스케줄부터 도착 스케줄의 포트 전까지 지나는 구간마다 좌석 1석
+- 포트는 조회한 스케줄의 출발 포트(departure_port)로 판단 (포트 매핑 재조회 없음)
+- 좌석 상세(출발/도착 스케줄, 등급, 상태)를 묶음별 좌석 수로 줄인 뒤,
+  지나는 구간 수만큼 행을 늘려 구간 스케줄에 한 번에 붙임 (merge_asof) → 구간별 점유, 출발지×도착지 행렬
+"""
+
+import numpy as np
+import pandas as pd
+
+from dashboard.constants import TSL_PORT_ORDER
+
+PORTS = TSL_PORT_ORDER['E']
+STATUSES = ('confirmed', 'blocked')
+LEG_TOLERANCE = pd.Timedelta(days=1)   # 출발 스케줄 뒤 이 시간 안의 같은 방향 스케줄만 같은 항차
+
+# '방향|포트' → 기항 순번
+_POSITION = pd.Series({
+    f'{direction}|{port}': i
+    for direction, ports in TSL_PORT_ORDER.items() for i, port in enumerate(ports)
+})
+
+
+class SegmentInventory:
+    def __init__(self, leg_schedules, room_details):
+        """leg_schedules: TSL 스케줄 (schedule_id, etd, direction, departure_port), room_details: 좌석 상세 레코드"""
+        legs = leg_schedules[['schedule_id', 'etd', 'direction', 'departure_port']].copy()
+        legs['etd'] = pd.to_datetime(legs['etd'])
+        self.legs = legs.sort_values('etd', ignore_index=True)
+        ports = legs.set_index('schedule_id')['departure_port']
+
+        df = pd.DataFrame(room_details, columns=['schedule_id', 'arrival_schedule_id', 'grade', 'status'])
+        df = df[df['status'].isin(STATUSES)]
+        df['arrival_port'] = df['arrival_schedule_id'].map(ports)
+        # 티켓 → (출발 스케줄, 도착 포트, 등급, 상태)별 좌석 수
+        tickets = (df.groupby(['schedule_id', 'arrival_port', 'grade', 'status'], dropna=False, observed=True)
+                   .size().rename('seats').reset_index())
+        tickets = tickets.merge(self.legs, on='schedule_id')
+
+        # 출발/도착 기항 순번 (도착 스케줄을 모르거나 거꾸로면 마지막 포트까지)
+        last = len(PORTS) - 1
+        origin = (tickets['direction'] + '|' + tickets['departure_port']).map(_POSITION)
+        destination = (tickets['direction'] + '|' + tickets['arrival_port'].fillna('')).map(_POSITION)
+        tickets = tickets[origin.notna()].copy()
+        tickets['o'] = origin[origin.notna()].astype(int)
+        d = destination[origin.notna()].fillna(last).astype(int)
+        tickets['d'] = np.where(d > tickets['o'], d, last)
+        tickets['destination'] = [TSL_PORT_ORDER[direction][d] for direction, d in zip(tickets['direction'], tickets['d'])]
+        self.tickets = tickets.rename(columns={'departure_port': 'origin'})
+
+    def od_matrix(self, status=None):
+        """출발지 × 도착지 좌석 수 (status: 'confirmed' | 'blocked' | None=둘 다)"""
+        df = self.tickets if status is None else self.tickets[self.tickets['status'] == status]
+        matrix = df.pivot_table(index='origin', columns='destination', values='seats', aggfunc='sum', fill_value=0)
+        return matrix.reindex(index=PORTS, columns=PORTS, fill_value=0).astype(int)
+
+    def leg_occupancy(self):
+        """구간 스케줄·등급별 점유 좌석 (schedule_id, grade, confirmed, blocked)
+
+        지나가는 좌석(PUS→HTK 티켓의 IZH→HTK 구간 등) 포함.
+        """
+        tickets = self.tickets
+        spans = tickets.loc[tickets.index.repeat(tickets['d'] - tickets['o'])]
+        if spans.empty:
+            # 예약 없는 기간 / 출발지=도착지 조회 (빈 leg_port는 float이 되어 merge_asof 불가)
+            return pd.DataFrame({'schedule_id': pd.Series(dtype=int), 'grade': pd.Series(dtype=object),
+                                 **{status: pd.Series(dtype=int) for status in STATUSES}})
+        k = spans['o'] + spans.groupby(level=0).cumcount()
+        spans = spans.assign(leg_port=[TSL_PORT_ORDER[direction][i] for direction, i in zip(spans['direction'], k)])
+        legs = self.legs.rename(columns={'schedule_id': 'leg_schedule_id', 'departure_port': 'leg_port'})
+        spans = pd.merge_asof(
+            spans.sort_values('etd'), legs, on='etd', by=['direction', 'leg_port'],
+            direction='forward', tolerance=LEG_TOLERANCE,
+        ).dropna(subset=['leg_schedule_id'])
+        occupancy = (spans.groupby(['leg_schedule_id', 'grade', 'status'], observed=True)['seats'].sum()
+                     .unstack('status', fill_value=0)
+                     .reindex(columns=list(STATUSES), fill_value=0)
+                     .reset_index()
+                     .rename(columns={'leg_schedule_id': 'schedule_id'}))
+        occupancy['schedule_id'] = occupancy['schedule_id'].astype(int)
+        occupancy.columns.name = None
+        return occupancy
@@ -0,0 +1,68 @@
+"""
+같은 조회의 동시 실행 합치기 (single-flight)
+- 같은 키의 조회가 이미 실행 중이면 새로 실행하지 않고 그 결과를 기다려 같이 받음
+- 결과를 보관하지는 않음: 실행이 끝나면 키가 빠지고, 그 뒤의 조회는 다시 실행
+- 세션 스크립트는 각자 스레드에서 돌기 때문에 스레드 기준 (프로세스당 하나, app_config.get_query_flight)
+"""
+
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.finished = False
+        self.waiters = 0
+
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.executed = 0
+        self.shared = 0
+
+    def do(self, key, fn):
+        """fn() 결과 → (결과, 다른 조회와 공유했는지)
+
+        먼저 온 조회가 fn을 실행하고 같은 키로 그 사이에 온 조회는 끝날 때까지 기다림.
+        fn이 예외를 내면 기다리던 조회도 같은 예외를 받음.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+                self.executed += 1
+            else:
+                call.waiters += 1
+                leader = False
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            if not call.finished:
+                # 먼저 온 조회가 중단됨 (스크립트 중지 등) → 직접 다시 시도
+                return self.do(key, fn)
+            return call.result, True
+
+        try:
+            call.result = fn()
+            call.finished = True
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, call.waiters > 0
+
+    def stats(self):
+        """실행 횟수 / 공유로 끝난 횟수 / 지금 실행 중인 키 수"""
+        with self._lock:
+            return {'executed': self.executed, 'shared': self.shared, 'in_flight': len(self._calls)}
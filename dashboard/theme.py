@@ -0,0 +1,87 @@
+"""
+NEOHELIOS 디자인 시스템 스타일 (메인 화면과 결과 pages/가 함께 사용)
+- 원본은 theme.css, python -m tools.build_assets가 압축 + 버전(내용 해시) 붙인 파일을 static/에 생성
+- 폰트: Noto Sans KR 서브셋(woff2)을 빌드해 커밋했으면 @font-face(font-display: swap)로 자체 서빙,
+  빌드 전이면 외부 폰트 요청 없이 시스템 글꼴(--nh-font 목록: Apple SD Gothic Neo, Malgun Gothic 등)
+- 폰트만 담은 static/fonts.css(이름 고정)는 그리드 iframe이 같은 폰트를 쓰도록 함께 생성
+- 화면에는 <link> 한 줄만 보내고 CSS/폰트는 브라우저 캐시 사용 → 재실행마다 CSS 전체를 다시 보내지 않음
+  (내용 해시가 붙은 파일은 1년 캐시: Streamlit 컴포넌트 경로의 기본 Cache-Control에는 max-age가 없음)
+- 빌드 결과(static/manifest.json)가 없으면 원본 CSS를 인라인으로 적용
+"""
+
+import json
+import os
+import re
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_CSS = os.path.join(_DIR, 'theme.css')
+STATIC_DIR = os.path.join(_DIR, 'static')
+MANIFEST = os.path.join(STATIC_DIR, 'manifest.json')
+FONT_CSS = 'fonts.css'
+
+# 내용 해시가 붙은 빌드 파일 (tools.build_assets: app.<해시>.css, fonts/<이름>.<해시>.woff2)
+HASHED_ASSET = re.compile(r'^(app\.[0-9a-f]{10}\.css|fonts/[\w-]+\.[0-9a-f]{10}\.woff2)$')
+IMMUTABLE_CACHE = 'public, max-age=31536000, immutable'
+
+# 정적 파일 경로만 빌려 쓰는 컴포넌트 (화면에 그리지 않음)
+# component/<이름>/<파일> 경로로 서빙되며 Content-Type이 파일 종류대로 붙음
+# (/app/static은 모든 파일을 text/plain + nosniff로 보내 브라우저가 스타일시트로 쓰지 않음)
+_assets = components.declare_component('assets', path=STATIC_DIR)
+
+
+def asset_url(filename):
+    """static/의 파일 URL (baseUrlPath 아래에서도 맞도록 상대 경로)"""
+    return f"component/{_assets.name}/{filename}"
+
+
+def load_manifest():
+    """빌드 결과 {'css': 파일명, 'fonts': {굵기: 파일명}} (빌드 전이면 None)"""
+    try:
+        with open(MANIFEST, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _style_tag():
+    manifest = load_manifest()
+    if manifest is not None and os.path.exists(os.path.join(STATIC_DIR, manifest['css'])):
+        return f'<link rel="stylesheet" href="{asset_url(manifest["css"])}">'
+    with open(SOURCE_CSS, encoding='utf-8') as f:
+        return f"<style>\n{f.read()}\n</style>"
+
+
+def _cache_hashed_assets():
+    """컴포넌트 경로로 나가는 static/의 해시 파일에 긴 max-age (이름이 내용과 함께 바뀌므로 다시 확인할 필요 없음)
+
+    Streamlit에 응답 헤더를 바꾸는 설정이 없어 ComponentRequestHandler.set_extra_headers를 감쌈.
+    Streamlit 내부 구조가 바뀌어 찾지 못하면 기본 헤더(ETag 재검증) 그대로.
+    """
+    try:
+        from streamlit.web.server.component_request_handler import ComponentRequestHandler
+    except ImportError:
+        return
+    original = getattr(ComponentRequestHandler, 'set_extra_headers', None)
+    if original is None or getattr(original, 'hashed_assets', False):
+        return
+    prefix = f"{_assets.name}/"
+
+    def set_extra_headers(self, path):
+        original(self, path)
+        if path.startswith(prefix) and HASHED_ASSET.match(path[len(prefix):]):
+            self.set_header('Cache-Control', IMMUTABLE_CACHE)
+
+    set_extra_headers.hashed_assets = True
+    ComponentRequestHandler.set_extra_headers = set_extra_headers
+
+
+_cache_hashed_assets()
+APP_STYLE = _style_tag()
+
+
+def apply_theme():
+    """화면 공용 스타일 적용 (화면 스크립트마다 한 번)"""
+    st.markdown(APP_STYLE, unsafe_allow_html=True)
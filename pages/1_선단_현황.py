@@ -0,0 +1,105 @@
+"""
+선단 현황
+- 전체 선박(PSMC/PSTL/PSGR)·항로의 편별 예약 현황을 한 번에 조회 (기본: 내일 출항편)
+- 객실 기반(PSMC)은 객실 수, 좌석 기반(PSTL/PSGR)은 좌석 수 기준
+- 같은 기간은 조회 결과 캐시에서 (만료된 결과는 'HH:MM 기준'으로 보여 주고 백그라운드 갱신)
+"""
+
+import streamlit as st
+from datetime import datetime, timedelta
+
+from dashboard.admission import AdmissionTimeoutError
+from dashboard.app_config import get_backend, get_query_flight, get_result_cache, queue_feedback, db_status_badge
+from dashboard.backend import DatabaseUnavailableError
+from dashboard.fleet import run_fleet_cached
+from dashboard.pipeline import NoScheduleError
+from dashboard.profiling import start_profiling, finish_profiling
+from dashboard.theme import apply_theme
+
+st.set_page_config(page_title="선단 현황", page_icon="favicon.svg", layout="wide", initial_sidebar_state="collapsed")
+apply_theme()
+
+# 관리자 프로파일링 (?profile=1&key=..., 다음 실행 1회)
+profile_run = start_profiling("선단 현황")
+
+st.markdown("""
+<div style="text-align: center; padding: 30px 0 20px 0;">
+    <h1 style="font-size: 28px; font-weight: 700; letter-spacing: -0.5px; color: #232A5E; margin-bottom: 8px; font-family: 'Noto Sans KR', sans-serif;">
+        선단 현황
+    </h1>
+    <p style="font-size: 14px; font-weight: 400; color: #88949C; letter-spacing: -0.5px; font-family: 'Noto Sans KR', sans-serif;">
+        전체 선박·항로 출항편 예약 현황
+    </p>
+</div>
+""", unsafe_allow_html=True)
+db_status_badge()
+
+tomorrow = datetime.today().date() + timedelta(days=1)
+col1, col2, _ = st.columns([2, 2, 4])
+with col1:
+    start_date = st.date_input("출항시작일", tomorrow, key="fleet_start_date")
+with col2:
+    end_date = st.date_input("출항종료일", tomorrow, key="fleet_end_date")
+
+if end_date < start_date:
+    st.warning("⚠️ 출항종료일이 출항시작일보다 빠릅니다.")
+    st.stop()
+
+try:
+    with st.spinner('선단 현황 조회 중...'), queue_feedback():
+        fleet = run_fleet_cached(get_result_cache(), get_query_flight(), get_backend(), start_date, end_date)
+except NoScheduleError as e:
+    st.warning(f"⚠️ {e}")
+    st.stop()
+except AdmissionTimeoutError as e:
+    st.warning(f"⏳ {e}")
+    st.stop()
+except DatabaseUnavailableError as e:
+    st.error(f"❌ {e}")
+    st.stop()
+except Exception as e:
+    st.error(f"❌ 조회 중 오류 발생: {str(e)}")
+    st.stop()
+
+# ========== 선박별 KPI ==========
+for vessel in fleet['vessels'].itertuples():
+    unit = '좌석' if vessel.is_seat_based else '객실'
+    st.markdown(f'<h3 style="color: #232A5E; font-weight: 600; font-size: 16px; margin: 20px 0 8px 0;">{vessel.vessel}</h3>', unsafe_allow_html=True)
+    cols = st.columns(6)
+    cols[0].metric("운항편", f"{vessel.sailings:,}")
+    cols[1].metric(f"확정 {unit}", f"{vessel.confirmed_rooms:,}")
+    cols[2].metric(f"블록 {unit}", f"{vessel.blocked_rooms:,}")
+    cols[3].metric(f"공실 {unit}", f"{vessel.vacant_rooms:,}")
+    cols[4].metric("점유율", f"{vessel.occupancy:.0%}")
+    cols[5].metric("확정 승객", f"{vessel.confirmed_passengers:,}")
+
+st.markdown('<hr style="border: none; height: 1px; background: #e0e0e0; margin: 30px 0;">', unsafe_allow_html=True)
+
+# ========== 항로별 / 편별 ==========
+route_columns = {
+    'vessel': '선박', 'route': '항로', 'sailings': '운항편', 'total_rooms': '전체',
+    'confirmed_rooms': '확정', 'blocked_rooms': '블록', 'vacant_rooms': '공실',
+    'occupancy': '점유율', 'confirmed_passengers': '확정 승객', 'blocked_passengers': '블록 승객',
+}
+sailing_columns = {
+    'vessel': '선박', 'route': '항로', 'date': '출항일', 'weekday': '요일', 'time_display': '시간',
+    'departure_port': '출발', 'direction': '방향', 'total_rooms': '전체',
+    'confirmed_rooms': '확정', 'blocked_rooms': '블록', 'vacant_rooms': '공실',
+    'occupancy': '점유율', 'confirmed_passengers': '확정 승객', 'blocked_passengers': '블록 승객',
+}
+percent = st.column_config.ProgressColumn("점유율", format="%.0f%%", min_value=0, max_value=100)
+
+st.markdown('<h3 style="color: #2d2d2d; font-weight: 600; font-size: 16px; margin-bottom: 12px;">항로별</h3>', unsafe_allow_html=True)
+df_routes = fleet['routes'][list(route_columns)].rename(columns=route_columns)
+df_routes['점유율'] = df_routes['점유율'] * 100
+st.dataframe(df_routes, hide_index=True, use_container_width=True, column_config={'점유율': percent})
+
+st.markdown('<h3 style="color: #2d2d2d; font-weight: 600; font-size: 16px; margin: 20px 0 12px 0;">출항편별</h3>', unsafe_allow_html=True)
+df_sailings = fleet['sailings'][list(sailing_columns)].rename(columns=sailing_columns)
+df_sailings['점유율'] = df_sailings['점유율'] * 100
+st.dataframe(df_sailings, hide_index=True, use_container_width=True, column_config={'점유율': percent})
+
+as_of = f" · {fleet['as_of']} 기준 (최신 결과로 갱신 중)" if fleet.get('stale') else ""
+st.caption(f"{fleet['start_date']} ~ {fleet['end_date']} · 출항편 {fleet['schedule_count']}개 · PSMC는 객실, PSTL/PSGR은 좌석 기준{as_of}")
+
+finish_profiling(profile_run)
@@ -0,0 +1,65 @@
+"""
+승객 현황
+- 메인 화면 조회 결과의 등급별 확정/블록/잔여 승객 수 (가상 스크롤 테이블)
+"""
+
+import streamlit as st
+
+from dashboard.grid import passenger_grid
+from dashboard.profiling import start_profiling, finish_profiling
+from dashboard.result_page import require_result, result_header
+from dashboard.theme import apply_theme
+
+st.set_page_config(page_title="승객 현황", page_icon="favicon.svg", layout="wide", initial_sidebar_state="collapsed")
+
+# 관리자 프로파일링 (?profile=1&key=..., 다음 실행 1회)
+profile_run = start_profiling("승객 현황")
+
+apply_theme()
+
+st.markdown("""
+<div style="text-align: center; padding: 30px 0 20px 0;">
+    <h1 style="font-size: 28px; font-weight: 700; letter-spacing: -0.5px; color: #232A5E; margin-bottom: 8px; font-family: 'Noto Sans KR', sans-serif;">
+        승객 현황
+    </h1>
+    <p style="font-size: 14px; font-weight: 400; color: #88949C; letter-spacing: -0.5px; font-family: 'Noto Sans KR', sans-serif;">
+        등급별 확정 / 블록 / 잔여 승객
+    </p>
+</div>
+""", unsafe_allow_html=True)
+
+result = require_result()
+result_header(result)
+
+final_df_passengers = result['final_df_passengers']
+existing_grades = result['existing_grades']
+
+# 승객 테이블 (가상 스크롤)
+passenger_grid(final_df_passengers, existing_grades, key="passenger_grid")
+
+# 범례 - 승객용 (NEOHELIOS 디자인)
+st.markdown("""
+<div style="margin-top: 24px; padding: 20px; background: #FFFFFF; border-radius: 5px; border: 1px solid #DAE0E3; font-family: 'Noto Sans KR', sans-serif;">
+    <div style="color: #232A5E; font-weight: 700; font-size: 12px; margin-bottom: 16px; letter-spacing: -0.5px;">범례</div>
+    <div class="legend-container" style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 16px;">
+        <div style="display: flex; align-items: center;">
+            <span style="display: inline-block; width: 20px; height: 20px; background: #0E0E2C; border-radius: 3px; margin-right: 10px;"></span>
+            <span style="color: #0E0E2C; font-size: 14px; font-weight: 500;">확정 (명단 입력 완료)</span>
+        </div>
+        <div style="display: flex; align-items: center;">
+            <span style="display: inline-block; width: 20px; height: 20px; background: #88949C; border-radius: 3px; margin-right: 10px;"></span>
+            <span style="color: #88949C; font-size: 14px; font-weight: 500;">블록 (점유 상태, 정원 제한 적용)</span>
+        </div>
+        <div style="display: flex; align-items: center;">
+            <span style="display: inline-block; width: 20px; height: 20px; background: #FFFBEB; border: 1px solid #436CFC; border-radius: 3px; margin-right: 10px;"></span>
+            <span style="color: #436CFC; font-size: 14px; font-weight: 500;">잔여 (예약 가능 인원)</span>
+        </div>
+        <div style="display: flex; align-items: center;">
+            <span style="display: inline-block; width: 20px; height: 20px; background: #EA3336; border-radius: 3px; margin-right: 10px;"></span>
+            <span style="color: #EA3336; font-size: 14px; font-weight: 700;">예약불가 (잔여 0명)</span>
+        </div>
+    </div>
+</div>
+""", unsafe_allow_html=True)
+
+finish_profiling(profile_run)
@@ -0,0 +1,334 @@
+"""
+승객 분석
+- 메인 화면 조회 결과의 확정 승객 분석 (성별/국적/연령대, 발권 상태·생성처 필터)
+- plotly는 이 화면에서만 import
+"""
+
+from datetime import datetime
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from dashboard.profiling import start_profiling, finish_profiling
+from dashboard.result_page import require_result, result_header
+from dashboard.theme import apply_theme
+
+st.set_page_config(page_title="승객 분석", page_icon="favicon.svg", layout="wide", initial_sidebar_state="collapsed")
+
+# 관리자 프로파일링 (?profile=1&key=..., 다음 실행 1회)
+profile_run = start_profiling("승객 분석")
+
+apply_theme()
+
+st.markdown("""
+<div style="text-align: center; padding: 30px 0 20px 0;">
+    <h1 style="font-size: 28px; font-weight: 700; letter-spacing: -0.5px; color: #232A5E; margin-bottom: 8px; font-family: 'Noto Sans KR', sans-serif;">
+        승객 분석
+    </h1>
+    <p style="font-size: 14px; font-weight: 400; color: #88949C; letter-spacing: -0.5px; font-family: 'Noto Sans KR', sans-serif;">
+        확정 승객 성별 / 국적 / 연령대
+    </p>
+</div>
+""", unsafe_allow_html=True)
+
+result = require_result()
+result_header(result)
+
+
+@st.fragment
+def passenger_analysis():
+    """분석 본문 (발권 상태/생성처 필터 변경 시 이 부분만 다시 실행)"""
+    result = st.session_state.query_result
+    df_analysis = result.get('passenger_analysis', pd.DataFrame())
+
+    if df_analysis.empty:
+        st.info("확정된 승객 데이터가 없습니다.")
+    else:
+        # 승객 분석 전용 필터
+        filter_col1, filter_col2, _ = st.columns([2, 2, 6])
+        with filter_col1:
+            issue_options = ['전체', '발권완료', '미발권']
+            selected_issue_status = st.selectbox("발권 상태", issue_options, index=0, key="issue_status_select")
+        with filter_col2:
+            origin_country_options = ['전체', '한국', '일본']
+            selected_origin_country = st.selectbox("생성처", origin_country_options, index=0, key="origin_country_select")
+    
+        # 발권 상태로 필터링
+        if selected_issue_status == '발권완료':
+            df_analysis = df_analysis[df_analysis['is_issued'] == 1].copy()
+        elif selected_issue_status == '미발권':
+            df_analysis = df_analysis[df_analysis['is_issued'] == 0].copy()
+    
+        # 생성처로 필터링 (ticket_number 첫 글자: K=한국, J=일본)
+        if 'ticket_number' in df_analysis.columns:
+            if selected_origin_country == '한국':
+                df_analysis = df_analysis[df_analysis['ticket_number'].str.startswith('K', na=False)].copy()
+            elif selected_origin_country == '일본':
+                df_analysis = df_analysis[df_analysis['ticket_number'].str.startswith('J', na=False)].copy()
+        elif selected_origin_country != '전체':
+            st.warning("생성처 필터를 적용하려면 다시 조회해주세요.")
+    
+        if df_analysis.empty:
+            st.info(f"선택한 조건에 해당하는 승객 데이터가 없습니다.")
+            st.stop()
+    
+        # 데이터 전처리
+        today = datetime.today()
+    
+        # 연령 계산 (birth_day가 있는 경우만)
+        df_analysis = df_analysis.dropna(subset=['birth_day'])
+        df_analysis['birth_day'] = pd.to_datetime(df_analysis['birth_day'], errors='coerce')
+        df_analysis = df_analysis.dropna(subset=['birth_day'])  # 잘못된 날짜 제거
+        df_analysis['age'] = df_analysis['birth_day'].apply(
+            lambda x: (today - x).days // 365 if pd.notna(x) else None
+        )
+    
+        # 연령대 분류
+        def get_age_group(age):
+            if age is None or pd.isna(age):
+                return '미상'
+            elif age < 10:
+                return '0-9세'
+            elif age < 20:
+                return '10대'
+            elif age < 30:
+                return '20대'
+            elif age < 40:
+                return '30대'
+            elif age < 50:
+                return '40대'
+            elif age < 60:
+                return '50대'
+            elif age < 70:
+                return '60대'
+            else:
+                return '70대+'
+    
+        df_analysis['age_group'] = df_analysis['age'].apply(get_age_group)
+    
+        # 국적 코드 -> 국가명 변환
+        nationality_map = {
+            'KR': '한국 🇰🇷',
+            'JP': '일본 🇯🇵',
+            'CN': '중국 🇨🇳',
+            'US': '미국 🇺🇸',
+            'TW': '대만 🇹🇼',
+            'HK': '홍콩 🇭🇰',
+            'VN': '베트남 🇻🇳',
+            'TH': '태국 🇹🇭',
+            'PH': '필리핀 🇵🇭',
+            'MY': '말레이시아 🇲🇾',
+            'SG': '싱가포르 🇸🇬',
+            'ID': '인도네시아 🇮🇩',
+            'AU': '호주 🇦🇺',
+            'CA': '캐나다 🇨🇦',
+            'GB': '영국 🇬🇧',
+            'DE': '독일 🇩🇪',
+            'FR': '프랑스 🇫🇷',
+            'RU': '러시아 🇷🇺'
+        }
+        df_analysis['nationality_name'] = df_analysis['nationality'].map(
+            lambda x: nationality_map.get(x, f'기타 ({x})') if pd.notna(x) else '미상'
+        )
+    
+        # 성별 한글 변환
+        sex_map = {'M': '남성', 'F': '여성'}
+        df_analysis['sex_name'] = df_analysis['sex'].map(
+            lambda x: sex_map.get(x, '미상') if pd.notna(x) else '미상'
+        )
+    
+        # 총 승객 수
+        total_passengers = len(df_analysis)
+    
+        # 헤더 (NEOHELIOS 디자인)
+        st.markdown(f"""
+        <div style="background: #232A5E; padding: 24px; border-radius: 5px; margin-bottom: 24px; font-family: 'Noto Sans KR', sans-serif;">
+            <h2 style="color: #FAFCFE; margin: 0; font-size: 20px; font-weight: 700; letter-spacing: -0.5px;">
+                📊 승객 분석
+            </h2>
+            <p style="color: #9EA8B0; margin: 8px 0 0 0; font-size: 14px; letter-spacing: -0.5px;">
+                조회 기간: {result.get('start_date', '')} ~ {result.get('end_date', '')} | 
+                총 <span style="color: #436CFC; font-weight: 700;">{total_passengers:,}</span>명
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+        # 3개 차트를 나란히 배치
+        col1, col2, col3 = st.columns(3)
+    
+        # === 성별 분포 (도넛 차트) ===
+        with col1:
+            sex_counts = df_analysis['sex_name'].value_counts()
+        
+            # 성별에 따라 색상 매핑 (NEOHELIOS 디자인: 남성=파란색, 여성=분홍색)
+            sex_colors = [('#F48FB1' if s == '여성' else '#436CFC' if s == '남성' else '#9EA8B0') for s in sex_counts.index]
+        
+            fig_sex = go.Figure(data=[go.Pie(
+                labels=sex_counts.index,
+                values=sex_counts.values,
+                hole=0.6,
+                marker=dict(
+                    colors=sex_colors,
+                    line=dict(color='#FFFFFF', width=2)
+                ),
+                textinfo='label+percent',
+                textfont=dict(size=12, family='Noto Sans KR'),
+                hovertemplate='%{label}<br>%{value}명 (%{percent})<extra></extra>'
+            )])
+        
+            fig_sex.update_layout(
+                title=dict(
+                    text='👤 성별 분포',
+                    font=dict(size=16, color='#232A5E', family='Noto Sans KR'),
+                    x=0.5
+                ),
+                showlegend=True,
+                legend=dict(
+                    orientation='h',
+                    yanchor='bottom',
+                    y=-0.15,
+                    xanchor='center',
+                    x=0.5,
+                    font=dict(family='Noto Sans KR', size=12, color='#0E0E2C')
+                ),
+                height=400,
+                margin=dict(t=60, b=60, l=20, r=20),
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)',
+                annotations=[dict(
+                    text=f'<b>{total_passengers:,}</b><br>명',
+                    x=0.5, y=0.5,
+                    font=dict(size=18, color='#232A5E', family='Noto Sans KR'),
+                    showarrow=False
+                )]
+            )
+        
+            st.plotly_chart(fig_sex, use_container_width=True)
+    
+        # === 국적 분포 (가로 막대 차트) ===
+        with col2:
+            nationality_counts = df_analysis['nationality_name'].value_counts().head(10)
+        
+            # NEOHELIOS 색상 그라데이션 (많을수록 짙게)
+            n_colors = len(nationality_counts)
+            # 많은 순서대로 짙은 색 (1.0 -> 0.3)
+            colors = [f'rgba(67, 108, 252, {1.0 - 0.7 * (i / max(n_colors-1, 1))})' for i in range(n_colors)]
+        
+            fig_nat = go.Figure(data=[go.Bar(
+                y=nationality_counts.index[::-1],
+                x=nationality_counts.values[::-1],
+                orientation='h',
+                marker=dict(
+                    color=colors[::-1],
+                    line=dict(color='#FFFFFF', width=1)
+                ),
+                text=nationality_counts.values[::-1],
+                textposition='outside',
+                textfont=dict(size=12, color='#0E0E2C', family='Noto Sans KR'),
+                hovertemplate='%{y}<br>%{x}명<extra></extra>'
+            )])
+        
+            fig_nat.update_layout(
+                title=dict(
+                    text='🌍 국적 분포 (Top 10)',
+                    font=dict(size=16, color='#232A5E', family='Noto Sans KR'),
+                    x=0.5
+                ),
+                xaxis=dict(
+                    title=dict(text='승객 수', font=dict(family='Noto Sans KR', size=12, color='#88949C')),
+                    showgrid=True,
+                    gridcolor='#DAE0E3'
+                ),
+                yaxis=dict(
+                    title='',
+                    tickfont=dict(size=12)
+                ),
+                height=400,
+                margin=dict(t=60, b=40, l=120, r=40),
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)'
+            )
+        
+            st.plotly_chart(fig_nat, use_container_width=True)
+    
+        # === 연령대 분포 (세로 막대 차트) ===
+        with col3:
+            # 연령대 순서 지정
+            age_order = ['0-9세', '10대', '20대', '30대', '40대', '50대', '60대', '70대+', '미상']
+            age_counts = df_analysis['age_group'].value_counts()
+            age_counts = age_counts.reindex([a for a in age_order if a in age_counts.index])
+        
+            # 연령대별 색상 (젊은층: 밝은 색, 고령층: 진한 색)
+            age_colors = ['#81d4fa', '#4fc3f7', '#29b6f6', '#03a9f4', '#039be5', '#0288d1', '#0277bd', '#01579b', '#b0bec5']
+        
+            fig_age = go.Figure(data=[go.Bar(
+                x=age_counts.index,
+                y=age_counts.values,
+                marker=dict(
+                    color=age_colors[:len(age_counts)],
+                    line=dict(color='#ffffff', width=1)
+                ),
+                text=age_counts.values,
+                textposition='outside',
+                textfont=dict(size=12, color='#333333'),
+                hovertemplate='%{x}<br>%{y}명<extra></extra>'
+            )])
+        
+            fig_age.update_layout(
+                title=dict(
+                    text='📈 연령대 분포',
+                    font=dict(size=20, color='#333333'),
+                    x=0.5
+                ),
+                xaxis=dict(
+                    title='연령대',
+                    tickfont=dict(size=11)
+                ),
+                yaxis=dict(
+                    title='승객 수',
+                    showgrid=True,
+                    gridcolor='rgba(0,0,0,0.1)'
+                ),
+                height=400,
+                margin=dict(t=60, b=40, l=40, r=20),
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)'
+            )
+        
+            st.plotly_chart(fig_age, use_container_width=True)
+    
+        # 상세 통계 테이블
+        st.markdown("""
+        <div style="margin-top: 20px; padding: 24px; background: #f8f9fa; border-radius: 8px;">
+            <h4 style="color: #333; margin: 0 0 16px 0; font-size: 18px;">📋 상세 통계</h4>
+        </div>
+        """, unsafe_allow_html=True)
+    
+        stat_col1, stat_col2, stat_col3 = st.columns(3)
+    
+        with stat_col1:
+            st.markdown("**성별 통계**")
+            sex_df = df_analysis['sex_name'].value_counts().reset_index()
+            sex_df.columns = ['성별', '인원']
+            sex_df['비율'] = (sex_df['인원'] / sex_df['인원'].sum() * 100).round(1).astype(str) + '%'
+            st.dataframe(sex_df, hide_index=True, use_container_width=True)
+    
+        with stat_col2:
+            st.markdown("**국적 통계 (Top 10)**")
+            nat_df = df_analysis['nationality_name'].value_counts().head(10).reset_index()
+            nat_df.columns = ['국적', '인원']
+            nat_df['비율'] = (nat_df['인원'] / total_passengers * 100).round(1).astype(str) + '%'
+            st.dataframe(nat_df, hide_index=True, use_container_width=True)
+    
+        with stat_col3:
+            st.markdown("**연령대 통계**")
+            age_df = df_analysis['age_group'].value_counts().reindex([a for a in age_order if a in df_analysis['age_group'].value_counts().index]).reset_index()
+            age_df.columns = ['연령대', '인원']
+            age_df['비율'] = (age_df['인원'] / age_df['인원'].sum() * 100).round(1).astype(str) + '%'
+            st.dataframe(age_df, hide_index=True, use_container_width=True)
+
+
+passenger_analysis()
+
+finish_profiling(profile_run)
@@ -0,0 +1,232 @@
+"""
+생성처별 분석
+- 메인 화면 조회 결과의 편별 국적 구성 (생성처 필터: 티켓 번호 K=한국, J=일본)
+- 생성처 필터는 엑셀의 생성처별 시트에도 적용되므로 필터 변경 시 화면 전체를 다시 실행
+"""
+
+import pandas as pd
+import streamlit as st
+
+from dashboard.constants import route_direction_map
+from dashboard.profiling import start_profiling, finish_profiling
+from dashboard.result_page import require_result, result_header
+from dashboard.theme import apply_theme
+
+st.set_page_config(page_title="생성처별 분석", page_icon="favicon.svg", layout="wide", initial_sidebar_state="collapsed")
+
+# 관리자 프로파일링 (?profile=1&key=..., 다음 실행 1회)
+profile_run = start_profiling("생성처별 분석")
+
+apply_theme()
+
+st.markdown("""
+<div style="text-align: center; padding: 30px 0 20px 0;">
+    <h1 style="font-size: 28px; font-weight: 700; letter-spacing: -0.5px; color: #232A5E; margin-bottom: 8px; font-family: 'Noto Sans KR', sans-serif;">
+        생성처별 분석
+    </h1>
+    <p style="font-size: 14px; font-weight: 400; color: #88949C; letter-spacing: -0.5px; font-family: 'Noto Sans KR', sans-serif;">
+        편별 한국 / 일본 / 기타 국적 승객
+    </p>
+</div>
+""", unsafe_allow_html=True)
+
+result = require_result()
+result_header(result)
+
+df_analysis = result.get('passenger_analysis', pd.DataFrame())
+df_schedules = result.get('schedules', pd.DataFrame())
+
+if df_analysis.empty:
+    st.info("확정된 승객 데이터가 없습니다.")
+else:
+    # 헤더
+    st.markdown("""
+    <div style="background: #232A5E; padding: 24px; border-radius: 5px; margin-bottom: 24px; font-family: 'Noto Sans KR', sans-serif;">
+        <h2 style="color: #FAFCFE; margin: 0; font-size: 20px; font-weight: 700; letter-spacing: -0.5px;">
+            📍 생성처별 분석
+        </h2>
+        <p style="color: #9EA8B0; margin: 8px 0 0 0; font-size: 14px; letter-spacing: -0.5px;">
+            스케줄별 생성처(한국/일본) 승객 현황
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # 생성처 필터 (K: 한국생성, J: 일본생성)
+    origin_filter_col, _ = st.columns([2, 8])
+    with origin_filter_col:
+        origin_filter_options = ["전체", "한국", "일본"]
+        selected_origin_filter = st.selectbox("생성처", origin_filter_options, index=0, key="origin_filter_tab4")
+    
+    # 생성처 분류 함수
+    def get_origin(ticket_number):
+        if pd.isna(ticket_number) or not ticket_number:
+            return '기타'
+        first_char = str(ticket_number)[0].upper()
+        if first_char == 'K':
+            return '한국'
+        elif first_char == 'J':
+            return '일본'
+        else:
+            return '기타'
+    
+    # 생성처 컬럼 추가
+    df_origin = df_analysis.copy()
+    if 'ticket_number' in df_origin.columns:
+        df_origin['origin'] = df_origin['ticket_number'].apply(get_origin)
+    else:
+        df_origin['origin'] = '기타'
+    
+    # 생성처 필터 적용 (ticket_number 기반)
+    if selected_origin_filter != "전체":
+        df_origin = df_origin[df_origin['origin'] == selected_origin_filter].copy()
+    
+    # 국적 분류 (nationality 기반)
+    def get_nationality_group(nationality):
+        if pd.isna(nationality) or not nationality:
+            return '기타 국적'
+        nat_upper = str(nationality).upper()
+        if nat_upper == 'KR':
+            return '한국 국적'
+        elif nat_upper == 'JP':
+            return '일본 국적'
+        else:
+            return '기타 국적'
+    
+    df_origin['nationality_group'] = df_origin['nationality'].apply(get_nationality_group)
+    
+    # 도착 포트 계산
+    # arrival_schedule_id가 있으면 해당 스케줄의 port로 도착지 결정 (TSL, PSGR 등 모든 항로)
+    # 없으면 direction 기반으로 결정
+    route_ports_info = route_direction_map.get(result['route_name'], {'first': '-', 'second': '-'})
+    first_port = route_ports_info.get('first', '-')
+    second_port = route_ports_info.get('second', '-')
+    
+    if not df_schedules.empty and 'arrival_schedule_id' in df_origin.columns:
+        # arrival_schedule_id로 도착 포트 매핑
+        schedule_port_map = df_schedules.set_index('schedule_id')['departure_port'].to_dict()
+        
+        # arrival_schedule_id를 int로 변환 (NaN은 -1로)
+        df_origin['arrival_schedule_id_int'] = pd.to_numeric(df_origin['arrival_schedule_id'], errors='coerce').fillna(-1).astype(int)
+        
+        # arrival_schedule_id의 departure_port가 곧 도착지
+        df_origin['arrival_port'] = df_origin['arrival_schedule_id_int'].map(schedule_port_map)
+        
+        # 매핑 안 된 경우 direction 기반으로 fallback
+        if df_origin['arrival_port'].isna().any() and 'direction' in df_schedules.columns:
+            schedule_direction_map = df_schedules.set_index('schedule_id')['direction'].to_dict()
+            df_origin['direction'] = df_origin['schedule_id'].map(schedule_direction_map)
+            
+            # arrival_port가 NaN인 행만 direction으로 채우기
+            mask = df_origin['arrival_port'].isna()
+            df_origin.loc[mask, 'arrival_port'] = df_origin.loc[mask, 'direction'].apply(
+                lambda d: second_port if d == 'E' else (first_port if d == 'W' else '-')
+            )
+        
+        df_origin['arrival_port'] = df_origin['arrival_port'].fillna('-')
+    elif not df_schedules.empty and 'direction' in df_schedules.columns:
+        # direction 기반 (fallback)
+        schedule_direction_map = df_schedules.set_index('schedule_id')['direction'].to_dict()
+        df_origin['direction'] = df_origin['schedule_id'].map(schedule_direction_map)
+        
+        # E방향: 첫번째→두번째, W방향: 두번째→첫번째
+        df_origin['arrival_port'] = df_origin['direction'].apply(
+            lambda d: second_port if d == 'E' else (first_port if d == 'W' else '-')
+        )
+    else:
+        df_origin['arrival_port'] = '-'
+    
+    # 스케줄+도착포트별 국적 집계
+    if 'arrival_port' in df_origin.columns:
+        origin_summary = df_origin.groupby(['schedule_id', 'arrival_port', 'nationality_group']).size().unstack(fill_value=0).reset_index()
+    else:
+        origin_summary = df_origin.groupby(['schedule_id', 'nationality_group']).size().unstack(fill_value=0).reset_index()
+        origin_summary['arrival_port'] = '-'
+    
+    # 컬럼 정리
+    for col in ['한국 국적', '일본 국적', '기타 국적']:
+        if col not in origin_summary.columns:
+            origin_summary[col] = 0
+    
+    # 스케줄 정보 병합
+    if not df_schedules.empty:
+        schedule_cols = ['schedule_id', 'date', 'time_display', 'departure_port']
+        available_cols = [c for c in schedule_cols if c in df_schedules.columns]
+        schedule_info = df_schedules[available_cols].drop_duplicates()
+        origin_summary = origin_summary.merge(schedule_info, on='schedule_id', how='left')
+        
+        # 날짜 포맷
+        if 'date' in origin_summary.columns:
+            origin_summary['date_display'] = pd.to_datetime(origin_summary['date']).dt.strftime('%m-%d')
+            weekday_map = {0: '월', 1: '화', 2: '수', 3: '목', 4: '금', 5: '토', 6: '일'}
+            origin_summary['weekday'] = pd.to_datetime(origin_summary['date']).dt.dayofweek.map(weekday_map)
+        else:
+            origin_summary['date_display'] = '-'
+            origin_summary['weekday'] = '-'
+        
+        # 총계 계산
+        origin_summary['총계'] = origin_summary['한국 국적'] + origin_summary['일본 국적'] + origin_summary['기타 국적']
+        
+        # 정렬
+        if 'date' in origin_summary.columns and 'time_display' in origin_summary.columns:
+            origin_summary = origin_summary.sort_values(['date', 'time_display', 'arrival_port'])
+        
+        # 테이블 HTML 생성
+        html_origin = '<div class="responsive-table-container"><table style="width: 100%; border-collapse: collapse; background: #FFFFFF; font-family: Noto Sans KR, sans-serif;">'
+        
+        # 헤더
+        html_origin += '''<thead><tr>
+            <th style="background: #232A5E; color: #FAFCFE; padding: 12px 10px; border: none; border-right: 1px solid #3a4a7e; font-weight: 700; font-size: 12px; text-align: center;">날짜</th>
+            <th style="background: #232A5E; color: #FAFCFE; padding: 12px 10px; border: none; border-right: 1px solid #3a4a7e; font-weight: 700; font-size: 12px; text-align: center;">출발</th>
+            <th style="background: #232A5E; color: #FAFCFE; padding: 12px 10px; border: none; border-right: 1px solid #3a4a7e; font-weight: 700; font-size: 12px; text-align: center;">도착</th>
+            <th style="background: #232A5E; color: #FAFCFE; padding: 12px 10px; border: none; border-right: 1px solid #3a4a7e; font-weight: 700; font-size: 12px; text-align: center;">한국 국적</th>
+            <th style="background: #232A5E; color: #FAFCFE; padding: 12px 10px; border: none; border-right: 1px solid #3a4a7e; font-weight: 700; font-size: 12px; text-align: center;">일본 국적</th>
+            <th style="background: #232A5E; color: #FAFCFE; padding: 12px 10px; border: none; border-right: 1px solid #3a4a7e; font-weight: 700; font-size: 12px; text-align: center;">기타 국적</th>
+            <th style="background: #1a2148; color: #FAFCFE; padding: 12px 10px; border: none; font-weight: 700; font-size: 12px; text-align: center;">총계</th>
+        </tr></thead>'''
+        
+        # 바디
+        html_origin += '<tbody>'
+        row_idx = 0
+        for _, row in origin_summary.iterrows():
+            row_bg = '#FFFFFF' if row_idx % 2 == 0 else '#F9FAFB'
+            time_str = row.get('time_display', '') or ''
+            date_str = f"{row.get('date_display', '')} {time_str} ({row.get('weekday', '')})"
+            dep_port = row.get('departure_port', '-') or '-'
+            arr_port = row.get('arrival_port', '-') or '-'
+            kr_count = int(row.get('한국 국적', 0))
+            jp_count = int(row.get('일본 국적', 0))
+            etc_count = int(row.get('기타 국적', 0))
+            total_count = int(row.get('총계', 0))
+            
+            html_origin += f'''<tr style="border-bottom: 1px solid #DAE0E3;">
+                <td style="background: {row_bg}; color: #0E0E2C; padding: 10px; border-right: 1px solid #DAE0E3; font-size: 14px; text-align: center;">{date_str}</td>
+                <td style="background: {row_bg}; color: #0E0E2C; padding: 10px; border-right: 1px solid #DAE0E3; font-size: 14px; text-align: center; font-weight: 500;">{dep_port}</td>
+                <td style="background: {row_bg}; color: #0E0E2C; padding: 10px; border-right: 1px solid #DAE0E3; font-size: 14px; text-align: center; font-weight: 500;">{arr_port}</td>
+                <td style="background: {row_bg}; color: #436CFC; padding: 10px; border-right: 1px solid #DAE0E3; font-size: 14px; text-align: center; font-weight: 600;">{kr_count}</td>
+                <td style="background: {row_bg}; color: #EA3336; padding: 10px; border-right: 1px solid #DAE0E3; font-size: 14px; text-align: center; font-weight: 600;">{jp_count}</td>
+                <td style="background: {row_bg}; color: #88949C; padding: 10px; border-right: 1px solid #DAE0E3; font-size: 14px; text-align: center;">{etc_count}</td>
+                <td style="background: {row_bg}; color: #232A5E; padding: 10px; font-size: 14px; text-align: center; font-weight: 700;">{total_count}</td>
+            </tr>'''
+            row_idx += 1
+        
+        # 합계 row 추가
+        total_kr = origin_summary['한국 국적'].sum()
+        total_jp = origin_summary['일본 국적'].sum()
+        total_etc = origin_summary['기타 국적'].sum()
+        total_all = total_kr + total_jp + total_etc
+        
+        html_origin += f'''<tr style="border-top: 2px solid #232A5E; background: #F3F6FF;">
+            <td colspan="3" style="background: #232A5E; color: #FAFCFE; padding: 12px 10px; border-right: 1px solid #3a4a7e; font-size: 14px; text-align: center; font-weight: 700;">합계</td>
+            <td style="background: #F3F6FF; color: #436CFC; padding: 12px 10px; border-right: 1px solid #DAE0E3; font-size: 14px; text-align: center; font-weight: 700;">{total_kr}</td>
+            <td style="background: #F3F6FF; color: #EA3336; padding: 12px 10px; border-right: 1px solid #DAE0E3; font-size: 14px; text-align: center; font-weight: 700;">{total_jp}</td>
+            <td style="background: #F3F6FF; color: #88949C; padding: 12px 10px; border-right: 1px solid #DAE0E3; font-size: 14px; text-align: center; font-weight: 600;">{total_etc}</td>
+            <td style="background: #232A5E; color: #FAFCFE; padding: 12px 10px; font-size: 14px; text-align: center; font-weight: 700;">{total_all}</td>
+        </tr>'''
+        
+        html_origin += '</tbody></table></div>'
+        
+        st.markdown(html_origin, unsafe_allow_html=True)
+    else:
+        st.warning("스케줄 정보를 찾을 수 없습니다.")
+
+finish_profiling(profile_run)
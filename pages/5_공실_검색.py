@@ -0,0 +1,84 @@
+"""
+공실 검색
+- 메인 화면 조회 결과에서 여러 편(왕복, 연속 주말 등)에 걸쳐 비어 있는 PSMC 객실 검색
+- 조회 결과의 객실 목록으로 만든 객실 현황 엔진(result_page.result_inventory)에서 편별 공실 행을 합산 (DB 조회 없음)
+"""
+
+import time
+
+import streamlit as st
+
+from dashboard.profiling import start_profiling, finish_profiling
+from dashboard.result_page import require_result, result_header, result_inventory
+from dashboard.theme import apply_theme
+
+st.set_page_config(page_title="공실 검색", page_icon="favicon.svg", layout="wide", initial_sidebar_state="collapsed")
+
+# 관리자 프로파일링 (?profile=1&key=..., 다음 실행 1회)
+profile_run = start_profiling("공실 검색")
+
+apply_theme()
+
+st.markdown("""
+<div style="text-align: center; padding: 30px 0 20px 0;">
+    <h1 style="font-size: 28px; font-weight: 700; letter-spacing: -0.5px; color: #232A5E; margin-bottom: 8px; font-family: 'Noto Sans KR', sans-serif;">
+        공실 검색
+    </h1>
+    <p style="font-size: 14px; font-weight: 400; color: #88949C; letter-spacing: -0.5px; font-family: 'Noto Sans KR', sans-serif;">
+        여러 편에 걸쳐 비어 있는 객실
+    </p>
+</div>
+""", unsafe_allow_html=True)
+
+result = require_result()
+result_header(result)
+
+df_schedules = result.get('schedules')
+if result.get('is_seat_based'):
+    st.info("공실 검색은 객실 기반 선박(PSMC)만 지원합니다.")
+    st.stop()
+if df_schedules is None or df_schedules.empty:
+    st.info("조회된 스케줄이 없습니다.")
+    st.stop()
+
+# 객실 현황 엔진은 결과마다 한 번 (세션 결과에 보관)
+inventory = result_inventory(result)
+
+sailings = df_schedules.sort_values('etd')
+labels = {
+    row.schedule_id: f"{row.date_display} {row.time_display} ({row.weekday}) {row.departure_port}발"
+    for row in sailings.itertuples()
+}
+
+col1, col2, col3 = st.columns([5, 3, 2])
+with col1:
+    selected = st.multiselect(
+        "출항편", list(labels), default=list(labels)[:2], format_func=labels.get, key="avail_sailings")
+with col2:
+    grades = st.multiselect("등급", result['existing_grades'], key="avail_grades", placeholder="전체 등급")
+with col3:
+    mode = st.radio("보기", ["모든 편 공실", "공실 편 수 순"], key="avail_mode")
+
+if not selected:
+    st.info("출항편을 하나 이상 선택하세요.")
+    st.stop()
+
+selected = sorted(selected, key=list(labels).index)
+started = time.perf_counter()
+df = inventory.availability(selected, grades)
+elapsed = (time.perf_counter() - started) * 1000
+if mode == "모든 편 공실":
+    df = df[df['free_sailings'] == len(selected)]
+
+grade_order = {grade: i for i, grade in enumerate(result['existing_grades'])}
+df = df.sort_values(['free_sailings', 'grade', 'room_no'], ascending=[False, True, True],
+                    key=lambda s: s.map(grade_order) if s.name == 'grade' else s)
+
+st.caption(f"{len(selected)}편 · 객실 {len(df):,}개 · {elapsed:.1f}ms")
+if df.empty:
+    st.info("조건에 맞는 공실 객실이 없습니다.")
+else:
+    df = df.rename(columns={'grade': '등급', 'room_no': '객실', 'free_sailings': '공실 편수', **labels})
+    st.dataframe(df, hide_index=True, use_container_width=True)
+
+finish_profiling(profile_run)
@@ -0,0 +1,97 @@
+"""
+구간 현황
+- 메인 화면 조회 결과에서 TSL(부산-이즈하라-히타카츠) 구간별 좌석 점유와 출발지 × 도착지 좌석 수
+- 좌석 상세의 출발/도착 스케줄로 구간 현황 엔진(segments.SegmentInventory)을 만들어 계산 (포트 매핑/예약 재조회 없음)
+- 구간 점유에는 지나가는 좌석 포함 (부산→히타카츠 티켓은 이즈하라→히타카츠 구간에도 1석)
+"""
+
+import time
+
+import pandas as pd
+import streamlit as st
+
+from dashboard.admission import AdmissionTimeoutError
+from dashboard.app_config import get_backend
+from dashboard.backend import DatabaseUnavailableError
+from dashboard.breaker import CircuitOpenError
+from dashboard.constants import TSL_PORT_ORDER
+from dashboard.profiling import start_profiling, finish_profiling
+from dashboard.result_page import require_result, result_header, result_segments
+from dashboard.theme import apply_theme
+
+st.set_page_config(page_title="구간 현황", page_icon="favicon.svg", layout="wide", initial_sidebar_state="collapsed")
+
+# 관리자 프로파일링 (?profile=1&key=..., 다음 실행 1회)
+profile_run = start_profiling("구간 현황")
+
+apply_theme()
+
+st.markdown("""
+<div style="text-align: center; padding: 30px 0 20px 0;">
+    <h1 style="font-size: 28px; font-weight: 700; letter-spacing: -0.5px; color: #232A5E; margin-bottom: 8px; font-family: 'Noto Sans KR', sans-serif;">
+        구간 현황
+    </h1>
+    <p style="font-size: 14px; font-weight: 400; color: #88949C; letter-spacing: -0.5px; font-family: 'Noto Sans KR', sans-serif;">
+        TSL 구간별 좌석 점유 / 출발지 × 도착지
+    </p>
+</div>
+""", unsafe_allow_html=True)
+
+result = require_result()
+result_header(result)
+
+if result.get('route_name') != 'TSL':
+    st.info("구간 현황은 TSL(부산-이즈하라-히타카츠) 항로만 지원합니다.")
+    st.stop()
+if 'leg_schedules' not in result:
+    st.info("구간 정보가 없는 이전 조회 결과입니다. 조회 화면에서 다시 조회하세요.")
+    st.stop()
+
+started = time.perf_counter()
+segments = result_segments(result)
+occupancy = segments.leg_occupancy()
+elapsed = (time.perf_counter() - started) * 1000
+
+# 출발지 × 도착지
+st.markdown("#### 출발지 × 도착지")
+status = st.radio("발권 상태", ["전체", "확정", "블록"], horizontal=True, key="segment_status")
+matrix = segments.od_matrix({"전체": None, "확정": 'confirmed', "블록": 'blocked'}[status])
+matrix['합계'] = matrix.sum(axis=1)
+matrix.loc['합계'] = matrix.sum(axis=0)
+matrix.index.name = '출발 \\ 도착'
+matrix.columns.name = None
+st.dataframe(matrix, use_container_width=True)
+st.caption("조회 조건에서 출발지/도착지를 골랐으면 그 조건의 티켓만 집계합니다.")
+
+# 구간별 점유 (정원은 항로 등급별 좌석 수, 차원 데이터)
+st.markdown("#### 구간별 좌석 점유")
+df_schedules = result['schedules'].sort_values('etd')
+try:
+    df_total = get_backend().fetch_total_rooms(df_schedules['route_id'].unique().tolist())
+    capacity = df_total.set_index('grade')['total_rooms'].to_dict()
+except (AdmissionTimeoutError, CircuitOpenError, DatabaseUnavailableError) as e:
+    st.warning(f"정원을 불러오지 못해 점유율 없이 표시합니다: {e}")
+    capacity = {}
+
+grades = [g for g in result['existing_grades'] if g != '총계']
+occupied = occupancy.assign(seats=occupancy['confirmed'] + occupancy['blocked']) \
+    .pivot_table(index='schedule_id', columns='grade', values='seats', aggfunc='sum', fill_value=0, observed=True)
+
+rows = []
+for sailing in df_schedules.itertuples():
+    order = TSL_PORT_ORDER.get(sailing.direction, [])
+    i = order.index(sailing.departure_port) if sailing.departure_port in order else -1
+    leg = f"{sailing.departure_port}→{order[i + 1]}" if 0 <= i < len(order) - 1 else sailing.departure_port
+    row = {'날짜': f"{sailing.date_display} {sailing.time_display} ({sailing.weekday})", '구간': leg}
+    for grade in grades:
+        seats = int(occupied.at[sailing.schedule_id, grade]) if (
+            sailing.schedule_id in occupied.index and grade in occupied.columns) else 0
+        row[f'{grade} 점유'] = seats
+        if capacity.get(grade):
+            row[f'{grade} 점유율(%)'] = round(seats / capacity[grade] * 100, 1)
+    rows.append(row)
+
+st.caption(f"구간 {len(rows)}개 · {elapsed:.1f}ms · 지나가는 좌석 포함")
+st.dataframe(pd.DataFrame(rows), hide_index=True, use_container_width=True)
+
+finish_profiling(profile_run)
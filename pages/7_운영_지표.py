@@ -0,0 +1,113 @@
+"""
+운영 지표
+- 이 프로세스가 뜬 뒤의 조회 소요 시간(항로·단계별), DB 쿼리별 소요 시간/행 수, 엑셀 생성 시간
+- 캐시 적중률/대기열/DB 상태/세션 수와 세션별 session_state 크기
+- 같은 내용의 Prometheus 텍스트 (NEOHELIOS_METRICS_PORT를 주면 /metrics로도 수집 가능)
+"""
+
+import pandas as pd
+import streamlit as st
+
+from dashboard.app_config import get_metrics, metric_sources, db_status_badge
+from dashboard.backend import DatabaseUnavailableError
+from dashboard.metrics import collect_gauges, render_prometheus, session_stats
+from dashboard.profiling import start_profiling, finish_profiling
+from dashboard.theme import apply_theme
+
+st.set_page_config(page_title="운영 지표", page_icon="favicon.svg", layout="wide", initial_sidebar_state="collapsed")
+
+# 관리자 프로파일링 (?profile=1&key=..., 다음 실행 1회)
+profile_run = start_profiling("운영 지표")
+
+apply_theme()
+
+st.markdown("""
+<div style="text-align: center; padding: 30px 0 20px 0;">
+    <h1 style="font-size: 28px; font-weight: 700; letter-spacing: -0.5px; color: #232A5E; margin-bottom: 8px; font-family: 'Noto Sans KR', sans-serif;">
+        운영 지표
+    </h1>
+    <p style="font-size: 14px; font-weight: 400; color: #88949C; letter-spacing: -0.5px; font-family: 'Noto Sans KR', sans-serif;">
+        조회 소요 시간 / DB 쿼리 / 캐시 / 세션 (이 프로세스 기준)
+    </p>
+</div>
+""", unsafe_allow_html=True)
+
+db_status_badge()
+
+try:
+    sources = metric_sources()
+except DatabaseUnavailableError as e:
+    st.error(f"❌ {e}")
+    sources = {}
+metrics = get_metrics()
+histograms = metrics.histograms()
+
+
+def histogram_table(name, labels, unit=1000, suffix='ms'):
+    """name 히스토그램 → 라벨별 건수/p50/p95/최대/평균 표 (unit: 초 → 표시 단위 배율)"""
+    rows = []
+    for metric, label_values, histogram in histograms:
+        if metric != name:
+            continue
+        row = {header: label_values.get(key, '') for key, header in labels.items()}
+        row['건수'] = histogram.count
+        for header, value in (('p50', histogram.quantile(0.5)), ('p95', histogram.quantile(0.95)),
+                              ('최대', histogram.max), ('평균', histogram.sum / histogram.count)):
+            row[f'{header}({suffix})'] = round(value * unit, 1)
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def show(title, table, empty):
+    st.markdown(f"#### {title}")
+    if table.empty:
+        st.caption(empty)
+    else:
+        st.dataframe(table, hide_index=True, use_container_width=True)
+
+
+show("조회 소요 시간", histogram_table('query_seconds', {'route': '항로', 'source': '방식'}),
+     "아직 DB 조회가 없습니다 (캐시에서 받은 조회는 제외).")
+show("조회 단계별 소요 시간", histogram_table('query_stage_seconds', {'route': '항로', 'stage': '단계'}),
+     "아직 DB 조회가 없습니다.")
+
+# DB 쿼리: 소요 시간 + 행 수 + 실패 횟수
+db_table = histogram_table('db_query_seconds', {'query': '쿼리'})
+if not db_table.empty:
+    rows = {labels['query']: histogram for name, labels, histogram in histograms if name == 'db_query_rows'}
+    errors = {labels['query']: value for name, labels, value in metrics.counters() if name == 'db_query_errors_total'}
+    db_table['평균 행 수'] = [round(rows[q].sum / rows[q].count) if q in rows else 0 for q in db_table['쿼리']]
+    db_table['최대 행 수'] = [int(rows[q].max) if q in rows else 0 for q in db_table['쿼리']]
+    db_table['실패'] = [errors.get(q, 0) for q in db_table['쿼리']]
+    db_table = db_table.sort_values('p95(ms)', ascending=False)
+show("DB 쿼리별 소요 시간", db_table, "아직 실행한 DB 쿼리가 없습니다.")
+st.caption("p50/p95는 히스토그램 구간 상한 기준 근삿값 · DB 쿼리 시간은 대기열 대기 제외")
+
+show("엑셀 생성 시간", histogram_table('export_seconds', {'kind': '종류'}), "아직 만든 엑셀이 없습니다.")
+
+# 캐시/대기열/DB 상태 (각 객체의 stats()를 지금 읽은 값)
+st.markdown("#### 캐시 · 대기열 · DB 상태")
+gauges = collect_gauges(**sources, sessions=False)
+st.dataframe(pd.DataFrame([
+    {'지표': name, '라벨': ', '.join(f'{k}={v}' for k, v in labels.items()),
+     '값': round(float(value), 3) if value is not None else None}
+    for name, labels, value in gauges
+]), hide_index=True, use_container_width=True)
+
+# 세션
+st.markdown("#### 세션")
+sizes = session_stats()
+if sizes is None:
+    st.caption("세션 정보를 읽을 수 없습니다 (Streamlit 런타임 밖).")
+else:
+    sessions = pd.DataFrame(sizes, columns=['session', 'bytes']).sort_values('bytes', ascending=False)
+    st.caption(f"활성 세션 {len(sessions)}개 · session_state 합계 {sessions['bytes'].sum() / 1e6:.1f}MB "
+               "(캐시 결과를 공유하는 세션은 중복 집계)")
+    sessions['MB'] = (sessions['bytes'] / 1e6).round(2)
+    st.dataframe(sessions[['session', 'MB']].rename(columns={'session': '세션'}),
+                 hide_index=True, use_container_width=True)
+
+with st.expander("Prometheus 텍스트"):
+    st.code(render_prometheus(metrics, collect_gauges(**sources)), language=None)
+
+finish_profiling(profile_run)
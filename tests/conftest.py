@@ -0,0 +1,16 @@
+from datetime import date
+
+import pytest
+
+from dashboard.local_db import build_local_db
+
+# 테스트용 로컬 대역 DB: 2026-01-01부터 62일 (같은 seed면 같은 데이터)
+LOCAL_DB_START = date(2026, 1, 1)
+LOCAL_DB_DAYS = 62
+
+
+@pytest.fixture(scope='session')
+def local_db(tmp_path_factory):
+    """시드 데이터를 넣은 SQLite 대역 DB 파일 경로 (세션에서 한 번 생성)"""
+    return build_local_db(str(tmp_path_factory.mktemp('db') / 'local.db'),
+                          start_date=LOCAL_DB_START, days=LOCAL_DB_DAYS)
@@ -0,0 +1,95 @@
+import threading
+import time
+
+import pytest
+
+from dashboard import admission
+from dashboard.admission import AdmissionController, AdmissionTimeoutError
+
+HEAVY = 'room_details'   # queries.COST_CLASSES: heavy
+
+
+@pytest.fixture(autouse=True)
+def fast_poll(monkeypatch):
+    monkeypatch.setattr(admission, 'POLL_INTERVAL', 0.01)
+
+
+def wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "시간 초과"
+        time.sleep(0.005)
+
+
+def test_light_queries_bypass():
+    controller = AdmissionController(1)
+    with controller.admit(HEAVY):
+        with controller.admit('vessels'):
+            pass
+    assert controller.stats()['bypassed'] == 1
+
+
+def test_waiters_admitted_in_arrival_order():
+    controller = AdmissionController(1)
+    order = []
+
+    def run(name):
+        with controller.admit(HEAVY):
+            order.append(name)
+
+    threads = []
+    with controller.admit(HEAVY):
+        for i, name in enumerate('abc'):
+            thread = threading.Thread(target=run, args=(name,))
+            thread.start()
+            threads.append(thread)
+            wait_until(lambda: controller.stats()['queued'] == i + 1)
+    for thread in threads:
+        thread.join(5)
+
+    assert order == ['a', 'b', 'c']
+    stats = controller.stats()
+    assert stats['running'] == 0 and stats['queued'] == 0 and stats['max_queued'] == 3
+
+
+def test_timeout_leaves_queue_and_slot_clean():
+    controller = AdmissionController(1, timeout=0.05)
+    errors = []
+
+    def run():
+        try:
+            with controller.admit(HEAVY):
+                pass
+        except AdmissionTimeoutError as e:
+            errors.append(e)
+
+    with controller.admit(HEAVY):
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join(5)
+        assert len(errors) == 1
+        assert controller.stats()['queued'] == 0
+
+    stats = controller.stats()
+    assert stats['running'] == 0 and stats['timeouts'] == 1
+    # 시간 초과로 빠진 자리가 남지 않았으므로 다음 조회는 바로 실행
+    with controller.admit(HEAVY):
+        assert controller.stats()['running'] == 1
+
+
+def test_feedback_reports_position_then_zero():
+    controller = AdmissionController(1)
+    positions = []
+
+    def run():
+        with controller.feedback(lambda position, waited: positions.append(position)):
+            with controller.admit(HEAVY):
+                pass
+
+    with controller.admit(HEAVY):
+        thread = threading.Thread(target=run)
+        thread.start()
+        wait_until(lambda: positions)
+    thread.join(5)
+
+    assert positions == [1, 0]
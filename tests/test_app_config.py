@@ -0,0 +1,61 @@
+import pytest
+from streamlit.runtime.secrets import Secrets
+
+from dashboard import app_config
+from dashboard.backend import make_backend
+
+DATABASE = """
+[database]
+server = "db.example"
+base_database = "base"
+cruise_database = "cruise"
+username = "reader"
+password = "secret"
+"""
+
+
+@pytest.fixture
+def secrets(tmp_path, monkeypatch):
+    """secrets.toml 내용 → app_config가 읽을 st.secrets"""
+    def use(text):
+        path = tmp_path / 'secrets.toml'
+        path.write_text(text, encoding='utf-8')
+        monkeypatch.setattr(app_config.st, 'secrets', Secrets([str(path)]))
+    for name in ('NEOHELIOS_DB_BACKEND', 'NEOHELIOS_LOCAL_DB', 'NEOHELIOS_DB_MAX_HEAVY', 'NEOHELIOS_DB_CAPTURE',
+                 'NEOHELIOS_DB_CONNECT_TIMEOUT', 'NEOHELIOS_DB_QUERY_TIMEOUT', 'NEOHELIOS_REPLAY_DIR'):
+        monkeypatch.delenv(name, raising=False)
+    return use
+
+
+def test_optional_keys_are_read(secrets, tmp_path, local_db):
+    secrets(DATABASE + f"""
+backend = "local"
+local_path = "{local_db}"
+max_heavy_queries = 0
+connect_timeout = 5
+query_timeout = 30
+capture_dir = "{tmp_path / 'capture'}"
+""")
+    config = app_config.load_db_config()
+    assert config['max_heavy_queries'] == 0
+    assert (config['connect_timeout'], config['query_timeout']) == (5, 30)
+    assert app_config.capturing()
+
+    backend = make_backend(config)
+    assert backend.admission is None   # 0 = 제한 없음
+    assert type(backend).__name__ == 'RecordingBackend'
+
+
+def test_missing_optional_keys_are_left_out(secrets):
+    secrets(DATABASE)
+    config = app_config.load_db_config()
+    assert config['backend'] == 'odbc'
+    assert not set(app_config.OPTIONAL_DB_KEYS) & set(config)
+    assert not app_config.capturing()
+
+
+def test_environment_wins(secrets, monkeypatch, local_db):
+    secrets(DATABASE + 'max_heavy_queries = 1\nbackend = "local"\n')
+    monkeypatch.setenv('NEOHELIOS_DB_MAX_HEAVY', '4')
+    monkeypatch.setenv('NEOHELIOS_LOCAL_DB', local_db)
+    assert make_backend(app_config.load_db_config()).admission.max_concurrent == 4
@@ -0,0 +1,59 @@
+import sqlite3
+
+import pytest
+
+from dashboard.backend import DEFAULT_MAX_HEAVY, OdbcBackend, SqliteBackend, with_guards
+
+
+@pytest.fixture
+def pyodbc():
+    # 드라이버 관리자(libodbc)가 없으면 ImportError
+    return pytest.importorskip('pyodbc', exc_type=ImportError)
+
+
+@pytest.fixture
+def sqlite_backend(tmp_path):
+    path = tmp_path / 'local.db'
+    sqlite3.connect(path).close()
+    return SqliteBackend(str(path))
+
+
+def odbc_error(cls, sqlstate, during_connect=False):
+    error = cls(sqlstate, f'[{sqlstate}] test')
+    if during_connect:
+        error.during_connect = True
+    return error
+
+
+def test_link_failures_count(pyodbc):
+    backend = OdbcBackend({})
+    assert backend.is_connection_error(odbc_error(pyodbc.OperationalError, '08001', during_connect=True))
+    assert backend.is_connection_error(odbc_error(pyodbc.OperationalError, '08S01'))
+
+
+def test_timeouts_count_only_during_connect(pyodbc):
+    backend = OdbcBackend({})
+    assert backend.is_connection_error(odbc_error(pyodbc.OperationalError, 'HYT00', during_connect=True))
+    assert not backend.is_connection_error(odbc_error(pyodbc.OperationalError, 'HYT00'))
+    assert not backend.is_connection_error(odbc_error(pyodbc.OperationalError, 'HYT01'))
+
+
+def test_query_errors_do_not_count(pyodbc):
+    backend = OdbcBackend({})
+    assert not backend.is_connection_error(odbc_error(pyodbc.ProgrammingError, '42S02'))
+    assert not backend.is_connection_error(ValueError('08S01'))
+
+
+def test_max_heavy_zero_disables_admission(sqlite_backend, monkeypatch):
+    monkeypatch.delenv('NEOHELIOS_DB_MAX_HEAVY', raising=False)
+    assert with_guards(sqlite_backend, {'max_heavy_queries': 0}).admission is None
+
+
+def test_max_heavy_default(sqlite_backend, monkeypatch):
+    monkeypatch.delenv('NEOHELIOS_DB_MAX_HEAVY', raising=False)
+    assert with_guards(sqlite_backend, {}).admission.max_concurrent == DEFAULT_MAX_HEAVY
+
+
+def test_max_heavy_env_overrides_config(sqlite_backend, monkeypatch):
+    monkeypatch.setenv('NEOHELIOS_DB_MAX_HEAVY', '0')
+    assert with_guards(sqlite_backend, {'max_heavy_queries': 2}).admission is None
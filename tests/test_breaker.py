@@ -0,0 +1,74 @@
+import threading
+import time
+
+import pytest
+
+from dashboard.breaker import CircuitBreaker, CircuitOpenError
+
+
+def wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "시간 초과"
+        time.sleep(0.005)
+
+
+def fail(error):
+    def fn():
+        raise error
+    return fn
+
+
+def test_query_errors_do_not_open():
+    breaker = CircuitBreaker(lambda e: isinstance(e, ConnectionError), probe=lambda: None, failures=2)
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            breaker.call(fail(ValueError('문법 오류')))
+    assert breaker.state == 'closed' and breaker.consecutive == 0
+
+
+def test_success_resets_consecutive_failures():
+    breaker = CircuitBreaker(lambda e: isinstance(e, ConnectionError), probe=lambda: None, failures=2)
+    with pytest.raises(ConnectionError):
+        breaker.call(fail(ConnectionError()))
+    assert breaker.call(lambda: 'ok') == 'ok'
+    with pytest.raises(ConnectionError):
+        breaker.call(fail(ConnectionError()))
+    assert breaker.state == 'closed'
+
+
+def test_open_half_open_closed():
+    probing = threading.Event()
+    release = threading.Event()
+    probes = []
+
+    def probe():
+        probes.append(1)
+        if len(probes) == 1:
+            raise ConnectionError('아직 장애')
+        probing.set()
+        release.wait(5)
+
+    breaker = CircuitBreaker(lambda e: isinstance(e, ConnectionError), probe, failures=2, retry_interval=0.01)
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            breaker.call(fail(ConnectionError('접속 실패')))
+    assert breaker.trips == 1
+
+    # open/half_open 동안은 fn을 실행하지 않고 바로 실패
+    called = []
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: called.append(1))
+    assert not called
+
+    # 첫 재접속 실패 → 다시 open, 두 번째 재접속 중 → half_open
+    assert probing.wait(5)
+    assert breaker.state == 'half_open'
+    assert breaker.last_error == '아직 장애'
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: called.append(1))
+
+    release.set()
+    wait_until(lambda: breaker.state == 'closed')
+    assert breaker.call(lambda: 'ok') == 'ok'
+    assert breaker.stats()['consecutive_failures'] == 0 and breaker.opened_at is None
@@ -0,0 +1,33 @@
+import pandas as pd
+import pytest
+
+from dashboard.codec import DICTIONARY_MIN_ROWS, decode_frame, encode_frame
+
+
+def sample_frame(rows):
+    """DB 응답과 같은 종류의 컬럼: 범주형, NaT 섞인 날짜, 반복/고유 문자열, 결측 포함 정수"""
+    return pd.DataFrame({
+        'schedule_id': pd.Series(range(rows), dtype='int64'),
+        'arrival_schedule_id': pd.array([None if i % 3 else i for i in range(rows)], dtype='Int64'),
+        'grade': pd.Categorical([('STD', 'DLX', 'STE')[i % 3] for i in range(rows)]),
+        'status': pd.Categorical([('vacant', 'hold', None)[i % 3] for i in range(rows)]),
+        'birth_day': pd.to_datetime([None if i % 4 == 0 else f'1990-01-{i % 28 + 1:02d}' for i in range(rows)]),
+        'nationality': [('KOR', 'JPN', None)[i % 3] for i in range(rows)],
+        'ticket_number': [f'T{i:06d}' for i in range(rows)],
+    })
+
+
+@pytest.mark.parametrize('rows', [0, 5, DICTIONARY_MIN_ROWS * 2])
+@pytest.mark.parametrize('dictionary', [True, False])
+def test_round_trip(rows, dictionary):
+    df = sample_frame(rows)
+    pd.testing.assert_frame_equal(decode_frame(encode_frame(df, dictionary=dictionary)), df)
+
+
+def test_dictionary_columns_come_back_as_strings():
+    df = sample_frame(DICTIONARY_MIN_ROWS * 2)
+    decoded = decode_frame(encode_frame(df))
+    assert decoded['nationality'].dtype == object
+    assert decoded['nationality'].isna().sum() == df['nationality'].isna().sum()
+    assert decoded['grade'].dtype == 'category'
+    assert decoded['birth_day'].isna().tolist() == df['birth_day'].isna().tolist()
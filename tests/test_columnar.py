@@ -0,0 +1,23 @@
+import datetime
+import sqlite3
+
+import pandas as pd
+
+from dashboard.columnar import convert_column, read_typed
+
+
+def test_out_of_range_dates_become_nat():
+    iso = convert_column(('0001-01-01', '1990-05-02', None), 'datetime')
+    objects = convert_column((datetime.date(1, 1, 1), datetime.date(1990, 5, 2), None), 'datetime')
+    for series in (iso, objects):
+        assert series.dtype == 'datetime64[ns]'
+        assert series.isna().tolist() == [True, False, True]
+        assert series[1] == pd.Timestamp('1990-05-02')
+
+
+def test_read_typed_with_placeholder_birth_day():
+    conn = sqlite3.connect(':memory:')
+    conn.execute("CREATE TABLE p (id INTEGER, birth_day TEXT)")
+    conn.executemany("INSERT INTO p VALUES (?, ?)", [(1, '0001-01-01'), (2, '1985-12-31')])
+    df = read_typed(conn.cursor(), "SELECT id, birth_day FROM p ORDER BY id", schema={'id': 'int', 'birth_day': 'datetime'})
+    assert df['birth_day'].isna().tolist() == [True, False]
@@ -0,0 +1,78 @@
+import time
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from dashboard.disk_cache import DiskCache
+from dashboard.keepalive import KST
+
+
+def make_result():
+    return {
+        'final_df': pd.DataFrame({'날짜': ['10/19', '10/20'], 'BS_확정': [3, 0]}),
+        'existing_grades': ['BS'],
+        'schedule_count': 2,
+    }
+
+
+def test_result_round_trip(tmp_path):
+    cache = DiskCache(str(tmp_path / 'cache.db'))
+    fetched_at = datetime.now(KST).replace(microsecond=0)
+    cache.put_result('k', make_result(), fetched_at)
+    result, stored_at = cache.get_result('k', max_age=60)
+    pd.testing.assert_frame_equal(result['final_df'], make_result()['final_df'])
+    assert result['existing_grades'] == ['BS'] and result['schedule_count'] == 2
+    assert stored_at == fetched_at
+
+
+def test_result_shared_between_instances(tmp_path):
+    # 다른 프로세스 흉내: 같은 파일을 연 다른 인스턴스
+    path = str(tmp_path / 'cache.db')
+    DiskCache(path).put_result('k', make_result(), datetime.now(KST))
+    assert DiskCache(path).get_result('k', max_age=60) is not None
+
+
+def test_result_too_old_or_not_newer(tmp_path):
+    cache = DiskCache(str(tmp_path / 'cache.db'))
+    fetched_at = datetime.now(KST) - timedelta(seconds=100)
+    cache.put_result('k', make_result(), fetched_at)
+    assert cache.get_result('k', max_age=60) is None
+    assert cache.get_result('k', max_age=600, newer_than=fetched_at) is None
+    assert cache.get_result('k', max_age=600, newer_than=fetched_at - timedelta(seconds=1)) is not None
+
+
+def test_read_through_reads_once(tmp_path):
+    cache = DiskCache(str(tmp_path / 'cache.db'))
+    calls = []
+
+    def read():
+        calls.append(1)
+        return pd.DataFrame({'grade': ['BS', 'DA'], 'rooms': [10, 20]})
+
+    first = cache.read_through('cruise', 'total_rooms', 'SELECT ...', [1], read)
+    second = cache.read_through('cruise', 'total_rooms', 'SELECT ...', [1], read)
+    assert calls == [1]
+    pd.testing.assert_frame_equal(first, second, check_categorical=False)
+    # 파라미터가 다르면 다른 항목
+    cache.read_through('cruise', 'total_rooms', 'SELECT ...', [2], read)
+    assert len(calls) == 2
+
+
+def test_evicts_least_recently_read(tmp_path):
+    cache = DiskCache(str(tmp_path / 'cache.db'))
+    for key in ('a', 'b'):
+        cache.put_result(key, make_result(), datetime.now(KST))
+        time.sleep(0.01)
+    cache.get_result('a', max_age=60)   # a를 최근에 읽음 → b가 먼저 밀려남
+    cache.max_bytes = cache.stats()['bytes']
+    cache.put_result('c', make_result(), datetime.now(KST))
+    assert cache.get_result('b', max_age=60) is None
+    assert cache.get_result('a', max_age=60) is not None and cache.get_result('c', max_age=60) is not None
+    assert cache.stats()['evictions'] == 1
+
+
+def test_broken_file_reads_as_miss(tmp_path):
+    cache = DiskCache(str(tmp_path / 'cache.db'))
+    cache._conn().execute('DROP TABLE entries')
+    assert cache.get_result('k', max_age=60) is None
+    assert cache.stats()['errors'] == 1
@@ -0,0 +1,40 @@
+from datetime import date
+
+import pandas as pd
+
+from dashboard.backend import SqliteBackend
+from dashboard.fleet import run_fleet_cached, run_fleet_overview
+from dashboard.result_cache import ResultCache
+from dashboard.singleflight import SingleFlight
+
+START, END = date(2026, 1, 5), date(2026, 1, 6)
+
+
+class CountingBackend(SqliteBackend):
+    def __init__(self, path):
+        super().__init__(path)
+        self.queries = []
+
+    def _read(self, database, name, sql, params):
+        self.queries.append(name)
+        return super()._read(database, name, sql, params)
+
+
+def test_six_queries_for_the_whole_fleet(local_db):
+    backend = CountingBackend(local_db)
+    fleet = run_fleet_overview(backend, START, END)
+    assert len(backend.queries) == 6
+    assert set(fleet['sailings']['vessel']) == {'PSMC', 'PSTL', 'PSGR'}
+
+
+def test_cached_rerun_sends_no_queries(local_db):
+    backend = CountingBackend(local_db)
+    cache, flight = ResultCache(), SingleFlight()
+    first = run_fleet_cached(cache, flight, backend, START, END)
+    sent = len(backend.queries)
+    second = run_fleet_cached(cache, flight, backend, START, END)
+    assert len(backend.queries) == sent
+    pd.testing.assert_frame_equal(first['sailings'], second['sailings'])
+    # 다른 기간은 새로 조회
+    run_fleet_cached(cache, flight, backend, START, START)
+    assert len(backend.queries) == 2 * sent
@@ -0,0 +1,26 @@
+import subprocess
+import sys
+
+
+def loaded_after_import(module, candidates):
+    """새 인터프리터에서 module만 import한 뒤 candidates 중 읽힌 모듈"""
+    code = (f"import sys, {module}; "
+            f"print(' '.join(m for m in {list(candidates)!r} if m in sys.modules))")
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+    return output.split()
+
+
+def test_result_page_defers_room_inventory():
+    # 메인 화면이 시작할 때 읽는 모듈: 객실 현황 엔진은 공실 검색/좌석 목록을 처음 쓸 때
+    assert loaded_after_import('dashboard.result_page', ['dashboard.inventory']) == []
+
+
+def test_result_page_defers_pandas():
+    # 구간 현황 엔진도 처음 쓸 때 → 첫 화면에서는 pandas/NumPy를 읽지 않음 (pandas는 첫 조회 때)
+    modules = ['dashboard.segments', 'pandas', 'numpy']
+    assert loaded_after_import('dashboard.result_page', modules) == []
+
+
+def test_profiling_defers_pandas():
+    # 모든 화면이 import (프로파일링을 켜지 않으면 pandas를 읽지 않음)
+    assert loaded_after_import('dashboard.profiling', ['pandas']) == []
@@ -0,0 +1,138 @@
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from dashboard.backend import SqliteBackend
+from dashboard.constants import route_map
+from dashboard.inventory import SEAT_PAGE_SIZE, RoomInventory, encode_seats
+
+START = date(2026, 1, 1)   # conftest.local_db 시작일
+
+
+@pytest.fixture(scope='module')
+def backend(local_db):
+    return SqliteBackend(local_db)
+
+
+@pytest.fixture(scope='module', params=['BOC', 'ONC', 'KSC'])
+def route(request, backend):
+    schedules = backend.fetch_schedules(route_map[request.param], START, date(2026, 1, 15))
+    schedule_ids = schedules['schedule_id'].tolist()
+    route_ids = schedules['route_id'].unique().tolist()
+    assert schedule_ids
+    inventory = RoomInventory.build(backend.fetch_route_rooms(route_ids),
+                                    backend.fetch_room_details(schedule_ids, False), schedule_ids)
+    return schedule_ids, route_ids, inventory
+
+
+def test_vacant_rooms_match_sql(backend, route):
+    schedule_ids, route_ids, inventory = route
+    expected = backend.fetch_vacant_rooms(schedule_ids, route_ids)
+    actual = inventory.vacant_rooms()
+    assert not expected.empty
+    pd.testing.assert_frame_equal(actual.astype({'grade': str}), expected.astype({'grade': str}))
+
+
+def test_counts_match_bookings_sql(backend, route):
+    schedule_ids, _, inventory = route
+    expected = backend.fetch_bookings(schedule_ids, False)
+    columns = ['schedule_id', 'grade']
+    actual = inventory.counts().sort_values(columns).reset_index(drop=True)
+    expected = expected.sort_values(columns).reset_index(drop=True)
+    pd.testing.assert_frame_equal(actual.astype({'grade': str}), expected.astype({'grade': str}), check_dtype=False)
+
+
+def test_from_records_round_trip(route):
+    schedule_ids, _, inventory = route
+    details = [
+        {'schedule_id': s, 'grade': g, 'room_no': r, 'status': status}
+        for status in ('confirmed', 'blocked', 'vacant')
+        for s, g, r in zip(*_rooms(inventory, status))
+    ]
+    rebuilt = RoomInventory.from_records(details, schedule_ids)
+    pd.testing.assert_frame_equal(rebuilt.vacant_rooms(), inventory.vacant_rooms())
+    pd.testing.assert_frame_equal(rebuilt.counts(), inventory.counts())
+
+
+def _rooms(inventory, status):
+    rows, cols = inventory.mask(status).nonzero()
+    return inventory.schedule_ids[rows], inventory.grades[cols], inventory.room_nos[cols]
+
+
+def test_availability_matches_vacant_rooms_sql(backend, route):
+    schedule_ids, route_ids, inventory = route
+    chosen = schedule_ids[:4]
+    vacant = backend.fetch_vacant_rooms(chosen, route_ids).astype({'grade': str})
+    rooms = backend.fetch_route_rooms(route_ids)[['grade', 'room_no']].drop_duplicates()
+    free = vacant.groupby(['grade', 'room_no']).size().rename('expected')
+    expected = rooms.merge(free, on=['grade', 'room_no'], how='left').fillna({'expected': 0})
+
+    actual = inventory.availability(chosen)
+    assert len(actual) == len(rooms)
+    assert actual['free_sailings'].is_monotonic_decreasing
+    merged = actual.astype({'grade': str}).merge(expected, on=['grade', 'room_no'], validate='one_to_one')
+    assert (merged['free_sailings'] == merged['expected']).all()
+    # 편별 공실 여부 컬럼 = 그 편의 공실 목록
+    for schedule_id in chosen:
+        in_sql = set(map(tuple, vacant.loc[vacant['schedule_id'] == schedule_id, ['grade', 'room_no']].to_numpy()))
+        flagged = set(map(tuple, actual.loc[actual[schedule_id], ['grade', 'room_no']].to_numpy()))
+        assert flagged == in_sql
+
+
+def test_availability_grade_filter(route):
+    schedule_ids, _, inventory = route
+    grade = inventory.grades[0]
+    everything = inventory.availability(schedule_ids[:3])
+    filtered = inventory.availability(schedule_ids[:3], grades=[grade])
+    assert set(filtered['grade']) == {grade}
+    pd.testing.assert_frame_equal(
+        filtered.reset_index(drop=True),
+        everything[everything['grade'] == grade].reset_index(drop=True))
+
+
+@pytest.fixture(scope='module')
+def seats(backend):
+    """TSL 좌석 엔진 (결과 화면처럼 항로 좌석 목록 + 확정/블록 상세)"""
+    schedules = backend.fetch_schedules(route_map['TSL'], START, date(2026, 1, 8))
+    schedule_ids = schedules['schedule_id'].tolist()
+    df_rooms = backend.fetch_route_rooms(schedules['route_id'].unique().tolist())
+    return RoomInventory.build(df_rooms, backend.fetch_room_details(schedule_ids, True), schedule_ids)
+
+
+def test_encode_seats():
+    assert encode_seats(['ECM-12A', 'ECM-12B', 'ECM-12C', 'ECM-12D']) == [['ECM-12', 'A-D', 4]]
+    numbers = [str(n) for n in range(1001, 1025)] + ['1030']
+    assert encode_seats(numbers) == [['', '1001-1024,1030', 25]]
+    assert encode_seats(['ECM-1A', 'ECM-1C', 'ECM-2A', 'PRM-1A']) == [
+        ['ECM-1', 'A,C', 2], ['ECM-2', 'A', 1], ['PRM-1', 'A', 1]]
+    assert encode_seats([]) == []
+
+
+@pytest.mark.parametrize('status', ['confirmed', 'blocked', 'vacant'])
+def test_pages_cover_the_cell(seats, status):
+    schedule_id = int(seats.schedule_ids[0])
+    expected = seats.rooms(schedule_id, 'ECM', status)
+    assert expected
+
+    pages = []
+    cursor = 0
+    while cursor is not None:
+        page = seats.page(schedule_id, 'ECM', status, cursor)
+        assert page['total'] == len(expected)
+        pages.append(page)
+        cursor = page['cursor']
+    assert [page['count'] for page in pages[:-1]] == [SEAT_PAGE_SIZE] * (len(pages) - 1)
+    assert 0 < pages[-1]['count'] <= SEAT_PAGE_SIZE
+    assert sum(page['count'] for page in pages) == len(expected)
+    for i, page in enumerate(pages):
+        assert page['seats'] == encode_seats(expected[i * SEAT_PAGE_SIZE:(i + 1) * SEAT_PAGE_SIZE])
+
+
+def test_page_of_empty_cell(seats):
+    schedule_id = int(seats.schedule_ids[0])
+    empty = {'seats': [], 'count': 0, 'total': 0, 'cursor': None, 'note': None}
+    assert seats.page(schedule_id, 'NONE', 'vacant') == empty
+    # 마지막 열 뒤의 커서
+    last = seats.page(schedule_id, 'ECM', 'confirmed', cursor=len(seats.room_nos))
+    assert (last['seats'], last['count'], last['cursor']) == ([], 0, None)
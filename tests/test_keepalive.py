@@ -0,0 +1,56 @@
+from datetime import datetime, timedelta
+
+from dashboard.keepalive import KST, KeepAlive, parse_hours
+
+
+class FakeBackend:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.calls = []
+
+    def keep_warm(self, database, connections=1):
+        self.calls.append((database, connections))
+        if self.fail:
+            raise ConnectionError('재개 중')
+
+
+def test_parse_hours():
+    assert parse_hours('07-21') == (7, 21)
+
+
+def test_business_hours_end_exclusive():
+    keepalive = KeepAlive(FakeBackend(), hours=(7, 21))
+    day = datetime(2026, 10, 19, tzinfo=KST)
+    assert not keepalive.in_business_hours(day.replace(hour=6, minute=59))
+    assert keepalive.in_business_hours(day.replace(hour=7))
+    assert not keepalive.in_business_hours(day.replace(hour=21))
+
+
+def test_check_warms_every_database():
+    backend = FakeBackend()
+    keepalive = KeepAlive(backend, connections=2)
+    assert keepalive.check()
+    assert backend.calls == [('base', 2), ('cruise', 2)]
+    assert keepalive.status()['state'] == 'warm' and keepalive.status()['error'] is None
+
+
+def test_failed_check_is_cold_then_recovers():
+    backend = FakeBackend(fail=True)
+    keepalive = KeepAlive(backend)
+    assert not keepalive.check()
+    assert keepalive.status()['state'] == 'cold' and keepalive.status()['error'] == '재개 중'
+    backend.fail = False
+    assert keepalive.check()
+    assert keepalive.status()['state'] == 'warm'
+
+
+def test_warm_turns_idle_after_auto_pause_window():
+    keepalive = KeepAlive(FakeBackend())
+    keepalive.check()
+    keepalive.last_ok = datetime.now(KST) - timedelta(minutes=61)
+    assert keepalive.status()['state'] == 'idle'
+
+
+def test_disabled_does_not_start():
+    keepalive = KeepAlive(FakeBackend(), enabled=False).start()
+    assert keepalive._thread is None and keepalive.status()['state'] == 'off'
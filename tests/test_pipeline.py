@@ -0,0 +1,59 @@
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from dashboard.backend import SqliteBackend
+from dashboard.constants import vessel_for_route
+from dashboard.pipeline import QueryFilters, iter_query_chunks, merge_results, run_query
+from dashboard.schedule_cache import ScheduleCache
+
+START, END = date(2026, 1, 1), date(2026, 3, 1)   # 60일 → 14일 구간 5개
+
+
+def by_schedule(df):
+    """행 순서가 의미 없는 프레임 (스케줄 목록, 승객 분석) 비교용 정렬"""
+    return df.sort_values(list(df.columns)).reset_index(drop=True)
+
+
+def assert_same_result(result, expected):
+    assert result['schedule_count'] == expected['schedule_count']
+    assert result['existing_grades'] == expected['existing_grades']
+    # 화면 표는 행 순서까지 같아야 함
+    for key in ('final_df', 'final_df_passengers'):
+        pd.testing.assert_frame_equal(result[key], expected[key])
+    for key in ('passenger_analysis', 'schedules'):
+        pd.testing.assert_frame_equal(by_schedule(result[key]), by_schedule(expected[key]))
+    assert sorted(map(repr, result['room_details'])) == sorted(map(repr, expected['room_details']))
+
+
+@pytest.mark.parametrize('route, origin, destination', [
+    ('BOC', '전체', '전체'),
+    ('TSL', '전체', '전체'),
+    ('TSL', 'PUS', 'HTK'),
+    ('EAS', '전체', '전체'),
+])
+def test_merged_chunks_equal_single_query(local_db, route, origin, destination):
+    filters = QueryFilters.create(vessel_for_route(route), route, origin, destination, START, END)
+    whole = run_query(SqliteBackend(local_db), filters)
+    chunks = list(iter_query_chunks(SqliteBackend(local_db), filters))
+    assert len(chunks) > 1 and [total for _, total, _ in chunks] == [len(chunks)] * len(chunks)
+    assert_same_result(merge_results(filters, [part for _, _, part in chunks]), whole)
+
+
+@pytest.mark.parametrize('route, origin, destination', [
+    ('BOC', '전체', '전체'),
+    ('TSL', '전체', '전체'),
+])
+def test_overlapping_ranges_from_schedule_cache(local_db, route, origin, destination):
+    cached = SqliteBackend(local_db)
+    cached.schedule_cache = ScheduleCache()
+    first = QueryFilters.create(vessel_for_route(route), route, origin, destination, date(2026, 1, 1), date(2026, 1, 31))
+    second = QueryFilters.create(vessel_for_route(route), route, origin, destination, date(2026, 1, 15), date(2026, 2, 15))
+    run_query(cached, first)
+    hits = cached.schedule_cache.hits
+
+    result = run_query(cached, second)
+    assert cached.schedule_cache.hits > hits   # 겹친 1/15~1/31은 캐시에서
+    assert result['fetched_at'] is not None
+    assert_same_result(result, run_query(SqliteBackend(local_db), second))
@@ -0,0 +1,73 @@
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from dashboard import queries
+from dashboard.query_log import QueryLog, fingerprint, read_entries, schedule_count
+
+TSQL = queries.DIALECTS['tsql']
+SQLITE = queries.DIALECTS['sqlite']
+
+
+@pytest.mark.parametrize('build', [
+    lambda d, ids: queries.passenger_analysis_query(d, ids),
+    lambda d, ids: queries.passenger_analysis_query(d, ids, arrival_schedule_ids=ids[:1]),
+    lambda d, ids: queries.room_details_query(d, ids, True),
+    lambda d, ids: queries.vacant_rooms_query(d, ids, [1]),
+])
+@pytest.mark.parametrize('dialect', [TSQL, SQLITE])
+def test_fingerprint_folds_id_lists(build, dialect):
+    small, _ = build(dialect, [7])
+    large, _ = build(dialect, list(range(1000, 1500)))
+    fp, folded = fingerprint(small)
+    assert fingerprint(large) == (fp, folded)
+    assert '1000' not in folded and '(...)' in folded
+    assert schedule_count(small) == 1
+    assert schedule_count(large) == 500
+
+
+def test_fingerprint_normalizes_whitespace_only():
+    sql = "SELECT id FROM tickets WHERE departure_schedule_id IN (1,2)"
+    assert fingerprint(sql) == fingerprint("SELECT  id\n  FROM tickets\tWHERE departure_schedule_id IN (3)")
+    # 문자열/날짜 상수와 다른 쿼리는 접지 않음
+    assert fingerprint(sql.replace('tickets', 'passengers'))[0] != fingerprint(sql)[0]
+    assert fingerprint("SELECT 1 WHERE d >= '2026-01-01'")[0] != fingerprint("SELECT 1 WHERE d >= '2026-02-01'")[0]
+    assert schedule_count("SELECT id FROM vessels") is None
+
+
+def test_arrival_filter_changes_fingerprint():
+    plain, _ = queries.passenger_analysis_query(TSQL, [1, 2])
+    filtered, _ = queries.passenger_analysis_query(TSQL, [1, 2], arrival_schedule_ids=[3])
+    assert fingerprint(plain)[0] != fingerprint(filtered)[0]
+    assert schedule_count(filtered) == 2   # 출발 스케줄만 셈
+
+
+def test_rotation_keeps_order(tmp_path):
+    path = str(tmp_path / 'query_log.jsonl')
+    log = QueryLog(path, max_bytes=2000, files=3)
+    log.begin_request(SimpleNamespace(route='BOC', vessel='PANSTAR MIRACLE', start_date='2026-01-01', end_date='2026-01-31'))
+    sql, _ = queries.passenger_analysis_query(TSQL, [1, 2, 3])
+    df = pd.DataFrame({'schedule_id': [1, 2, 3]})
+    for i in range(200):
+        log.write('cruise', f'q{i}', sql, (i,), 0.001, df)
+    log.end_request()
+    log.write('base', 'vessels', 'SELECT 1', (), 0.001, error=RuntimeError('끊김'))
+
+    assert (tmp_path / 'query_log.jsonl.3').exists()
+    assert not (tmp_path / 'query_log.jsonl.4').exists()
+    entries = list(read_entries(path))
+    names = [entry['name'] for entry in entries]
+    # 회전으로 앞쪽은 지워지고 남은 항목은 쓴 순서대로
+    assert names[-1] == 'vessels'
+    numbers = [int(name[1:]) for name in names[:-1]]
+    assert numbers == list(range(numbers[0], 200)) and numbers[0] > 0
+    assert all(entry['route'] == 'BOC' and entry['schedules'] == 3 for entry in entries[:-1])
+    assert entries[-1]['request'] is None and entries[-1]['error'].startswith('RuntimeError')
+
+
+def test_read_entries_skips_broken_lines(tmp_path):
+    path = tmp_path / 'query_log.jsonl'
+    path.write_text('{"name": "a"}\n{"name": \n{"name": "b"}\n', encoding='utf-8')
+    assert [entry['name'] for entry in read_entries(str(path))] == ['a', 'b']
+    assert list(read_entries(str(tmp_path / 'missing.jsonl'))) == []
@@ -0,0 +1,71 @@
+from datetime import date
+
+import pytest
+
+from dashboard import app_config
+from dashboard.pipeline import QueryFilters, run_query, run_query_cached
+from dashboard.replay import ReplayBackend
+
+# 기간이 겹치는 BOC 조회 두 건 (두 번째는 스케줄 단위 캐시가 있으면 겹친 스케줄을 DB에 묻지 않음)
+FILTERS = [
+    QueryFilters.create('PANSTAR MIRACLE', 'BOC', '전체', '전체', date(2026, 1, 1), date(2026, 1, 20)),
+    QueryFilters.create('PANSTAR MIRACLE', 'BOC', '전체', '전체', date(2026, 1, 10), date(2026, 1, 31)),
+]
+
+PROCESS_RESOURCES = (app_config.get_backend, app_config.get_disk_cache, app_config.get_query_log,
+                     app_config.get_query_flight, app_config.get_result_cache, app_config.get_schedule_cache)
+
+
+@pytest.fixture
+def app_env(local_db, tmp_path, monkeypatch):
+    """로컬 대역 DB + 디스크 캐시를 쓰는 앱 설정 (프로세스 자원은 테스트마다 새로)"""
+    monkeypatch.setenv('NEOHELIOS_DB_BACKEND', 'local')
+    monkeypatch.setenv('NEOHELIOS_LOCAL_DB', local_db)
+    monkeypatch.setenv('NEOHELIOS_DISK_CACHE', str(tmp_path / 'cache.db'))
+    monkeypatch.setenv('NEOHELIOS_QUERY_LOG', '0')
+    monkeypatch.delenv('NEOHELIOS_DB_CAPTURE', raising=False)
+    for resource in PROCESS_RESOURCES:
+        resource.clear()
+    yield tmp_path
+    for resource in PROCESS_RESOURCES:
+        resource.clear()
+
+
+def query_through_app(filters):
+    return run_query_cached(app_config.get_result_cache(), app_config.get_query_flight(),
+                            app_config.get_backend(), filters)
+
+
+def test_capture_replays_overlapping_ranges(app_env, local_db, monkeypatch):
+    capture = str(app_env / 'capture')
+    monkeypatch.setenv('NEOHELIOS_DB_CAPTURE', capture)
+    captured = [query_through_app(filters) for filters in FILTERS]
+    # 같은 조건을 다시 조회해도 DB까지 가서 기록됨
+    query_through_app(FILTERS[0])
+
+    replay = ReplayBackend(capture)
+    assert len(replay.requests) == 3
+    for filters, result in zip(FILTERS, captured):
+        replayed = run_query(ReplayBackend(capture), filters)
+        for key in ('final_df', 'final_df_passengers'):
+            assert replayed[key].equals(result[key])
+
+
+def test_capture_on_warm_disk_cache(app_env, monkeypatch):
+    # 기록 전에 다른 조회로 디스크 캐시(기준 정보, 조회 결과)를 채워 둠
+    query_through_app(FILTERS[0])
+    for resource in PROCESS_RESOURCES:
+        if resource is not app_config.get_disk_cache:
+            resource.clear()
+
+    capture = str(app_env / 'capture')
+    monkeypatch.setenv('NEOHELIOS_DB_CAPTURE', capture)
+    assert app_config.get_backend().dimension_cache is None
+    result = query_through_app(FILTERS[0])
+    assert run_query(ReplayBackend(capture), FILTERS[0])['final_df'].equals(result['final_df'])
+
+
+def test_caches_on_without_capture(app_env):
+    backend = app_config.get_backend()
+    assert backend.schedule_cache is not None and backend.dimension_cache is not None
+    assert app_config.get_result_cache().ttl > 0
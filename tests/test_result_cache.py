@@ -0,0 +1,81 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from dashboard import result_cache
+from dashboard.result_cache import ResultCache
+
+TTL = 10
+GRACE = 20
+EPSILON = 0.1   # _Entry.stored는 실제 시계로 잰 저장 지연만큼 앞당겨짐
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(result_cache, 'time', SimpleNamespace(monotonic=lambda: now.value))
+    return now
+
+
+def wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "시간 초과"
+        time.sleep(0.005)
+
+
+def test_fresh_until_ttl(clock):
+    cache = ResultCache(ttl=TTL, grace=GRACE)
+    cache.store('k', {'rows': 1})
+    clock.value += TTL - EPSILON
+    result = cache.get('k')
+    assert result['rows'] == 1 and result['stale'] is False
+
+
+def test_stale_after_ttl_until_grace(clock):
+    cache = ResultCache(ttl=TTL, grace=GRACE)
+    cache.store('k', {'rows': 1})
+    clock.value += TTL + EPSILON
+    assert cache.get('k')['stale'] is True
+    clock.value += GRACE - 2 * EPSILON
+    assert cache.get('k')['stale'] is True
+    assert cache.stats()['stale_hits'] == 2
+
+
+def test_dropped_after_grace(clock):
+    cache = ResultCache(ttl=TTL, grace=GRACE)
+    cache.store('k', {'rows': 1})
+    clock.value += TTL + GRACE + EPSILON
+    assert cache.get('k') is None
+    assert cache.stats()['entries'] == 0 and cache.stats()['misses'] == 1
+
+
+def test_stale_refreshes_once_in_background(clock):
+    cache = ResultCache(ttl=TTL, grace=GRACE)
+    first = cache.store('k', {'rows': 1})
+    clock.value += TTL + 1
+    release = threading.Event()
+    calls = []
+
+    def refresh():
+        calls.append(1)
+        release.wait(5)
+        return {'rows': 2}
+
+    assert cache.get('k', refresh)['rows'] == 1
+    assert cache.get('k', refresh)['rows'] == 1   # 갱신 중에는 다시 시작하지 않음
+    release.set()
+    wait_until(lambda: not cache.is_refreshing('k'))
+
+    assert calls == [1]
+    assert cache.newer('k', first['fetched_at'])['rows'] == 2
+    assert cache.get('k')['stale'] is False
+
+
+def test_session_keys_not_cached(clock):
+    cache = ResultCache(ttl=TTL, grace=GRACE)
+    cache.store('k', {'rows': 1, 'partial': '2/7', 'excel_files': {}})
+    result = cache.get('k')
+    assert 'partial' not in result and 'excel_files' not in result
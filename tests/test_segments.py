@@ -0,0 +1,52 @@
+import pandas as pd
+
+from dashboard.segments import SegmentInventory
+
+# 동행 한 항차: PUS→IZH(1), IZH→HTK(2)
+LEGS = pd.DataFrame({
+    'schedule_id': [1, 2],
+    'etd': ['2026-10-20 08:00', '2026-10-20 10:30'],
+    'direction': ['E', 'E'],
+    'departure_port': ['PUS', 'IZH'],
+})
+
+
+def seat(schedule_id, arrival_schedule_id, status='confirmed', grade='EC'):
+    return {'schedule_id': schedule_id, 'arrival_schedule_id': arrival_schedule_id, 'grade': grade, 'status': status}
+
+
+def test_pass_through_seat_counts_on_every_leg():
+    segments = SegmentInventory(LEGS, [seat(1, 2), seat(1, 2), seat(1, None, 'blocked')])
+    occupancy = segments.leg_occupancy().set_index('schedule_id')
+    # PUS→IZH 2석 + 도착 미상(끝까지) 1석, IZH→HTK는 도착 미상 1석만
+    assert occupancy.loc[1, 'confirmed'] == 2 and occupancy.loc[1, 'blocked'] == 1
+    assert occupancy.loc[2, 'confirmed'] == 0 and occupancy.loc[2, 'blocked'] == 1
+
+
+def test_no_bookings():
+    segments = SegmentInventory(LEGS, [])
+    occupancy = segments.leg_occupancy()
+    assert occupancy.empty
+    assert list(occupancy.columns) == ['schedule_id', 'grade', 'confirmed', 'blocked']
+    assert segments.od_matrix().to_numpy().sum() == 0
+
+
+def test_origin_equals_destination():
+    # 출발지=도착지 조회: 도착 스케줄이 출발 스케줄과 같으면 마지막 포트까지로 집계
+    segments = SegmentInventory(LEGS, [seat(2, 2)])
+    occupancy = segments.leg_occupancy()
+    assert occupancy['schedule_id'].tolist() == [2]
+    matrix = segments.od_matrix()
+    assert matrix.loc['IZH', 'HTK'] == 1 and matrix.loc['IZH', 'IZH'] == 0
+
+
+def test_only_other_statuses():
+    # 환불 등 집계 대상이 아닌 상태만 있으면 빈 결과
+    assert SegmentInventory(LEGS, [seat(1, 2, 'refund')]).leg_occupancy().empty
+
+
+def test_no_legs():
+    # 조회 기간에 운항 스케줄이 없으면 빈 점유, 모든 칸 0인 OD 행렬
+    segments = SegmentInventory(LEGS.iloc[0:0], [])
+    assert segments.leg_occupancy().empty
+    assert segments.od_matrix().to_numpy().sum() == 0
@@ -0,0 +1,106 @@
+import threading
+import time
+
+import pytest
+
+from dashboard.singleflight import SingleFlight
+
+
+def wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "시간 초과"
+        time.sleep(0.005)
+
+
+def test_waiters_share_one_run():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        release.wait(5)
+        return {'rows': 3}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flight.do('k', slow))) for _ in range(3)]
+    threads[0].start()
+    wait_until(lambda: calls)
+    for thread in threads[1:]:
+        thread.start()
+    wait_until(lambda: flight.stats()['shared'] == 2)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert sorted(shared for _, shared in results) == [True, True, True]
+    assert flight.stats() == {'executed': 1, 'shared': 2, 'in_flight': 0}
+
+
+def test_leader_error_reaches_every_waiter():
+    flight = SingleFlight()
+    release = threading.Event()
+    started = threading.Event()
+
+    def failing():
+        started.set()
+        release.wait(5)
+        raise RuntimeError('DB 오류')
+
+    errors = []
+
+    def run():
+        try:
+            flight.do('k', failing)
+        except RuntimeError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=run)
+    leader.start()
+    started.wait(5)
+    waiters = [threading.Thread(target=run) for _ in range(2)]
+    for thread in waiters:
+        thread.start()
+    wait_until(lambda: flight.stats()['shared'] == 2)
+    release.set()
+    for thread in [leader, *waiters]:
+        thread.join(5)
+
+    assert len(errors) == 3
+    assert all(error is errors[0] for error in errors)
+    # 실패한 키는 남지 않음 → 다음 조회는 다시 실행
+    assert flight.do('k', lambda: 'ok') == ('ok', False)
+
+
+def test_interrupted_leader_lets_waiter_retry():
+    # 스크립트 중지(Exception이 아닌 BaseException)로 끝난 실행은 공유하지 않고 기다리던 쪽이 다시 실행
+    class StopScript(BaseException):
+        pass
+
+    flight = SingleFlight()
+    release = threading.Event()
+    started = threading.Event()
+
+    def interrupted():
+        started.set()
+        release.wait(5)
+        raise StopScript
+
+    def leader():
+        with pytest.raises(StopScript):
+            flight.do('k', interrupted)
+
+    results = []
+    first = threading.Thread(target=leader)
+    first.start()
+    started.wait(5)
+    waiter = threading.Thread(target=lambda: results.append(flight.do('k', lambda: 'retried')))
+    waiter.start()
+    wait_until(lambda: flight.stats()['shared'] == 1)
+    release.set()
+    first.join(5)
+    waiter.join(5)
+
+    assert results == [('retried', False)]
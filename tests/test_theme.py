@@ -0,0 +1,50 @@
+import os
+
+from streamlit.web.server.component_request_handler import ComponentRequestHandler
+
+from dashboard import theme
+from tools.build_assets import font_face_rules
+
+
+class FakeHandler:
+    def __init__(self):
+        self.headers = {}
+
+    def set_header(self, name, value):
+        self.headers[name] = value
+
+
+def cache_control(path):
+    handler = FakeHandler()
+    ComponentRequestHandler.set_extra_headers(handler, path)
+    return handler.headers.get('Cache-Control')
+
+
+def test_hashed_assets_cached_for_a_year():
+    prefix = theme._assets.name
+    assert cache_control(f'{prefix}/app.0123456789.css') == theme.IMMUTABLE_CACHE
+    assert cache_control(f'{prefix}/fonts/noto-sans-kr-400.0123456789.woff2') == theme.IMMUTABLE_CACHE
+
+
+def test_fixed_names_keep_default_headers():
+    prefix = theme._assets.name
+    assert cache_control(f'{prefix}/fonts.css') == 'public'
+    assert cache_control(f'{prefix}/manifest.json') == 'public'
+    assert cache_control('dashboard.grid.grid/index.html') == 'no-cache'
+    # 다른 컴포넌트의 같은 모양 파일 이름은 그대로
+    assert cache_control('other.component/app.0123456789.css') == 'public'
+
+
+def test_patch_applied_once():
+    patched = ComponentRequestHandler.set_extra_headers
+    theme._cache_hashed_assets()
+    assert ComponentRequestHandler.set_extra_headers is patched
+
+
+def test_no_external_font_request():
+    assert font_face_rules({}) == ''
+    manifest = theme.load_manifest()
+    with open(os.path.join(theme.STATIC_DIR, manifest['css']), encoding='utf-8') as f:
+        assert '@import' not in f.read()
+    rules = font_face_rules({400: 'fonts/noto-sans-kr-400.0123456789.woff2'})
+    assert 'font-display: swap' in rules and 'url(fonts/noto-sans-kr-400.0123456789.woff2)' in rules
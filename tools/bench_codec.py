@@ -0,0 +1,82 @@
+"""
+결과 캐시 직렬화 벤치마크 (로컬 대역 DB)
+
+    python -m tools.bench_codec --db local_data/neohelios_local.db --route BOC --days 30 --repeat 20
+
+프레임별 메모리(pandas)/저장 크기(사전 인코딩 전후)/읽기 시간과
+결과 1건 기준 1GB당 저장 가능한 항목 수(메모리 vs 디스크 캐시), 디스크 캐시 읽기 시간을 출력.
+"""
+
+import argparse
+import pickle
+import statistics
+import time
+from datetime import date, timedelta
+
+import pandas as pd
+
+from dashboard.backend import SqliteBackend
+from dashboard.codec import decode_frame, encode_frame
+from dashboard.constants import vessel_for_route
+from dashboard.disk_cache import decode_result, encode_result
+from dashboard.pipeline import QueryFilters, run_query
+
+GB = 1024 ** 3
+
+
+def median_ms(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+
+def memory_bytes(value):
+    """결과 값의 메모리 크기 (프레임은 deep, 나머지는 pickle 크기로 근사)"""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    return len(pickle.dumps(value))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="결과 캐시 직렬화 벤치마크")
+    parser.add_argument('--db', default='local_data/neohelios_local.db')
+    parser.add_argument('--route', default='BOC')
+    parser.add_argument('--origin', default='전체')
+    parser.add_argument('--destination', default='전체')
+    parser.add_argument('--start', type=date.fromisoformat, default=date.today())
+    parser.add_argument('--days', type=int, default=30)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    filters = QueryFilters.create(
+        vessel_for_route(args.route), args.route, args.origin, args.destination,
+        args.start, args.start + timedelta(days=args.days),
+    )
+    result = run_query(SqliteBackend(args.db), filters)
+    print(f"{filters.route} {filters.start_date}~{filters.end_date}: 스케줄 {result['schedule_count']}개")
+
+    print(f"{'frame':22s} {'rows':>7s} {'pandas KB':>10s} {'plain KB':>9s} {'dict KB':>8s} {'decode ms':>10s}")
+    for name, df in result.items():
+        if not isinstance(df, pd.DataFrame):
+            continue
+        plain = encode_frame(df, dictionary=False)
+        data = encode_frame(df)
+        decode = median_ms(lambda: decode_frame(data), args.repeat)
+        print(f"{name:22s} {len(df):7d} {memory_bytes(df) / 1024:10.1f} {len(plain) / 1024:9.1f} "
+              f"{len(data) / 1024:8.1f} {decode:10.1f}")
+
+    memory = sum(memory_bytes(v) for v in result.values())
+    data = encode_result(result)
+    encode = median_ms(lambda: encode_result(result), args.repeat)
+    decode = median_ms(lambda: decode_result(data), args.repeat)
+    print()
+    print(f"결과 1건: 메모리 {memory / 1024:.0f}KB → 디스크 캐시 {len(data) / 1024:.0f}KB "
+          f"(저장 {encode:.1f}ms, 읽기 {decode:.1f}ms)")
+    print(f"1GB당 항목 수: 메모리 {GB // memory}건, 디스크 캐시 {GB // len(data)}건")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+조회 파이프라인 벤치마크 (로컬 대역 DB)
+
+    python -m tools.bench_pipeline --db local_data/neohelios_local.db --route BOC --days 30 --repeat 5
+
+쿼리별 소요 시간/행 수와 전체 파이프라인 소요 시간을 출력.
+"""
+
+import argparse
+import statistics
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+
+from dashboard.backend import SqliteBackend
+from dashboard.constants import vessel_for_route
+from dashboard.pipeline import QueryFilters, run_query
+
+
+class TimedBackend(SqliteBackend):
+    """쿼리 이름별 소요 시간/행 수 수집"""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.timings = defaultdict(list)
+        self.rows = defaultdict(int)
+
+    def read(self, database, name, sql, params=()):
+        started = time.perf_counter()
+        df = super().read(database, name, sql, params)
+        self.timings[name].append(time.perf_counter() - started)
+        self.rows[name] = len(df)
+        return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description="조회 파이프라인 벤치마크")
+    parser.add_argument('--db', default='local_data/neohelios_local.db')
+    parser.add_argument('--route', default='BOC')
+    parser.add_argument('--origin', default='전체')
+    parser.add_argument('--destination', default='전체')
+    parser.add_argument('--start', type=date.fromisoformat, default=date.today())
+    parser.add_argument('--days', type=int, default=30)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    backend = TimedBackend(args.db)
+    filters = QueryFilters.create(
+        vessel_for_route(args.route), args.route, args.origin, args.destination,
+        args.start, args.start + timedelta(days=args.days),
+    )
+
+    totals = []
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        result = run_query(backend, filters)
+        totals.append(time.perf_counter() - started)
+
+    print(f"{filters.route} {filters.start_date}~{filters.end_date}: 스케줄 {result['schedule_count']}개, 행 {len(result['final_df'])}개")
+    print(f"{'query':22s} {'median ms':>10s} {'rows':>10s}")
+    for name, values in backend.timings.items():
+        print(f"{name:22s} {statistics.median(values) * 1000:10.1f} {backend.rows[name]:10,}")
+    query_total = sum(sum(v) for v in backend.timings.values()) / args.repeat
+    print(f"{'(쿼리 합계)':20s} {query_total * 1000:10.1f}")
+    print(f"{'pipeline':22s} {statistics.median(totals) * 1000:10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+"""
+정적 스타일 빌드 (dashboard/theme.css → dashboard/static/)
+
+    python -m tools.build_assets
+    # Noto Sans KR 서브셋 폰트까지 (가변 폰트 NotoSansKR[wght].ttf, Google Fonts 저장소의 OFL 폰트)
+    python -m tools.build_assets --font NotoSansKR[wght].ttf
+
+- CSS: 주석/공백 제거 후 내용 해시를 붙인 app.<해시>.css (내용이 바뀌면 파일명도 바뀌어 캐시가 섞이지 않음)
+- 폰트: 굵기(400/500/700)별로 KS X 1001 한글 2,350자 + ASCII + 소스에 쓰인 글자만 남긴 woff2
+  (--font 없이 실행하면 기존에 빌드한 폰트를 그대로 사용, 빌드한 폰트가 없으면 @font-face 없이 시스템 글꼴)
+- fonts.css: 폰트 규칙만 담은 이름 고정 파일 (그리드 iframe이 ../dashboard.theme.assets/fonts.css로 읽음)
+- manifest.json에 현재 파일명 기록 (dashboard.theme이 읽음), 이전 빌드 파일은 삭제
+
+폰트 빌드에는 fontTools와 brotli가 필요 (pip install fonttools brotli, 앱 실행에는 불필요).
+"""
+
+import argparse
+import glob
+import hashlib
+import io
+import json
+import os
+import re
+
+from dashboard.theme import FONT_CSS
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_CSS = os.path.join(ROOT, 'dashboard', 'theme.css')
+STATIC_DIR = os.path.join(ROOT, 'dashboard', 'static')
+FONT_DIR = 'fonts'
+FONT_FAMILY = 'Noto Sans KR'
+WEIGHTS = (400, 500, 700)
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()[:10]
+
+
+def minify_css(css):
+    """주석/공백 제거 (이 저장소 스타일시트 범위의 단순 압축: 문자열 안의 기호는 없다고 가정)"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)  # 선택자의 ' :hover' 앞 공백은 유지
+    css = css.replace(';}', '}')
+    return css.strip()
+
+
+def subset_text():
+    """서브셋에 남길 글자: ASCII + KS X 1001 한글 + 한글 자모 + 소스(.py/.css)에 쓰인 글자"""
+    chars = {chr(c) for c in range(0x20, 0x7F)}
+    # KS X 1001 완성형 한글 (EUC-KR 0xB0A1 ~ 0xC8FE)
+    for hi in range(0xB0, 0xC9):
+        for lo in range(0xA1, 0xFF):
+            chars.add(bytes([hi, lo]).decode('euc-kr'))
+    chars.update(chr(c) for c in range(0x3131, 0x318F))
+    sources = glob.glob(os.path.join(ROOT, '*.py')) + glob.glob(os.path.join(ROOT, 'pages', '*.py'))
+    sources += glob.glob(os.path.join(ROOT, 'dashboard', '*.py')) + [SOURCE_CSS]
+    for path in sources:
+        with open(path, encoding='utf-8-sig') as f:
+            chars.update(ch for ch in f.read() if ord(ch) <= 0xFFFF and not ch.isspace())
+    return ''.join(sorted(chars))
+
+
+def build_fonts(font_path):
+    """가변 폰트 → 굵기별 서브셋 woff2 {굵기: (파일명, 바이트)}"""
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+    from fontTools.varLib import instancer
+
+    text = subset_text()
+    fonts = {}
+    for weight in WEIGHTS:
+        font = TTFont(font_path)
+        if 'fvar' in font:
+            font = instancer.instantiateVariableFont(font, {'wght': weight})
+        options = subset.Options()
+        options.flavor = 'woff2'
+        options.layout_features = ['*']
+        options.name_IDs = ['*']
+        subsetter = subset.Subsetter(options)
+        subsetter.populate(text=text)
+        subsetter.subset(font)
+        buf = io.BytesIO()
+        font.flavor = 'woff2'
+        font.save(buf)
+        data = buf.getvalue()
+        fonts[weight] = (f"{FONT_DIR}/noto-sans-kr-{weight}.{content_hash(data)}.woff2", data)
+    return fonts
+
+
+def font_face_rules(font_files):
+    """굵기별 @font-face (url은 CSS 파일 기준 상대 경로, 폰트가 없으면 빈 문자열)"""
+    rules = []
+    for weight, filename in sorted(font_files.items()):
+        rules.append(
+            f"@font-face {{ font-family: '{FONT_FAMILY}'; font-style: normal; font-weight: {weight}; "
+            f"font-display: swap; src: url({filename}) format('woff2'); }}"
+        )
+    return '\n'.join(rules)
+
+
+def previous_manifest():
+    try:
+        with open(os.path.join(STATIC_DIR, 'manifest.json'), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def remove_stale(keep):
+    """manifest에 없는 이전 빌드 파일 삭제"""
+    stale = glob.glob(os.path.join(STATIC_DIR, 'app.*.css'))
+    stale += glob.glob(os.path.join(STATIC_DIR, FONT_DIR, '*.woff2'))
+    for path in stale:
+        if os.path.relpath(path, STATIC_DIR).replace(os.sep, '/') not in keep:
+            os.remove(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="정적 스타일 빌드")
+    parser.add_argument('--font', help="Noto Sans KR 가변 폰트(.ttf) 경로 (없으면 기존 폰트 유지)")
+    args = parser.parse_args()
+
+    os.makedirs(os.path.join(STATIC_DIR, FONT_DIR), exist_ok=True)
+
+    if args.font:
+        fonts = build_fonts(args.font)
+        for filename, data in fonts.values():
+            with open(os.path.join(STATIC_DIR, filename), 'wb') as f:
+                f.write(data)
+        font_files = {weight: filename for weight, (filename, _) in fonts.items()}
+    else:
+        font_files = {
+            int(weight): filename for weight, filename in previous_manifest().get('fonts', {}).items()
+            if os.path.exists(os.path.join(STATIC_DIR, filename))
+        }
+
+    with open(SOURCE_CSS, encoding='utf-8') as f:
+        source = f.read()
+    font_css = minify_css(font_face_rules(font_files))
+    with open(os.path.join(STATIC_DIR, FONT_CSS), 'w', encoding='utf-8') as f:
+        f.write(font_css + '\n')
+    css = minify_css(font_face_rules(font_files) + '\n' + source).encode('utf-8')
+    css_file = f"app.{content_hash(css)}.css"
+    with open(os.path.join(STATIC_DIR, css_file), 'wb') as f:
+        f.write(css)
+
+    manifest = {'css': css_file, 'font_css': FONT_CSS, 'fonts': {str(weight): filename for weight, filename in sorted(font_files.items())}}
+    with open(os.path.join(STATIC_DIR, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    remove_stale({css_file, *font_files.values()})
+
+    print(f"{css_file}: {len(source.encode('utf-8')) / 1024:.1f}KB → {len(css) / 1024:.1f}KB")
+    for weight, filename in sorted(font_files.items()):
+        print(f"{filename}: {os.path.getsize(os.path.join(STATIC_DIR, filename)) / 1024:.1f}KB")
+    if not font_files:
+        print("폰트 없음: --font로 빌드하기 전까지 시스템 글꼴 사용 (외부 폰트 요청 없음)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""
+화면별 import 시간 측정 (콜드 스타트 비교용)
+
+    python -m tools.import_time
+    python -m tools.import_time --repeat 5 --top 8
+    # 서버를 새로 띄워 첫 화면 표시까지 (로컬 대역 DB)
+    python -m tools.import_time --cold --db local_data/neohelios_local.db
+
+메인 화면과 pages/의 각 스크립트에서 최상위 import 문만 뽑아 새 인터프리터에서 실행하고
+(python -X importtime) 전체 소요 시간과 오래 걸린 최상위 패키지를 출력.
+streamlit은 모든 화면이 같이 쓰므로 합계와 별도로 표시.
+"""
+
+import argparse
+import ast
+import asyncio
+import glob
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_SCRIPT = os.path.join(ROOT, '독립_대시보드_앱.py')
+MARKER = '--neohelios-imports--'
+
+
+def page_scripts():
+    return [APP_SCRIPT] + sorted(glob.glob(os.path.join(ROOT, 'pages', '*.py')))
+
+
+def import_snippet(path):
+    """스크립트의 최상위 import 문만 모은 코드 (함수 안의 지연 import는 제외)"""
+    with open(path, encoding='utf-8-sig') as f:
+        tree = ast.parse(f.read())
+    lines = [ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    return f"import sys; sys.stderr.write({MARKER!r} + '\\n')\n" + '\n'.join(lines)
+
+
+def measure(snippet):
+    """-X importtime 출력 → 최상위 패키지별 누적 시간(ms)"""
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', snippet],
+        cwd=ROOT, capture_output=True, text=True,
+        env=dict(os.environ, PYTHONPATH=ROOT),
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    packages = defaultdict(float)
+    started = False
+    for line in proc.stderr.splitlines():
+        if line == MARKER:
+            started = True
+            continue
+        if not started or not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if name.startswith('  ') or not cumulative.strip().isdigit():
+            continue  # 하위 import는 상위 누적에 포함
+        packages[name.strip().split('.')[0]] += int(cumulative) / 1000
+    return packages
+
+
+def report_imports(repeat, top):
+    print(f"{'화면':24s} {'합계 ms':>9s} {'streamlit':>10s}  오래 걸린 패키지")
+    for path in page_scripts():
+        snippet = import_snippet(path)
+        runs = [measure(snippet) for _ in range(repeat)]
+        best = min(runs, key=lambda p: sum(p.values()))
+        others = sorted(((ms, name) for name, ms in best.items() if name != 'streamlit'), reverse=True)
+        heavy = ', '.join(f"{name} {ms:.0f}" for ms, name in others[:top])
+        print(f"{os.path.basename(path)[:-3]:24s} {sum(best.values()):9.0f} {best.get('streamlit', 0):10.0f}  {heavy}")
+
+
+def report_cold(db_path, port):
+    """서버 기동 → 첫 접속의 첫 화면 완료까지 (스크립트 첫 실행에 import 비용이 모두 포함됨)"""
+    from tools.loadtest import Session, start_server
+
+    started = time.perf_counter()
+    proc, url = start_server(db_path, port)
+    ready = time.perf_counter()
+
+    async def first_load():
+        session = Session(url)
+        try:
+            await session.connect()
+        finally:
+            session.close()
+
+    try:
+        asyncio.run(first_load())
+        done = time.perf_counter()
+    finally:
+        proc.kill()
+    print(f"서버 기동 {ready - started:.2f}s, 첫 화면 {done - ready:.2f}s (합계 {done - started:.2f}s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="화면별 import 시간 측정")
+    parser.add_argument('--repeat', type=int, default=3, help="화면별 반복 횟수 (가장 빠른 값 사용)")
+    parser.add_argument('--top', type=int, default=5, help="표시할 패키지 수")
+    parser.add_argument('--cold', action='store_true', help="서버를 새로 띄워 첫 화면까지 측정")
+    parser.add_argument('--db', default='local_data/neohelios_local.db')
+    parser.add_argument('--port', type=int, default=8599)
+    args = parser.parse_args()
+
+    report_imports(args.repeat, args.top)
+    if args.cold:
+        report_cold(args.db, args.port)
+
+
+if __name__ == '__main__':
+    main()
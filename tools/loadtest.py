@@ -0,0 +1,436 @@
+"""
+동시 접속 부하 테스트 (로컬 대역 DB로 앱 서버를 띄우고 세션 N개가 동시에 조작)
+
+    python -m tools.seed_local_db local_data/neohelios_local.db
+    python -m tools.loadtest --db local_data/neohelios_local.db --levels 1,2,4,8,16 --flows 2
+    # 이미 떠 있는 서버 대상 (RSS/CPU는 --pid를 줘야 측정)
+    python -m tools.loadtest --url http://localhost:8501 --pid 12345
+
+세션 하나의 흐름: 접속 → (선박 변경 → 조회 → 결과 화면 이동/분석 필터 → 객실 모달 → 엑셀 다운로드) × flows
+브라우저와 같은 웹소켓 프로토콜(/_stcore/stream, protobuf)로 통신하므로 서버 쪽 비용
+(스크립트 재실행, 델타 전송, 미디어 다운로드)은 실제 접속과 같다.
+객실 모달은 테이블 컴포넌트 안의 JS라 서버 요청이 없으므로 모달 데이터(컴포넌트 인자) 크기만 기록.
+
+동시 세션 단계별로 동작별 p50/p95/p99, 처리량, 서버 RSS/CPU를 출력하고
+처리량이 더 늘지 않거나 서버 CPU가 1코어에 찬 첫 단계를 포화 지점으로 표시.
+RSS/CPU는 /proc 기준 (Linux 전용).
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import time
+import urllib.request
+from collections import defaultdict
+
+from tornado.httpclient import AsyncHTTPClient
+from tornado.websocket import websocket_connect
+from streamlit.proto.Alert_pb2 import Alert
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_SCRIPT = os.path.join(ROOT, '독립_대시보드_앱.py')
+
+WIDGET_TYPES = ('selectbox', 'radio', 'date_input', 'button', 'download_button')
+MAX_MESSAGE_SIZE = 200 * 1024 * 1024  # server.maxMessageSize 기본값과 동일
+SATURATION_CPU = 90  # 서버 CPU 평균(%)이 이 이상이면 포화로 판단
+RESULT_PAGES = ['승객_현황', '승객_분석', '생성처별_분석']  # 조회 후 차례로 여는 pages/ 화면
+
+
+# ---------- 서버 ----------
+
+def start_server(db_path, port):
+    env = dict(os.environ, NEOHELIOS_DB_BACKEND='local', NEOHELIOS_LOCAL_DB=os.path.abspath(db_path))
+    proc = subprocess.Popen(
+        [sys.executable, '-m', 'streamlit', 'run', APP_SCRIPT,
+         '--server.headless', 'true', '--server.port', str(port),
+         '--browser.gatherUsageStats', 'false'],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    url = f"http://localhost:{port}"
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"streamlit 서버가 종료됨 (exit {proc.returncode})")
+        try:
+            with urllib.request.urlopen(url + '/_stcore/health', timeout=1) as resp:
+                if resp.status == 200:
+                    return proc, url
+        except OSError:
+            time.sleep(0.3)
+    proc.kill()
+    raise RuntimeError("streamlit 서버가 60초 안에 뜨지 않음")
+
+
+class ProcessMonitor:
+    """/proc/<pid>에서 CPU 사용률과 RSS를 주기적으로 샘플링"""
+
+    def __init__(self, pid, interval=0.5):
+        self.pid = pid
+        self.interval = interval
+        self.tick = os.sysconf('SC_CLK_TCK')
+        self.cpu = []
+        self.rss = []
+
+    def _cpu_seconds(self):
+        with open(f'/proc/{self.pid}/stat') as f:
+            fields = f.read().rsplit(')', 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / self.tick  # utime + stime
+
+    def _rss_mb(self):
+        with open(f'/proc/{self.pid}/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+        return 0.0
+
+    async def run(self):
+        last_cpu, last_t = self._cpu_seconds(), time.perf_counter()
+        while True:
+            await asyncio.sleep(self.interval)
+            cpu, now = self._cpu_seconds(), time.perf_counter()
+            self.cpu.append((cpu - last_cpu) / (now - last_t) * 100)
+            self.rss.append(self._rss_mb())
+            last_cpu, last_t = cpu, now
+
+    @property
+    def cpu_mean(self):
+        return sum(self.cpu) / len(self.cpu) if self.cpu else None
+
+    def summary(self):
+        if not self.cpu:
+            return "서버 CPU/RSS 샘플 없음"
+        return (f"서버 CPU 평균 {self.cpu_mean:.0f}% / 최대 {max(self.cpu):.0f}%, "
+                f"RSS 최대 {max(self.rss):.0f}MB")
+
+
+# ---------- 세션 ----------
+
+def _common_prefix(a, b):
+    n = 0
+    while n < min(len(a), len(b)) and a[n] == b[n]:
+        n += 1
+    return a[:n]
+
+
+class Session:
+    """브라우저 탭 하나에 해당하는 Streamlit 세션
+
+    위젯은 라벨로 찾는다. 위젯 값은 브라우저처럼 매 재실행마다 전부 보내고,
+    id가 바뀐 위젯(옵션 변경 등)은 서버 기본값으로 다시 시작.
+    fragment 안의 위젯을 조작하면 브라우저처럼 그 fragment만 재실행을 요청하고,
+    fragment 재실행 때는 바깥 위젯을 그대로 유지.
+    """
+
+    def __init__(self, base_url):
+        self.base_url = base_url
+        self.ws = None
+        self.widgets = {}   # 라벨 → (위젯 종류, proto, fragment id, delta 경로)
+        self.fragment_roots = {}  # fragment id → fragment 컨테이너 delta 경로
+        self.pages = {}     # 화면 이름 → page_script_hash (pages/ 포함)
+        self.page = ''      # 현재 화면 (빈 값이면 메인)
+        self.values = {}    # 위젯 id → WidgetState
+        self.cache = {}     # ForwardMsg hash → 메시지 (ref_hash로 재사용되는 큰 메시지)
+        self.table_bytes = 0
+        self.errors = []
+
+    async def connect(self):
+        url = self.base_url.replace('http', 'ws', 1) + '/_stcore/stream'
+        self.ws = await websocket_connect(url, subprotocols=['streamlit'], max_message_size=MAX_MESSAGE_SIZE)
+        await self.rerun()
+
+    def close(self):
+        if self.ws is not None:
+            self.ws.close()
+
+    async def _cached(self, ref_hash):
+        if ref_hash not in self.cache:
+            resp = await AsyncHTTPClient().fetch(f"{self.base_url}/_stcore/message?hash={ref_hash}")
+            msg = ForwardMsg()
+            msg.ParseFromString(resp.body)
+            self.cache[ref_hash] = msg
+        return self.cache[ref_hash]
+
+    async def rerun(self, trigger=None, fragment_id=''):
+        back = BackMsg()
+        back.rerun_script.SetInParent()
+        back.rerun_script.fragment_id = fragment_id
+        back.rerun_script.page_script_hash = self.page
+        states = back.rerun_script.widget_states.widgets
+        for state in self.values.values():
+            states.add().CopyFrom(state)
+        if trigger is not None:
+            states.add(id=trigger, trigger_value=True)
+        await self.ws.write_message(back.SerializeToString(), binary=True)
+
+        seen = {}
+        roots = {}
+        self.errors = []
+        while True:
+            raw = await self.ws.read_message()
+            if raw is None:
+                raise ConnectionError("서버 연결이 끊김")
+            msg = ForwardMsg()
+            msg.ParseFromString(raw)
+            kind = msg.WhichOneof('type')
+            path = tuple(msg.metadata.delta_path)
+            if kind == 'ref_hash':
+                msg = await self._cached(msg.ref_hash)
+                kind = msg.WhichOneof('type')
+            elif msg.metadata.cacheable:
+                self.cache[msg.hash] = msg
+            if kind in ('new_session', 'navigation'):
+                for page in getattr(msg, kind).app_pages:
+                    self.pages[page.page_name] = page.page_script_hash
+            if kind == 'delta' and msg.delta.fragment_id:
+                # fragment 요소는 모두 fragment 컨테이너 아래 → 경로의 공통 앞부분이 컨테이너
+                fid = msg.delta.fragment_id
+                roots[fid] = _common_prefix(roots[fid], path) if fid in roots else path
+            if kind == 'delta' and msg.delta.WhichOneof('type') == 'new_element':
+                self._on_element(msg.delta.new_element, msg.delta.fragment_id, path, seen)
+            elif kind == 'script_finished':
+                break
+        self.fragment_roots.update(roots)
+        if fragment_id:
+            # fragment 재실행: 그 fragment 컨테이너 밖의 위젯은 이전 상태 유지
+            root = self.fragment_roots.get(fragment_id, ())
+            for label, widget in self.widgets.items():
+                if widget[3][:len(root)] != root:
+                    seen.setdefault(label, widget)
+        self._sync_values(seen)
+        if self.errors:
+            raise RuntimeError(self.errors[0])
+
+    def _on_element(self, element, fragment_id, path, seen):
+        kind = element.WhichOneof('type')
+        if kind in WIDGET_TYPES:
+            proto = getattr(element, kind)
+            seen[proto.label] = (kind, proto, fragment_id, path)
+        elif kind == 'component_instance':
+            # 객실 테이블 컴포넌트 인자 (행 데이터 + 모달용 객실 목록)
+            self.table_bytes = len(element.component_instance.json_args.encode('utf-8'))
+        elif kind == 'exception':
+            self.errors.append(f"{element.exception.type}: {element.exception.message}")
+        elif kind == 'alert' and element.alert.format == Alert.ERROR:
+            self.errors.append(element.alert.body)
+
+    def _sync_values(self, seen):
+        values = {}
+        for kind, proto, _, _ in seen.values():
+            state = self.values.get(proto.id)
+            if state is None:
+                state = WidgetState(id=proto.id)
+                if kind in ('selectbox', 'radio'):
+                    state.int_value = proto.value if proto.set_value else proto.default
+                elif kind == 'date_input':
+                    state.string_array_value.data.extend(proto.default)
+                else:
+                    continue  # 버튼은 누를 때만 trigger 전송
+            values[proto.id] = state
+        self.values = values
+        self.widgets = seen
+
+    def options(self, label):
+        return list(self.widgets[label][1].options)
+
+    async def goto(self, page_name):
+        """다른 화면으로 이동 (사이드바/페이지 링크 클릭과 같음)"""
+        self.page = self.pages[page_name]
+        await self.rerun()
+
+    async def select(self, label, option):
+        _, proto, fragment_id, _ = self.widgets[label]
+        self.values[proto.id].int_value = list(proto.options).index(option)
+        await self.rerun(fragment_id=fragment_id)
+
+    async def click(self, label):
+        _, proto, fragment_id, _ = self.widgets[label]
+        await self.rerun(trigger=proto.id, fragment_id=fragment_id)
+
+    async def download(self, label):
+        """파일 받기 + 버튼 클릭 재실행 (다운로드 버튼도 재실행을 일으킴, fragment 안이면 그 fragment만)"""
+        _, proto, fragment_id, _ = self.widgets[label]
+        resp = await AsyncHTTPClient().fetch(self.base_url + proto.url, request_timeout=120)
+        await self.rerun(trigger=proto.id, fragment_id=fragment_id)
+        return len(resp.body)
+
+    async def build_and_download(self, build_label, download_label):
+        """생성 버튼 클릭 → 다운로드 버튼이 나오면 받기"""
+        if download_label not in self.widgets:
+            await self.click(build_label)
+        return await self.download(download_label)
+
+
+# ---------- 시나리오 ----------
+
+class Recorder:
+    """동작별 소요 시간/오류/크기 수집"""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.sizes = defaultdict(list)
+        self.first_error = {}
+
+    async def timed(self, name, coro):
+        started = time.perf_counter()
+        try:
+            result = await coro
+        except Exception as e:
+            self.errors[name] += 1
+            self.first_error.setdefault(name, str(e)[:200])
+            return False, None
+        self.latencies[name].append(time.perf_counter() - started)
+        return True, result
+
+
+async def user_flow(base_url, recorder, flows, think, rng):
+    session = Session(base_url)
+    try:
+        ok, _ = await recorder.timed('page_load', session.connect())
+        if not ok:
+            return
+        for _ in range(flows):
+            await asyncio.sleep(rng.uniform(0, think))
+            ok, _ = await recorder.timed('change_vessel', session.select('선박', rng.choice(session.options('선박'))))
+            await asyncio.sleep(rng.uniform(0, think))
+            ok, _ = await recorder.timed('query', session.click('조회'))
+            if not ok or '엑셀 출력' not in session.widgets:
+                continue
+
+            # 조회 직후 메인 화면(객실/좌석)이 열려 있음 → 모달 데이터는 테이블 컴포넌트 인자에 포함
+            recorder.sizes['modal_payload_kb'].append(session.table_bytes / 1024)
+            main_page = session.page
+            for page in RESULT_PAGES:
+                await asyncio.sleep(rng.uniform(0, think))
+                await recorder.timed('switch_page', session.goto(page))
+                if '발권 상태' in session.widgets:
+                    # 승객 분석 화면의 필터 (분석 fragment만 재실행)
+                    await asyncio.sleep(rng.uniform(0, think))
+                    await recorder.timed('analysis_filter', session.select('발권 상태', rng.choice(session.options('발권 상태')[1:])))
+            session.page = main_page
+            await recorder.timed('switch_page', session.rerun())
+
+            # 엑셀은 누를 때 생성 → 받기
+            await asyncio.sleep(rng.uniform(0, think))
+            ok, size = await recorder.timed('download_excel', session.build_and_download('엑셀 출력', '엑셀 받기'))
+            if ok:
+                recorder.sizes['excel_kb'].append(size / 1024)
+    finally:
+        session.close()
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(q / 100 * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+async def run_level(base_url, pid, sessions, flows, think, seed):
+    recorder = Recorder()
+    monitor = ProcessMonitor(pid) if pid else None
+    monitor_task = asyncio.ensure_future(monitor.run()) if monitor else None
+    started = time.perf_counter()
+    await asyncio.gather(*[
+        user_flow(base_url, recorder, flows, think, random.Random(seed + i))
+        for i in range(sessions)
+    ])
+    elapsed = time.perf_counter() - started
+    if monitor_task:
+        monitor_task.cancel()
+    return recorder, monitor, elapsed
+
+
+def report_level(sessions, recorder, monitor, elapsed):
+    done = sum(len(v) for v in recorder.latencies.values())
+    throughput = done / elapsed if elapsed else 0.0
+    print(f"\n== 동시 세션 {sessions} ==  소요 {elapsed:.1f}s, 처리량 {throughput:.2f} 동작/s, "
+          + (monitor.summary() if monitor else "서버 CPU/RSS 미측정 (--pid 필요)"))
+    print(f"  {'동작':16s} {'n':>5s} {'p50 ms':>9s} {'p95 ms':>9s} {'p99 ms':>9s} {'오류':>5s}")
+    names = ['page_load', 'change_vessel', 'query', 'switch_page', 'analysis_filter', 'download_excel']
+    for name in names + sorted(set(recorder.latencies) - set(names)):
+        values = recorder.latencies.get(name, [])
+        if not values and not recorder.errors.get(name):
+            continue
+        cells = [f"{percentile(values, q) * 1000:9.0f}" if values else f"{'-':>9s}" for q in (50, 95, 99)]
+        print(f"  {name:16s} {len(values):5d} {' '.join(cells)} {recorder.errors.get(name, 0):5d}")
+    for name, sizes in recorder.sizes.items():
+        print(f"  {name}: 중앙값 {percentile(sizes, 50):.0f} / 최대 {max(sizes):.0f}")
+    for name, message in recorder.first_error.items():
+        print(f"  [오류] {name}: {message}")
+    p95 = percentile(recorder.latencies['query'], 95) if recorder.latencies.get('query') else None
+    cpu = monitor.cpu_mean if monitor else None
+    return throughput, p95, sum(recorder.errors.values()), cpu
+
+
+def find_saturation(results):
+    """포화 단계와 이유
+
+    처리량이 직전 최고치보다 10% 이상 늘지 않거나, 오류가 나기 시작하거나,
+    서버 CPU 평균이 코어 하나의 90%를 넘은 첫 단계 (스크립트 실행은 GIL에 묶여 사실상 1코어).
+    """
+    best = 0.0
+    for sessions, throughput, _, errors, cpu in results:
+        if errors:
+            return sessions, "오류 발생"
+        if cpu is not None and cpu >= SATURATION_CPU:
+            return sessions, f"서버 CPU 평균 {cpu:.0f}%"
+        if best and throughput < best * 1.1:
+            return sessions, "처리량이 더 늘지 않음"
+        best = max(best, throughput)
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동시 접속 부하 테스트")
+    parser.add_argument('--db', default='local_data/neohelios_local.db', help="로컬 대역 DB (서버를 직접 띄울 때)")
+    parser.add_argument('--port', type=int, default=8599)
+    parser.add_argument('--url', help="이미 떠 있는 서버 주소 (지정하면 서버를 띄우지 않음)")
+    parser.add_argument('--pid', type=int, help="--url 서버의 프로세스 id (RSS/CPU 측정용)")
+    parser.add_argument('--levels', default='1,2,4,8', help="동시 세션 수 단계 (쉼표 구분)")
+    parser.add_argument('--flows', type=int, default=2, help="세션당 반복 횟수")
+    parser.add_argument('--think', type=float, default=0.5, help="동작 사이 최대 대기 시간(초)")
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    levels = [int(x) for x in args.levels.split(',') if x.strip()]
+    proc = None
+    if args.url:
+        base_url, pid = args.url.rstrip('/'), args.pid
+    else:
+        if not os.path.exists(args.db):
+            parser.error(f"로컬 DB 파일이 없습니다: {args.db} (python -m tools.seed_local_db로 생성)")
+        proc, base_url = start_server(args.db, args.port)
+        pid = proc.pid
+        print(f"streamlit 서버 시작 (pid {pid}, {base_url})")
+
+    results = []
+    try:
+        for sessions in levels:
+            recorder, monitor, elapsed = asyncio.run(
+                run_level(base_url, pid, sessions, args.flows, args.think, args.seed))
+            results.append((sessions, *report_level(sessions, recorder, monitor, elapsed)))
+    finally:
+        if proc:
+            proc.terminate()
+            proc.wait(timeout=10)
+
+    print(f"\n{'세션':>5s} {'처리량/s':>9s} {'조회 p95 ms':>12s} {'CPU %':>6s} {'오류':>5s}")
+    for sessions, throughput, p95, errors, cpu in results:
+        p95_text = f"{p95 * 1000:12.0f}" if p95 is not None else f"{'-':>12s}"
+        cpu_text = f"{cpu:6.0f}" if cpu is not None else f"{'-':>6s}"
+        print(f"{sessions:5d} {throughput:9.2f} {p95_text} {cpu_text} {errors:5d}")
+    saturation = find_saturation(results)
+    if saturation:
+        print(f"포화 지점: 동시 세션 {saturation[0]} ({saturation[1]})")
+    else:
+        print("포화 지점: 측정 범위 안에서 도달하지 않음 (--levels를 늘려서 재측정)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""
+느린 쿼리 로그 요약 (dashboard.query_log가 남긴 JSONL, 회전된 이전 파일 포함)
+
+    python -m tools.query_log_report
+    python -m tools.query_log_report local_data/query_log.jsonl --since 2026-10-19T08:30 --until 2026-10-19T09:30
+    python -m tools.query_log_report --route TSL --top 30
+
+1) 지문(같은 모양의 SQL)별 건수, p50/p95/p99/최대, 합계, 평균 행 수/MB, 오류 (합계 시간순)
+2) 가장 느린 SQL 실행 N건 (항로/스케줄 수/파라미터 포함)
+3) 가장 느린 조회 N건 (조회 1건에 속한 SQL 소요 시간 합계)
+"""
+
+import argparse
+from collections import defaultdict
+
+from dashboard.query_log import DEFAULT_PATH, read_entries
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(q / 100 * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+def load(path, since=None, until=None, route=None, name=None):
+    entries = []
+    for entry in read_entries(path):
+        ts = entry.get('ts', '')
+        if (since and ts < since) or (until and ts >= until):
+            continue
+        if (route and entry.get('route') != route) or (name and entry.get('name') != name):
+            continue
+        entries.append(entry)
+    return entries
+
+
+def report_fingerprints(entries, top):
+    groups = defaultdict(list)
+    sql = {}
+    for entry in entries:
+        groups[entry['fingerprint']].append(entry)
+        if 'sql' in entry:
+            sql[entry['fingerprint']] = entry['sql']
+
+    rows = []
+    for fp, items in groups.items():
+        durations = [e['duration_ms'] for e in items]
+        ok = [e for e in items if e.get('rows') is not None]
+        rows.append((sum(durations), fp, items[0]['name'], len(items), durations,
+                     sum(e['rows'] for e in ok) / len(ok) if ok else 0,
+                     sum(e['bytes'] for e in ok) / len(ok) / 1e6 if ok else 0,
+                     len(items) - len(ok)))
+    rows.sort(reverse=True)
+
+    print(f"\n== 지문별 ({len(groups)}개, 합계 시간순) ==")
+    print(f"{'fingerprint':12s} {'query':20s} {'n':>6s} {'p50 ms':>9s} {'p95 ms':>9s} {'p99 ms':>9s} "
+          f"{'max ms':>9s} {'합계 s':>8s} {'평균 행':>9s} {'평균 MB':>8s} {'오류':>5s}")
+    for total, fp, name, n, durations, rows_avg, mb_avg, errors in rows[:top]:
+        cells = ' '.join(f"{percentile(durations, q):9.1f}" for q in (50, 95, 99))
+        print(f"{fp:12s} {name:20s} {n:6d} {cells} {max(durations):9.1f} {total / 1000:8.1f} "
+              f"{rows_avg:9.0f} {mb_avg:8.2f} {errors:5d}")
+    return sql
+
+
+def report_slowest(entries, top):
+    print(f"\n== 가장 느린 SQL 실행 {top}건 ==")
+    for e in sorted(entries, key=lambda e: e['duration_ms'], reverse=True)[:top]:
+        detail = e.get('error') or f"행 {e['rows']} · {e['bytes'] / 1e6:.2f}MB"
+        print(f"{e['ts']} {e['duration_ms']:9.1f}ms {e['name']:20s} {e['fingerprint']} "
+              f"항로={e.get('route') or '-'} 스케줄={e.get('schedules') or '-'} {detail}")
+        if e.get('params'):
+            print(f"{'':24s} params={e['params']}")
+
+
+def report_requests(entries, top):
+    requests = defaultdict(list)
+    for entry in entries:
+        if entry.get('request'):
+            requests[entry['request']].append(entry)
+    if not requests:
+        return
+    print(f"\n== 가장 느린 조회 {top}건 (조회에 속한 SQL 소요 시간 합계) ==")
+    ranked = sorted(requests.values(), key=lambda items: sum(e['duration_ms'] for e in items), reverse=True)
+    for items in ranked[:top]:
+        first = items[0]
+        total = sum(e['duration_ms'] for e in items)
+        slowest = max(items, key=lambda e: e['duration_ms'])
+        schedules = max((e.get('schedules') or 0 for e in items), default=0)
+        print(f"{first['ts']} {total:9.1f}ms {first.get('route') or '-':5s} {first.get('period', '')} "
+              f"SQL {len(items)}개 · 스케줄 {schedules}개 · 가장 느린 {slowest['name']} {slowest['duration_ms']:.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="느린 쿼리 로그 요약")
+    parser.add_argument('path', nargs='?', default=DEFAULT_PATH)
+    parser.add_argument('--since', help="이 시각 이후 (ISO, 예: 2026-10-19T08:30)")
+    parser.add_argument('--until', help="이 시각 이전 (ISO)")
+    parser.add_argument('--route', help="항로 코드 (예: TSL)")
+    parser.add_argument('--name', help="쿼리 이름 (예: room_details)")
+    parser.add_argument('--top', type=int, default=20)
+    parser.add_argument('--sql', action='store_true', help="지문별 SQL(목록 접은 형태) 출력")
+    args = parser.parse_args()
+
+    entries = load(args.path, args.since, args.until, args.route, args.name)
+    if not entries:
+        parser.error(f"{args.path}에 조건에 맞는 항목이 없습니다.")
+    print(f"{entries[0]['ts']} ~ {entries[-1]['ts']}: SQL 실행 {len(entries)}건")
+
+    sql = report_fingerprints(entries, args.top)
+    report_slowest(entries, args.top)
+    report_requests(entries, args.top)
+    if args.sql:
+        print("\n== 지문별 SQL ==")
+        for fp, text in sql.items():
+            print(f"{fp}: {text}\n")
+
+
+if __name__ == '__main__':
+    main()
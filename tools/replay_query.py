@@ -0,0 +1,70 @@
+"""
+기록된 조회 재생 (운영 DB 없이 같은 입력으로 재현/프로파일링)
+
+    # 1) 기록: 앱 실행 시 NEOHELIOS_DB_CAPTURE=captures/slow_0915 지정 후 문제 조회 수행
+    # 2) 재생
+    python -m tools.replay_query captures/slow_0915 --latency --repeat 3
+    python -m tools.replay_query captures/slow_0915 --profile 30
+
+각 조회의 소요 시간과 결과 요약 해시를 출력 (파이프라인 수정 전후 결과 비교용).
+"""
+
+import argparse
+import cProfile
+import hashlib
+import pstats
+import statistics
+import time
+
+from dashboard.pipeline import QueryFilters, NoScheduleError, run_query
+from dashboard.replay import ReplayBackend
+
+
+def result_digest(result):
+    """객실/승객 테이블 내용 해시 (같은 입력이면 같은 값)"""
+    h = hashlib.sha1()
+    for key in ('final_df', 'final_df_passengers'):
+        h.update(result[key].to_csv(index=False).encode('utf-8'))
+    return h.hexdigest()[:12]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기록된 조회 재생")
+    parser.add_argument('capture_dir')
+    parser.add_argument('--latency', action='store_true', help="기록된 DB 소요 시간만큼 대기")
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--profile', type=int, metavar='N', default=0, help="cProfile 상위 N개 함수 출력")
+    args = parser.parse_args()
+
+    requests = ReplayBackend(args.capture_dir).requests
+    if not requests:
+        parser.error("기록에 검색 조건(request)이 없습니다.")
+
+    profiler = cProfile.Profile() if args.profile else None
+    for filters_dict in requests:
+        filters = QueryFilters(**filters_dict)
+        timings = []
+        digest = '-'
+        for _ in range(args.repeat):
+            # 재생 순서를 처음부터 다시 시작하도록 매번 새로 생성
+            backend = ReplayBackend(args.capture_dir, inject_latency=args.latency)
+            started = time.perf_counter()
+            if profiler:
+                profiler.enable()
+            try:
+                digest = result_digest(run_query(backend, filters))
+            except NoScheduleError as e:
+                digest = str(e)
+            finally:
+                if profiler:
+                    profiler.disable()
+            timings.append(time.perf_counter() - started)
+        print(f"{filters.route} {filters.origin}->{filters.destination} {filters.start_date}~{filters.end_date}: "
+              f"median {statistics.median(timings) * 1000:.1f}ms (n={len(timings)}) digest={digest}")
+
+    if profiler:
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(args.profile)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""
+로컬 대역 DB 생성
+
+    python -m tools.seed_local_db --days 365 local_data/neohelios_local.db
+
+생성 후 앱을 로컬 대역으로 실행:
+
+    NEOHELIOS_DB_BACKEND=local NEOHELIOS_LOCAL_DB=local_data/neohelios_local.db streamlit run 독립_대시보드_앱.py
+"""
+
+import argparse
+import sqlite3
+import time
+from datetime import date
+
+from dashboard.local_db import build_local_db
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 대역 SQLite DB 생성 (스키마 복제 + 합성 데이터)")
+    parser.add_argument('path', nargs='?', default='local_data/neohelios_local.db')
+    parser.add_argument('--days', type=int, default=120, help="스케줄 생성 일수")
+    parser.add_argument('--start', type=date.fromisoformat, default=None, help="시작일 (기본: 오늘 - days/4)")
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    build_local_db(args.path, start_date=args.start, days=args.days, seed_value=args.seed)
+    elapsed = time.perf_counter() - started
+
+    conn = sqlite3.connect(args.path)
+    for table in ('coastal_schedules', 'rooms', 'tickets', 'passengers'):
+        count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        print(f"{table:20s} {count:>10,}")
+    conn.close()
+    print(f"생성 완료: {args.path} ({elapsed:.1f}s)")
+
+
+if __name__ == '__main__':
+    main()